@@ -0,0 +1,5 @@
+from .suite import Benchmark, build_benchmarks
+from .runner import Comparison, compare_results, load_results, run_benchmarks, save_results
+
+__all__ = ['Benchmark', 'build_benchmarks', 'Comparison', 'compare_results', 'load_results',
+           'run_benchmarks', 'save_results']
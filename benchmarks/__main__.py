@@ -0,0 +1,61 @@
+import argparse
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.runner import (DEFAULT_MIN_TIME, DEFAULT_REPEAT, DEFAULT_THRESHOLD, compare_results,
+                               format_seconds, load_results, run_benchmarks, save_results)
+
+
+def run(args) -> int:
+    results = run_benchmarks(args.filter, args.min_time, args.repeat)
+    for name, result in results['results'].items():
+        print(f"{name:45} {format_seconds(result['seconds']):>12}")
+    if args.output:
+        save_results(results, args.output)
+    return 0
+
+
+def compare(args) -> int:
+    baseline = load_results(args.baseline)
+    current = load_results(args.current) if args.current else run_benchmarks(args.filter, args.min_time, args.repeat)
+    regressions = 0
+    for comparison in compare_results(baseline, current):
+        if comparison.regressed(args.threshold):
+            status = "REGRESSION"
+            regressions += 1
+        elif comparison.improved(args.threshold):
+            status = "faster"
+        else:
+            status = ""
+        print(f"{comparison.name:45} {format_seconds(comparison.baseline):>12} {format_seconds(comparison.current):>12}"
+              f" {comparison.ratio:7.2f}x  {status}")
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the suite and optionally save a JSON baseline")
+    run_parser.add_argument("-o", "--output", help="write results to this JSON file")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare results against a JSON baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current", nargs="?", help="saved results; runs the suite when omitted")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="allowed slowdown as a fraction, e.g. 0.1 for 10%%")
+    compare_parser.set_defaults(handler=compare)
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("-k", "--filter", help="only run benchmarks matching this glob, e.g. 'finance.*'")
+        sub.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+        sub.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
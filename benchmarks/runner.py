@@ -0,0 +1,104 @@
+import fnmatch
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .suite import Benchmark, build_benchmarks
+
+
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+    def regressed(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+    def improved(self, threshold: float) -> bool:
+        return self.ratio < 1 - threshold
+
+
+def _calls_per_round(func, min_time: float) -> int:
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        if time.perf_counter() - start >= min_time or calls >= 1 << 20:
+            return calls
+        calls *= 2
+
+
+def time_benchmark(benchmark: Benchmark, min_time: float = DEFAULT_MIN_TIME,
+                   repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    func = benchmark.func
+    calls = _calls_per_round(func, min_time)
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        rounds.append((time.perf_counter() - start) / calls)
+    return {
+        'seconds': min(rounds),
+        'median': statistics.median(rounds),
+        'calls': calls,
+        'group': benchmark.group,
+        'size': benchmark.size,
+        'kind': benchmark.kind,
+    }
+
+
+def run_benchmarks(pattern: Optional[str] = None, min_time: float = DEFAULT_MIN_TIME,
+                   repeat: int = DEFAULT_REPEAT, benchmarks: Optional[List[Benchmark]] = None) -> dict:
+    results = {}
+    for benchmark in benchmarks if benchmarks is not None else build_benchmarks():
+        if pattern and not fnmatch.fnmatch(benchmark.name, pattern):
+            continue
+        results[benchmark.name] = time_benchmark(benchmark, min_time, repeat)
+    return {
+        'metadata': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def save_results(results: dict, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline: dict, current: dict) -> List[Comparison]:
+    comparisons = []
+    for name, result in current['results'].items():
+        if name in baseline['results']:
+            comparisons.append(Comparison(name, baseline['results'][name]['seconds'], result['seconds']))
+    return comparisons
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
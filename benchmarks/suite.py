@@ -0,0 +1,230 @@
+import math
+import random
+from dataclasses import dataclass
+from typing import Callable, List
+
+import numpy as np
+
+from models.calculator_model import CalculatorModel, CalculatorMode
+from operations import (ArithmeticOperations, ScientificOperations, FinanceOperations, ProgrammingOperations,
+                        StatisticsOperations, compile_expression, evaluate_batch)
+from operations.statistics import RunningStatistics
+from operations.factorization import FACTOR_CACHE
+from operations.sieve import count_primes_in_range
+from operations.plotting import decimate
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    size: str
+    kind: str
+    func: Callable[[], object]
+
+
+def _model_calculate(mode: CalculatorMode, operation: str) -> Callable[[], object]:
+    model = CalculatorModel()
+    model.set_mode(mode)
+
+    def run():
+        model.first_operand = 12.5
+        model.pending_operation = operation
+        model.display_value = "3.5"
+        return model.calculate()
+    return run
+
+
+def _uncached_evaluate(expressions: List[str]) -> Callable[[], object]:
+    def run():
+        compile_expression.cache_clear()
+        for expression in expressions:
+            ArithmeticOperations.evaluate(expression)
+    return run
+
+
+def _python_eval(expression: str) -> Callable[[], object]:
+    # The eval() call ArithmeticOperations.evaluate used to make, kept as
+    # the reference point for the compiled engine.
+    def run():
+        allowed_names = {'sqrt': math.sqrt, 'sin': math.sin, 'cos': math.cos, 'exp': math.exp,
+                         'pi': math.pi, 'e': math.e, 'abs': abs}
+        return float(eval(expression, {"__builtins__": {}}, allowed_names))
+    return run
+
+
+def _uncached_factorize(n: int) -> Callable[[], object]:
+    def run():
+        FACTOR_CACHE.clear()
+        return ScientificOperations.prime_factorization(n)
+    return run
+
+
+def _update_each(values: List[float]) -> RunningStatistics:
+    result = RunningStatistics()
+    for value in values:
+        result.update(value)
+    return result
+
+
+def build_benchmarks() -> List[Benchmark]:
+    arith = ArithmeticOperations
+    sci = ScientificOperations
+    fin = FinanceOperations
+    prog = ProgrammingOperations
+    stats = StatisticsOperations
+
+    rng = random.Random(1234)
+    samples = [rng.gauss(0, 1) for _ in range(10000)]
+    cash_flows_small = [-1000.0] + [rng.uniform(50, 400) for _ in range(10)]
+    cash_flows_large = [-20000.0] + [rng.uniform(150, 450) for _ in range(360)]
+    expressions = [f"sqrt({i}) * sin({i % 360}) + {i}^2" for i in range(200)]
+    batch_small = {name: np.random.default_rng(1).random(1000) for name in ('x', 'y', 't')}
+    batch_large = {name: np.random.default_rng(2).random(1_000_000) for name in ('x', 'y', 't')}
+    formula = "sqrt(x^2 + y^2) * exp(-t)"
+    big_value = (1 << 4096) - 1
+    prime_candidates = np.random.default_rng(3).integers(1, 1 << 62, 10000)
+    lcm_values = list(range(1, 5001))
+    stream = sci.random_stream(5)
+    signal = batch_large['x'] + 1j * batch_large['y']
+    comb_n = np.random.default_rng(4).integers(0, 10 ** 6, 100000)
+    comb_r = comb_n // 3
+    gcd_moduli = [rng.getrandbits(256) | 1 for _ in range(256)]
+    solve_targets = np.random.default_rng(5).uniform(1, 100, 100000)
+    plot_x = np.linspace(0.0, 1.0, 2_000_000)
+    plot_y = np.sin(50 * plot_x) + np.random.default_rng(6).normal(0, 0.1, plot_x.size)
+    loan_principals = np.random.default_rng(7).uniform(50_000, 500_000, 100000)
+    loan_rates = np.random.default_rng(8).uniform(2, 8, 100000)
+    portfolio = np.concatenate([-np.random.default_rng(9).uniform(500, 2000, (20000, 1)),
+                                np.random.default_rng(10).uniform(-50, 250, (20000, 39))], axis=1)
+
+    return [
+        Benchmark("arithmetic.add", "arithmetic", "small", "scalar", lambda: arith.add(2.5, 3.5)),
+        Benchmark("arithmetic.divide", "arithmetic", "small", "scalar", lambda: arith.divide(7.0, 3.0)),
+        Benchmark("arithmetic.power", "arithmetic", "small", "scalar", lambda: arith.power(1.0001, 250)),
+        Benchmark("arithmetic.factorial.20", "arithmetic", "small", "scalar", lambda: arith.factorial(20)),
+        Benchmark("arithmetic.factorial.20000", "arithmetic", "large", "scalar", lambda: arith.factorial(20000)),
+
+        Benchmark("scientific.sin", "scientific", "small", "scalar", lambda: sci.sin(30.0)),
+        Benchmark("scientific.log", "scientific", "small", "scalar", lambda: sci.log(12345.0)),
+        Benchmark("scientific.gamma", "scientific", "small", "scalar", lambda: sci.gamma(4.5)),
+        Benchmark("scientific.sin_array.1m", "scientific", "large", "batch",
+                  lambda: sci.sin_array(batch_large['x'])),
+        Benchmark("scientific.gamma_array.1m", "scientific", "large", "batch",
+                  lambda: sci.gamma_array(batch_large['y'])),
+        Benchmark("scientific.combinations.small", "scientific", "small", "scalar", lambda: sci.combinations(40, 12)),
+        Benchmark("scientific.combinations.large", "scientific", "large", "scalar",
+                  lambda: sci.combinations(100000, 50000)),
+        Benchmark("scientific.complex_multiply_array.1m", "scientific", "large", "batch",
+                  lambda: sci.complex_multiply_array(signal, signal)),
+        Benchmark("scientific.complex_rect_array.1m", "scientific", "large", "batch",
+                  lambda: sci.complex_rect_array(batch_large['x'], batch_large['t'])),
+        Benchmark("scientific.random_stream.uniform.1m", "scientific", "large", "batch",
+                  lambda: stream.uniform(1_000_000)),
+        Benchmark("scientific.random_stream.normal.1m", "scientific", "large", "batch",
+                  lambda: stream.normal(1_000_000)),
+        Benchmark("scientific.comb_mod.large", "scientific", "large", "scalar",
+                  lambda: sci.comb_mod(10 ** 6, 5 * 10 ** 5, 1000000007)),
+        Benchmark("scientific.comb_mod_batch.100k", "scientific", "large", "batch",
+                  lambda: sci.comb_mod_batch(comb_n, comb_r, 1000000007)),
+        Benchmark("scientific.solve.brent", "scientific", "small", "scalar",
+                  lambda: sci.solve("cos(x) = x", bracket=(0, 1))),
+        Benchmark("scientific.solve.newton", "scientific", "small", "scalar",
+                  lambda: sci.solve("x^3 - 2*x - 5", guess=2)),
+        Benchmark("scientific.solve_batch.100k", "scientific", "large", "batch",
+                  lambda: sci.solve_batch("x^3 + x = a", 'x', 0, 5, {'a': solve_targets})),
+        Benchmark("scientific.integrate.gaussian", "scientific", "small", "scalar",
+                  lambda: sci.integrate("exp(-x^2)", 'x', -5, 5)),
+        Benchmark("scientific.integrate_batch.100k", "scientific", "large", "batch",
+                  lambda: sci.integrate_batch("exp(-a * x) * sin(x)", 'x', 0, 1, {'a': solve_targets})),
+        Benchmark("scientific.derivative_batch.1m", "scientific", "large", "batch",
+                  lambda: sci.derivative_batch("sin(x) * exp(x)", 'x', batch_large['x'])),
+        Benchmark("scientific.value_and_gradient", "scientific", "small", "scalar",
+                  lambda: sci.value_and_gradient("x^2 * y + sin(x) / y", x=1.5, y=2.0)),
+        Benchmark("scientific.value_and_gradient.1m", "scientific", "large", "batch",
+                  lambda: sci.value_and_gradient(formula, **batch_large)),
+        Benchmark("scientific.tabulate.adaptive", "scientific", "small", "batch",
+                  lambda: sci.tabulate("sin(1/x)", 'x', 0.01, 1, 512, adaptive=True)),
+        Benchmark("scientific.decimate.2m", "scientific", "large", "batch",
+                  lambda: decimate(plot_x, plot_y, 0.0, 1.0, 1000)),
+        Benchmark("scientific.is_prime.small", "scientific", "small", "scalar", lambda: sci.is_prime(7919)),
+        Benchmark("scientific.is_prime.large", "scientific", "large", "scalar", lambda: sci.is_prime(999999000001)),
+        Benchmark("scientific.is_prime.64bit", "scientific", "large", "scalar",
+                  lambda: sci.is_prime(18446744073709551557)),
+        Benchmark("scientific.is_prime_batch.10k", "scientific", "large", "batch",
+                  lambda: sci.is_prime_batch(prime_candidates)),
+        Benchmark("scientific.prime_factorization.small", "scientific", "small", "scalar",
+                  _uncached_factorize(360360)),
+        Benchmark("scientific.prime_factorization.large", "scientific", "large", "scalar",
+                  _uncached_factorize(600851475143)),
+        Benchmark("scientific.factorize.semiprime", "scientific", "large", "scalar",
+                  _uncached_factorize(9999999967 * 9999999943)),
+        Benchmark("scientific.factorize.cached", "scientific", "small", "scalar",
+                  lambda: sci.factorize(600851475143)),
+        Benchmark("scientific.prime_count.1e9", "scientific", "large", "scalar", lambda: sci.prime_count(10 ** 9)),
+        Benchmark("scientific.count_primes.1e7_at_1e12", "scientific", "large", "batch",
+                  lambda: count_primes_in_range(10 ** 12, 10 ** 12 + 10 ** 7, workers=1)),
+        Benchmark("scientific.totient.large", "scientific", "large", "scalar",
+                  lambda: sci.totient(9999999967 * 9999999943)),
+        Benchmark("scientific.totient_range.1m", "scientific", "large", "batch",
+                  lambda: sci.totient_range(1, 1_000_001)),
+        Benchmark("scientific.gcd", "scientific", "small", "scalar", lambda: sci.gcd(1071, 462)),
+        Benchmark("scientific.lcm.large", "scientific", "large", "scalar", lambda: sci.lcm(big_value, big_value - 2)),
+
+        Benchmark("scientific.lcm_many.large", "scientific", "large", "scalar", lambda: sci.lcm_many(lcm_values)),
+        Benchmark("scientific.batch_gcd.256", "scientific", "large", "batch", lambda: sci.batch_gcd(gcd_moduli)),
+
+        Benchmark("finance.compound_interest", "finance", "small", "scalar",
+                  lambda: fin.compound_interest(1000, 5, 10)),
+        Benchmark("finance.payment", "finance", "small", "scalar", lambda: fin.payment(250000, 4.5, 360)),
+        Benchmark("finance.remaining_balance", "finance", "small", "scalar",
+                  lambda: fin.remaining_balance(250000, 4.5, 360, 120)),
+        Benchmark("finance.amortization_schedule.360", "finance", "small", "batch",
+                  lambda: fin.amortization_schedule(250000, 4.5, 360)),
+        Benchmark("finance.amortization_schedule.extra", "finance", "small", "batch",
+                  lambda: fin.amortization_schedule(250000, 4.5, 360, 200, {61: 6.5})),
+        Benchmark("finance.amortization_batch.100k", "finance", "large", "batch",
+                  lambda: sum(row.interest for row in fin.amortization_batch(loan_principals, loan_rates, 360))),
+        Benchmark("finance.net_present_value.small", "finance", "small", "scalar",
+                  lambda: fin.net_present_value(8, cash_flows_small)),
+        Benchmark("finance.net_present_value.large", "finance", "large", "scalar",
+                  lambda: fin.net_present_value(8, cash_flows_large)),
+        Benchmark("finance.internal_rate_of_return.small", "finance", "small", "scalar",
+                  lambda: fin.internal_rate_of_return(cash_flows_small)),
+        Benchmark("finance.internal_rate_of_return.large", "finance", "large", "scalar",
+                  lambda: fin.internal_rate_of_return(cash_flows_large, 0.01)),
+        Benchmark("finance.net_present_value_batch.20k", "finance", "large", "batch",
+                  lambda: fin.net_present_value_batch(8, portfolio)),
+        Benchmark("finance.net_present_value_grid.20k", "finance", "large", "batch",
+                  lambda: fin.net_present_value_grid(np.arange(0, 20, 0.5), portfolio)),
+        Benchmark("finance.internal_rate_of_return_batch.20k", "finance", "large", "batch",
+                  lambda: fin.internal_rate_of_return_batch(portfolio)),
+
+        Benchmark("programming.from_decimal.small", "programming", "small", "scalar",
+                  lambda: prog.from_decimal(48879, 16)),
+        Benchmark("programming.from_decimal.large", "programming", "large", "scalar",
+                  lambda: prog.from_decimal(big_value, 2)),
+        Benchmark("programming.to_binary", "programming", "small", "scalar", lambda: prog.to_binary("255")),
+        Benchmark("programming.rotate_left", "programming", "small", "scalar", lambda: prog.rotate_left(29, 3, 8)),
+        Benchmark("programming.hex_to_rgb", "programming", "small", "scalar", lambda: prog.hex_to_rgb("#1A2B3C")),
+
+        Benchmark("statistics.update.10k", "statistics", "small", "scalar", lambda: _update_each(samples)),
+        Benchmark("statistics.describe.1m", "statistics", "large", "batch",
+                  lambda: stats.describe(batch_large['x'])),
+        Benchmark("statistics.mean.1m", "statistics", "large", "batch", lambda: stats.mean(batch_large['x'])),
+
+        Benchmark("model.calculate.basic", "model", "small", "scalar",
+                  _model_calculate(CalculatorMode.BASIC, '*')),
+        Benchmark("model.calculate.scientific", "model", "small", "scalar",
+                  _model_calculate(CalculatorMode.SCIENTIFIC, '^')),
+
+        Benchmark("evaluate.simple", "evaluate", "small", "scalar", lambda: arith.evaluate("2+3*4")),
+        Benchmark("evaluate.python_eval", "evaluate", "small", "scalar", _python_eval("2+3*4")),
+        Benchmark("evaluate.cached", "evaluate", "small", "scalar",
+                  lambda: arith.evaluate("sqrt(3^2 + 4^2) * exp(-1) + sin(pi/4)")),
+        Benchmark("evaluate.variables", "evaluate", "small", "scalar",
+                  lambda: arith.evaluate(formula, x=3.0, y=4.0, t=0.5)),
+        Benchmark("evaluate.uncached.200", "evaluate", "large", "scalar", _uncached_evaluate(expressions)),
+        Benchmark("evaluate_batch.1k", "evaluate", "small", "batch", lambda: evaluate_batch(formula, **batch_small)),
+        Benchmark("evaluate_batch.1m", "evaluate", "large", "batch", lambda: evaluate_batch(formula, **batch_large)),
+    ]
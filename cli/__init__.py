@@ -0,0 +1,4 @@
+from .batch import evaluate_line, evaluate_lines, run_batch
+from .server import EvaluationServer, LatencyTracker
+
+__all__ = ['evaluate_line', 'evaluate_lines', 'run_batch', 'EvaluationServer', 'LatencyTracker']
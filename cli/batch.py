@@ -0,0 +1,90 @@
+import argparse
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from operations import compile_expression
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def evaluate_line(line: str) -> str:
+    expression = line.strip()
+    if not expression:
+        return ""
+    try:
+        compiled = compile_expression(expression)
+        if compiled.variables:
+            return f"error: undefined variable {compiled.variables[0]}"
+        result = compiled.function()
+        return str(result if isinstance(result, complex) else float(result))
+    except Exception as exc:
+        return f"error: {exc}"
+
+
+def _evaluate_chunk(lines: List[str]) -> List[str]:
+    return [evaluate_line(line) for line in lines]
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(lines)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def evaluate_lines(lines: Iterable[str], workers: int = 1,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    if workers <= 1:
+        for chunk in _chunks(lines, chunk_size):
+            yield from _evaluate_chunk(chunk)
+        return
+
+    # Only a bounded number of chunks is in flight, so memory stays flat no
+    # matter how long the input is and results come back in input order.
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(pool.submit(_evaluate_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def run_batch(source: TextIO, destination: TextIO, workers: int = 1,
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    count = 0
+    for result in evaluate_lines(source, workers, chunk_size):
+        destination.write(result + "\n")
+        count += 1
+    destination.flush()
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="calculator batch",
+                                     description="Evaluate one expression per line from a file or stdin.")
+    parser.add_argument("input", nargs="?", default="-", help="input file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("-c", "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="lines sent to a worker at a time")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    destination = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        run_batch(source, destination, max(1, args.workers), max(1, args.chunk_size))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if destination is not sys.stdout:
+            destination.close()
+    return 0
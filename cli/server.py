@@ -0,0 +1,317 @@
+import argparse
+import asyncio
+import cmath
+import json
+import math
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from operations import evaluate_batch
+from operations.sandbox import DEFAULT_TIMEOUT, SandboxExecutor
+
+
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_DELAY = 0.002
+DEFAULT_MAX_PENDING = 1024
+DEFAULT_VECTOR_THRESHOLD = 16
+DEFAULT_WORKERS = 2
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 10000):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        result = {'count': self.count}
+        for p in (50, 90, 99):
+            value = self.percentile(p)
+            result[f'p{p}_ms'] = value * 1000 if value is not None else None
+        return result
+
+
+class _Job:
+    __slots__ = ('expression', 'variables', 'future', 'started')
+
+    def __init__(self, expression: str, variables: dict, future: asyncio.Future):
+        self.expression = expression
+        self.variables = variables
+        self.future = future
+        self.started = time.perf_counter()
+
+
+def _response(value) -> dict:
+    # JSON has no complex numbers; they are sent as [real, imag]. Undefined
+    # results are null; JSON cannot represent infinities at all.
+    if value is None or cmath.isnan(value):
+        return {'result': None}
+    if cmath.isinf(value):
+        return {'error': "result is infinite"}
+    if isinstance(value, complex):
+        return {'result': [value.real, value.imag]}
+    return {'result': value}
+
+
+def _error(exc: Exception) -> dict:
+    return {'error': str(exc) or type(exc).__name__}
+
+
+def _is_vectorizable(jobs: List[_Job]) -> bool:
+    names = set(jobs[0].variables)
+    for job in jobs:
+        if set(job.variables) != names:
+            return False
+        for value in job.variables.values():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+    return True
+
+
+def _evaluate_vector(jobs: List[_Job]) -> List[dict]:
+    arrays = {name: np.array([job.variables[name] for job in jobs], dtype=float)
+              for name in jobs[0].variables}
+    try:
+        values = evaluate_batch(jobs[0].expression, **arrays)
+    except Exception as exc:
+        return [_error(exc)] * len(jobs)
+    return [_response(v) for v in values.tolist()]
+
+
+def _sandbox_response(future) -> dict:
+    # CompiledExpr.evaluate ignores unused variables, as evaluate_batch does.
+    try:
+        return _response(future.result())
+    except Exception as exc:
+        return _error(exc)
+
+
+class EvaluationServer:
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH, max_delay: float = DEFAULT_MAX_DELAY,
+                 max_pending: int = DEFAULT_MAX_PENDING, vector_threshold: int = DEFAULT_VECTOR_THRESHOLD,
+                 workers: int = DEFAULT_WORKERS, timeout: Optional[float] = DEFAULT_TIMEOUT):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.vector_threshold = vector_threshold
+        self.workers = workers
+        self.timeout = timeout
+        self.latency = LatencyTracker()
+        self.batches = 0
+        self.vectorized_jobs = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._sandbox: Optional[SandboxExecutor] = None
+        self._server = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0):
+        self._start_batcher()
+        self._server = await asyncio.start_server(self.handle_connection, host, port)
+        return self._server
+
+    async def start_unix(self, path: str):
+        self._start_batcher()
+        self._server = await asyncio.start_unix_server(self.handle_connection, path)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+        # Closing the transports ends each handler's read loop, so the
+        # handlers finish on their own instead of being cancelled.
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        if self._sandbox is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._sandbox.shutdown)
+            self._sandbox = None
+
+    def _start_batcher(self):
+        # The bounded queue is the backpressure point: when it is full,
+        # submit() waits, connection readers stop reading and TCP flow
+        # control pushes back on clients.
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        # Scalar jobs go through the sandbox: its digit estimate rejects
+        # results like 9^9^9 up front and expensive ones run in worker
+        # processes under a timeout, never on the event loop.
+        self._sandbox = SandboxExecutor(self.workers, self.timeout)
+        self._batcher = asyncio.get_running_loop().create_task(self._batch_loop())
+
+    async def submit(self, expression: str, variables: Optional[dict] = None) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Job(expression, variables or {}, future))
+        return future
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            jobs = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(jobs) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    jobs.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            while len(jobs) < self.max_batch and not self._queue.empty():
+                jobs.append(self._queue.get_nowait())
+            try:
+                await self._run_batch(jobs)
+            except Exception as exc:
+                # Whatever one batch does, the loop must keep serving.
+                for job in jobs:
+                    if not job.future.done():
+                        job.future.set_result(_error(exc))
+
+    async def _run_batch(self, jobs: List[_Job]):
+        loop = asyncio.get_running_loop()
+        self.batches += 1
+        groups: Dict[str, List[_Job]] = defaultdict(list)
+        for job in jobs:
+            groups[job.expression].append(job)
+        for group in groups.values():
+            if len(group) >= self.vector_threshold and _is_vectorizable(group):
+                self.vectorized_jobs += len(group)
+                # Float arrays cannot grow without bound, but a large group
+                # still should not hold up the loop.
+                try:
+                    responses = await loop.run_in_executor(None, _evaluate_vector, group)
+                except Exception as exc:
+                    responses = [_error(exc)] * len(group)
+                for job, response in zip(group, responses):
+                    self._finish(job, response)
+                continue
+            for job in group:
+                try:
+                    future = asyncio.wrap_future(self._sandbox.submit(job.expression, **job.variables))
+                except Exception as exc:
+                    self._finish(job, _error(exc))
+                    continue
+                future.add_done_callback(lambda future, job=job: self._finish(job, _sandbox_response(future)))
+
+    def _finish(self, job: _Job, response: dict):
+        self.latency.record(time.perf_counter() - job.started)
+        if not job.future.done():
+            job.future.set_result(response)
+
+    def stats(self) -> dict:
+        stats = self.latency.summary()
+        stats['batches'] = self.batches
+        stats['vectorized'] = self.vectorized_jobs
+        stats['pending'] = self._queue.qsize() if self._queue is not None else 0
+        return stats
+
+    async def _handle_request(self, line: bytes) -> Tuple[Optional[object], asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as exc:
+            future = loop.create_future()
+            future.set_result({'error': f"invalid request: {exc}"})
+            return None, future
+        request_id = request.get('id')
+        if request.get('op') == 'stats':
+            future = loop.create_future()
+            future.set_result({'result': self.stats()})
+            return request_id, future
+        expression = request.get('expr')
+        variables = request.get('vars') or {}
+        if not isinstance(expression, str) or not isinstance(variables, dict):
+            future = loop.create_future()
+            future.set_result({'error': "request needs an 'expr' string and optional 'vars' object"})
+            return request_id, future
+        return request_id, await self.submit(expression, variables)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        responses: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending)
+
+        async def write_responses():
+            while True:
+                item = await responses.get()
+                if item is None:
+                    return
+                request_id, future = item
+                response = dict(await future)
+                if request_id is not None:
+                    response['id'] = request_id
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+        writer_task = asyncio.get_running_loop().create_task(write_responses())
+        self._connections[asyncio.current_task()] = writer
+        try:
+            while not writer_task.done():
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    await responses.put(await self._handle_request(line))
+            if not writer_task.done():
+                await responses.put(None)
+            await writer_task
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.pop(asyncio.current_task(), None)
+            writer_task.cancel()
+            writer.close()
+
+
+async def _serve(args):
+    server = EvaluationServer(args.max_batch, args.max_delay / 1000, args.max_pending,
+                              workers=args.workers, timeout=args.timeout)
+    if args.unix:
+        listener = await server.start_unix(args.unix)
+    else:
+        listener = await server.start_tcp(args.host, args.port)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="calculator serve",
+                                     description="Serve expression evaluation over JSON lines.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on a Unix socket path instead of TCP")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument("--max-delay", type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help="milliseconds to wait while filling a batch")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="sandbox processes for expensive expressions")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="seconds an expensive expression may run")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -1,7 +1,11 @@
 from typing import Optional
+from concurrent.futures import CancelledError, Future
 from PyQt5.QtCore import QObject, pyqtSignal
 from models.calculator_model import CalculatorModel, CalculatorMode
 from operations import ArithmeticOperations, ScientificOperations, FinanceOperations, ProgrammingOperations
+from operations.sandbox import SandboxExecutor
+from operations.expression import ExpressionError
+from operations.plotting import CurveSampler
 
 
 class CalculatorController(QObject):
@@ -9,6 +13,7 @@ class CalculatorController(QObject):
     mode_changed = pyqtSignal(str)
     memory_changed = pyqtSignal(float)
     error_occurred = pyqtSignal(str)
+    expression_finished = pyqtSignal(object)
 
     def __init__(self, model: Optional[CalculatorModel] = None):
         super().__init__()
@@ -17,6 +22,9 @@ class CalculatorController(QObject):
         self._scientific = ScientificOperations()
         self._finance = FinanceOperations()
         self._programming = ProgrammingOperations()
+        self._sandbox = None
+        self._pending_expression = None
+        self.expression_finished.connect(self._on_expression_finished)
 
     @property
     def model(self):
@@ -120,6 +128,45 @@ class CalculatorController(QObject):
             self.error_occurred.emit("Invalid expression")
         return result
 
+    def evaluate_expression_async(self, expression: str) -> Future:
+        if self._sandbox is None:
+            self._sandbox = SandboxExecutor()
+        if self._pending_expression is not None:
+            self._sandbox.cancel(self._pending_expression)
+        future = self._sandbox.submit(expression)
+        self._pending_expression = future
+        # The callback may run on a dispatcher thread; the signal hands the
+        # result back to the GUI thread through a queued connection.
+        future.add_done_callback(self.expression_finished.emit)
+        return future
+
+    def cancel_expression(self):
+        if self._sandbox is not None and self._pending_expression is not None:
+            self._sandbox.cancel(self._pending_expression)
+
+    def _on_expression_finished(self, future: Future):
+        if future is self._pending_expression:
+            self._pending_expression = None
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            self.error_occurred.emit(str(e) or "Evaluation failed")
+            return
+        if result is None:
+            self.error_occurred.emit("Invalid expression")
+            return
+        self._model.set_display_value(str(result))
+        self.display_changed.emit(self._model.get_display_value())
+
+    def shutdown(self):
+        if self._sandbox is not None:
+            self._sandbox.shutdown()
+            self._sandbox = None
+
     def finance_calculation(self, calc_type: str, params: dict) -> Optional[float]:
         result = None
         try:
@@ -189,6 +236,61 @@ class CalculatorController(QObject):
             
         return result
 
+    def amortization_schedule(self, principal: float, rate: float, years: float,
+                              extra: float = 0.0) -> Optional[dict]:
+        schedule = self._finance.amortization_schedule(principal, rate, int(years * 12), extra or None)
+        if schedule is not None:
+            self._model.set_display_value(str(float(schedule['interest'].sum())))
+            self.display_changed.emit(self._model.get_display_value())
+        else:
+            self.error_occurred.emit("Finance calculation error")
+        return schedule
+
+    def statistics_add_value(self) -> Optional[int]:
+        count = self._model.statistics_add()
+        if count is None:
+            self.error_occurred.emit("Invalid value")
+        return count
+
+    def statistics_load_file(self, path: str, column: Optional[int] = None,
+                             delimiter: Optional[str] = None) -> Optional[int]:
+        count = self._model.statistics_load_file(path, column, delimiter)
+        if count is None:
+            self.error_occurred.emit(f"Cannot read {path}")
+        return count
+
+    def statistics_clear(self):
+        self._model.statistics_clear()
+
+    def statistics_result(self, name: str) -> Optional[float]:
+        result = self._model.statistics_result(name)
+        if result is not None:
+            self.display_changed.emit(self._model.get_display_value())
+        else:
+            self.error_occurred.emit("Not enough data")
+        return result
+
+    def statistics_summary(self) -> dict:
+        return self._model.data.summary()
+
+    def solve_equation(self, equation: str, lower: Optional[float] = None, upper: Optional[float] = None,
+                       guess: Optional[float] = None) -> Optional[float]:
+        bracket = (lower, upper) if lower is not None and upper is not None else None
+        result = self._scientific.solve(equation, 'x', bracket, guess)
+        if result is not None:
+            self._model.set_display_value(str(result))
+            self.display_changed.emit(self._model.get_display_value())
+        else:
+            self.error_occurred.emit("No root found")
+        return result
+
+    def plot_expression(self, expression: str) -> Optional[CurveSampler]:
+        try:
+            return CurveSampler(expression)
+        except ExpressionError as e:
+            self.error_occurred.emit(str(e))
+            return None
+
     def programming_conversion(self, conversion_type: str, value: str) -> Optional[str]:
         result = None
         try:
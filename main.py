@@ -1,11 +1,19 @@
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from PyQt5.QtWidgets import QApplication
-from views.main_window import MainWindow
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from cli.batch import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from cli.server import main as serve_main
+        sys.exit(serve_main(sys.argv[2:]))
+
+    from PyQt5.QtWidgets import QApplication
+    from views.main_window import MainWindow
+
     app = QApplication(sys.argv)
     app.setApplicationName("Scientific Calculator")
     
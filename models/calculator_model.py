@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import Optional, Any
-from operations import ArithmeticOperations, ScientificOperations, FinanceOperations, ProgrammingOperations
+from operations import (ArithmeticOperations, ScientificOperations, FinanceOperations, ProgrammingOperations,
+                        StatisticsOperations, MemoizedOperations)
+from operations.statistics import RunningStatistics, statistics_from_file
 
 
 class CalculatorMode(Enum):
@@ -8,6 +10,8 @@ class CalculatorMode(Enum):
     SCIENTIFIC = "scientific"
     FINANCE = "finance"
     PROGRAMMING = "programming"
+    STATISTICS = "statistics"
+    GRAPHING = "graphing"
 
 
 class CalculatorModel:
@@ -25,6 +29,25 @@ class CalculatorModel:
         self.scientific = ScientificOperations()
         self.finance = FinanceOperations()
         self.programming = ProgrammingOperations()
+        self.statistics = StatisticsOperations()
+        self.data = RunningStatistics()
+
+    def enable_memoization(self, maxsize: int = 256, ttl: Optional[float] = None):
+        self.arithmetic = MemoizedOperations(ArithmeticOperations, maxsize, ttl)
+        self.scientific = MemoizedOperations(ScientificOperations, maxsize, ttl)
+        self.finance = MemoizedOperations(FinanceOperations, maxsize, ttl)
+
+    def disable_memoization(self):
+        self.arithmetic = ArithmeticOperations()
+        self.scientific = ScientificOperations()
+        self.finance = FinanceOperations()
+
+    def cache_stats(self) -> dict:
+        stats = {}
+        for group in (self.arithmetic, self.scientific, self.finance):
+            if isinstance(group, MemoizedOperations):
+                stats[group.operations_class.__name__] = group.cache_stats()
+        return stats
 
     def set_mode(self, mode: CalculatorMode):
         self.mode = mode
@@ -91,7 +114,7 @@ class CalculatorModel:
             return None
 
     def _execute_operation(self, a: float, b: float, operation: str) -> Optional[float]:
-        if self.mode == CalculatorMode.BASIC:
+        if self.mode in (CalculatorMode.BASIC, CalculatorMode.STATISTICS):
             return self._arithmetic_operation(a, b, operation)
         elif self.mode == CalculatorMode.SCIENTIFIC:
             return self._scientific_operation(a, b, operation)
@@ -140,7 +163,7 @@ class CalculatorModel:
         except ValueError:
             return None
 
-        if self.mode == CalculatorMode.BASIC or self.mode == CalculatorMode.SCIENTIFIC:
+        if self.mode in (CalculatorMode.BASIC, CalculatorMode.SCIENTIFIC, CalculatorMode.STATISTICS):
             result = self._apply_unary(value, operation)
             if result is not None:
                 self.display_value = str(result)
@@ -176,6 +199,45 @@ class CalculatorModel:
             return self.scientific.ceil(value)
         return None
 
+    def statistics_add(self) -> Optional[int]:
+        try:
+            value = float(self.display_value)
+        except ValueError:
+            return None
+        self.data.update(value)
+        self.should_clear_display = True
+        return self.data.count
+
+    def statistics_load_file(self, path: str, column: Optional[int] = None,
+                             delimiter: Optional[str] = None, workers: int = 1) -> Optional[int]:
+        try:
+            self.data.merge(statistics_from_file(path, column, delimiter, workers))
+        except OSError:
+            return None
+        return self.data.count
+
+    def statistics_clear(self):
+        self.data = RunningStatistics()
+
+    def statistics_result(self, name: str) -> Optional[float]:
+        results = {
+            'n': lambda: self.data.count,
+            'sum': lambda: self.data.total,
+            'mean': lambda: self.data.mean,
+            'std': lambda: self.data.std(),
+            'var': lambda: self.data.variance(),
+            'min': lambda: self.data.minimum,
+            'max': lambda: self.data.maximum,
+            'median': lambda: self.data.median(),
+            'q1': lambda: self.data.quantile(0.25),
+            'q3': lambda: self.data.quantile(0.75),
+        }
+        result = results.get(name, lambda: None)()
+        if result is not None:
+            self.display_value = str(result)
+            self.should_clear_display = True
+        return result
+
     def memory_add(self):
         try:
             self.memory += float(self.display_value)
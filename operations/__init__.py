@@ -2,10 +2,25 @@ from .arithmetic import ArithmeticOperations
 from .scientific import ScientificOperations
 from .finance import FinanceOperations
 from .programming import ProgrammingOperations
+from .statistics import StatisticsOperations
+from .expression import CompiledExpr, ExpressionError, compile_expression
+from .batch import evaluate_batch, evaluate_batch_masked
+from .memoize import CacheStats, MemoCache, MemoizedOperations
+from .random_stream import RandomStream
 
 __all__ = [
     'ArithmeticOperations',
     'ScientificOperations', 
     'FinanceOperations',
-    'ProgrammingOperations'
+    'ProgrammingOperations',
+    'StatisticsOperations',
+    'CompiledExpr',
+    'ExpressionError',
+    'compile_expression',
+    'evaluate_batch',
+    'evaluate_batch_masked',
+    'CacheStats',
+    'MemoCache',
+    'MemoizedOperations',
+    'RandomStream'
 ]
@@ -0,0 +1,129 @@
+from typing import Dict, Iterator, Mapping, NamedTuple, Optional, Union
+
+import numpy as np
+
+
+# Extra principal: the same amount every period, or amounts by period.
+ExtraPayments = Union[float, Mapping[int, float]]
+# New annual rates in percent, effective from the given (1-based) period.
+RateChanges = Mapping[int, float]
+
+COLUMNS = ('period', 'payment', 'interest', 'principal', 'balance')
+
+
+class ScheduleRow(NamedTuple):
+    period: int
+    payment: float
+    interest: float
+    principal: float
+    balance: float
+
+
+def _monthly_rate(rate: float) -> float:
+    return rate / 100 / 12
+
+
+def annuity_payment(balance: float, r: float, n_periods: int) -> float:
+    # Level payment that clears `balance` in n_periods at periodic rate r.
+    if r == 0:
+        return balance / n_periods
+    growth = (1 + r) ** n_periods
+    return balance * r * growth / (growth - 1)
+
+
+def _extra(extra_payments: Optional[ExtraPayments], period: int) -> float:
+    if not extra_payments:
+        return 0.0
+    if isinstance(extra_payments, Mapping):
+        return extra_payments.get(period, 0.0)
+    return extra_payments
+
+
+def amortization_rows(principal: float, rate: float, n_periods: int,
+                      extra_payments: Optional[ExtraPayments] = None,
+                      rate_changes: Optional[RateChanges] = None) -> Iterator[ScheduleRow]:
+    # One pass, O(1) work per row. The payment is computed once and again
+    # only when the rate resets, re-amortizing the balance over the
+    # remaining term. Extra payments shorten the loan rather than lower the
+    # payment.
+    if principal <= 0 or n_periods <= 0:
+        return
+    r = _monthly_rate(rate)
+    payment = annuity_payment(principal, r, n_periods)
+    balance = principal
+    for period in range(1, n_periods + 1):
+        if rate_changes and period in rate_changes:
+            r = _monthly_rate(rate_changes[period])
+            payment = annuity_payment(balance, r, n_periods - period + 1)
+        interest = balance * r
+        extra = _extra(extra_payments, period)
+        principal_paid = payment - interest + extra
+        if principal_paid >= balance or period == n_periods:
+            # The last row pays off whatever is left, absorbing rounding.
+            yield ScheduleRow(period, balance + interest, interest, balance, 0.0)
+            return
+        balance -= principal_paid
+        yield ScheduleRow(period, payment + extra, interest, principal_paid, balance)
+
+
+def amortization_schedule(principal: float, rate: float, n_periods: int,
+                          extra_payments: Optional[ExtraPayments] = None,
+                          rate_changes: Optional[RateChanges] = None) -> Dict[str, np.ndarray]:
+    # Columnar schedule. Without extra payments or resets the balance has a
+    # closed form, so every column is computed with whole-array operations.
+    if extra_payments or rate_changes or principal <= 0 or n_periods <= 0:
+        rows = list(amortization_rows(principal, rate, n_periods, extra_payments, rate_changes))
+        columns = np.array(rows, dtype=float).reshape(len(rows), len(COLUMNS)).T
+        schedule = dict(zip(COLUMNS, columns))
+        schedule['period'] = schedule['period'].astype(np.int64)
+        return schedule
+    r = _monthly_rate(rate)
+    payment = annuity_payment(principal, r, n_periods)
+    period = np.arange(1, n_periods + 1)
+    if r == 0:
+        balance = principal - payment * period
+    else:
+        growth = (1 + r) ** period.astype(float)
+        balance = principal * growth - payment * (growth - 1) / r
+    balance[-1] = 0.0
+    previous = np.concatenate([[principal], balance[:-1]])
+    interest = previous * r
+    principal_paid = previous - balance
+    return {
+        'period': period,
+        'payment': interest + principal_paid,
+        'interest': interest,
+        'principal': principal_paid,
+        'balance': balance,
+    }
+
+
+def _annuity_payments(balance: np.ndarray, r: np.ndarray, n_periods: int) -> np.ndarray:
+    with np.errstate(all='ignore'):
+        growth = (1 + r) ** n_periods
+        payment = balance * r * growth / (growth - 1)
+    return np.where(r == 0, balance / n_periods, payment)
+
+
+def amortization_batch(principals, rates, n_periods: int, extra_payments=0.0,
+                       rate_changes: Optional[Mapping[int, object]] = None) -> Iterator[ScheduleRow]:
+    # Many loans at once: one row per period, each field an array with one
+    # entry per loan, so memory stays O(loans) however long the term.
+    # Loans that are paid off early keep yielding zero rows.
+    principals, rates, extra = (np.asarray(a, dtype=float) for a in (principals, rates, extra_payments))
+    shape = np.broadcast_shapes(principals.shape, rates.shape, extra.shape)
+    balance = np.array(np.broadcast_to(principals, shape))
+    r = np.broadcast_to(_monthly_rate(rates), shape)
+    extra = np.broadcast_to(extra, shape)
+    payment = _annuity_payments(balance, r, n_periods)
+    for period in range(1, n_periods + 1):
+        if rate_changes and period in rate_changes:
+            r = np.broadcast_to(_monthly_rate(np.asarray(rate_changes[period], dtype=float)), balance.shape)
+            payment = _annuity_payments(balance, r, n_periods - period + 1)
+        interest = balance * r
+        principal_paid = payment - interest + extra
+        if period == n_periods:
+            principal_paid = balance
+        principal_paid = np.minimum(principal_paid, balance)
+        balance = balance - principal_paid
+        yield ScheduleRow(period, interest + principal_paid, interest, principal_paid, balance)
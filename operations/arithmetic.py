@@ -1,5 +1,8 @@
 import math
 from typing import Union, Optional
+from .expression import compile_expression
+from .factorial import factorial
+from .batch import evaluate_batch
 
 
 class ArithmeticOperations:
@@ -53,37 +56,20 @@ class ArithmeticOperations:
 
     @staticmethod
     def factorial(n: int) -> Optional[int]:
-        if n < 0:
-            return None
-        if n == 0 or n == 1:
-            return 1
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-        return result
+        return factorial(n)
 
     @staticmethod
     def absolute(a: float) -> float:
         return abs(a)
 
     @staticmethod
-    def evaluate(expression: str) -> Optional[float]:
+    def evaluate(expression: str, **variables) -> Optional[float]:
         try:
-            allowed_names = {
-                'sqrt': math.sqrt,
-                'pow': math.pow,
-                'sin': math.sin,
-                'cos': math.cos,
-                'tan': math.tan,
-                'log': math.log10,
-                'ln': math.log,
-                'exp': math.exp,
-                'pi': math.pi,
-                'e': math.e,
-                'factorial': math.factorial,
-                'abs': abs,
-            }
-            result = eval(expression, {"__builtins__": {}}, allowed_names)
-            return float(result) if result is not None else None
+            compiled = compile_expression(expression)
         except Exception:
             return None
+        return compiled.evaluate(**variables)
+
+    @staticmethod
+    def evaluate_batch(expression: str, **arrays):
+        return evaluate_batch(expression, **arrays)
@@ -0,0 +1,159 @@
+from functools import lru_cache
+from typing import Callable, Tuple
+
+import numpy as np
+
+from .expression import CACHE_SIZE, CodeGenerator, ExpressionError, compile_expression
+from .factorial import SMALL_FACTORIALS
+
+
+_FACTORIAL_TABLE = np.array(SMALL_FACTORIALS, dtype=float)
+
+
+def _invalid(result, mask):
+    result = np.asarray(result, dtype=float)
+    if np.any(mask):
+        result = np.where(mask, np.nan, result)
+    return result
+
+
+def _div(a, b):
+    with np.errstate(all='ignore'):
+        return _invalid(np.true_divide(a, b), b == 0)
+
+
+def _floordiv(a, b):
+    with np.errstate(all='ignore'):
+        return _invalid(np.floor_divide(a, b), b == 0)
+
+
+def _mod(a, b):
+    with np.errstate(all='ignore'):
+        return _invalid(np.mod(a, b), b == 0)
+
+
+def _pow(a, b):
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    with np.errstate(all='ignore'):
+        result = np.power(a, b)
+        bad = ((a == 0) & (b < 0)) | ((a < 0) & (b != np.floor(b)))
+        bad |= np.isinf(result) & np.isfinite(a) & np.isfinite(b)
+    return _invalid(result, bad)
+
+
+def _sqrt(x):
+    with np.errstate(all='ignore'):
+        return _invalid(np.sqrt(x), np.asarray(x) < 0)
+
+
+def _log10(x):
+    with np.errstate(all='ignore'):
+        return _invalid(np.log10(x), np.asarray(x) <= 0)
+
+
+def _ln(x):
+    with np.errstate(all='ignore'):
+        return _invalid(np.log(x), np.asarray(x) <= 0)
+
+
+def _exp(x):
+    with np.errstate(all='ignore'):
+        result = np.exp(x)
+        return _invalid(result, np.isinf(result) & np.isfinite(x))
+
+
+def _trig(kernel):
+    def apply(x):
+        with np.errstate(all='ignore'):
+            return _invalid(kernel(x), np.isinf(x))
+    return apply
+
+
+def _factorial(x):
+    x = np.asarray(x, dtype=float)
+    with np.errstate(all='ignore'):
+        valid = (x >= 0) & (x == np.floor(x)) & (x < len(_FACTORIAL_TABLE))
+    result = _FACTORIAL_TABLE[np.where(valid, x, 0).astype(np.int64)]
+    return _invalid(result, ~valid)
+
+
+def _complex_aware(real, kernel):
+    # The real kernels mask domain errors the way the scalar path rejects
+    # them; complex arrays have no such domain and go straight to NumPy.
+    def apply(*args):
+        if any(np.iscomplexobj(arg) for arg in args):
+            with np.errstate(all='ignore'):
+                return kernel(*args)
+        return real(*args)
+    return apply
+
+
+def _complex_div(a, b):
+    result = np.true_divide(a, b)
+    return np.where(np.asarray(b) == 0, complex(np.nan, np.nan), result)
+
+
+def _complex_log(kernel):
+    def apply(x):
+        return np.where(np.asarray(x) == 0, complex(np.nan, np.nan), kernel(x))
+    return apply
+
+
+def _complex_undefined(*args):
+    # floor division, modulo and factorial have no complex version.
+    return np.full(np.broadcast_shapes(*(np.shape(arg) for arg in args)), np.nan)
+
+
+VECTOR_FUNCTIONS = {
+    'sqrt': _complex_aware(_sqrt, np.sqrt),
+    'pow': _complex_aware(_pow, np.power),
+    'sin': _complex_aware(_trig(np.sin), np.sin),
+    'cos': _complex_aware(_trig(np.cos), np.cos),
+    'tan': _complex_aware(_trig(np.tan), np.tan),
+    'log': _complex_aware(_log10, _complex_log(np.log10)),
+    'ln': _complex_aware(_ln, _complex_log(np.log)),
+    'exp': _complex_aware(_exp, np.exp),
+    'factorial': _complex_aware(_factorial, _complex_undefined),
+    'abs': np.abs,
+    'real': np.real,
+    'imag': np.imag,
+    'conj': np.conjugate,
+    'phase': np.angle,
+}
+
+VECTOR_OPERATORS = {
+    '/': _complex_aware(_div, _complex_div),
+    '//': _complex_aware(_floordiv, _complex_undefined),
+    '%': _complex_aware(_mod, _complex_undefined),
+    '^': _complex_aware(_pow, np.power),
+}
+
+
+def _dtype(value):
+    return complex if np.iscomplexobj(value) else float
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_batch(expression: str) -> Tuple[Callable, Tuple[str, ...]]:
+    compiled = compile_expression(expression)
+    generator = CodeGenerator(VECTOR_FUNCTIONS, VECTOR_OPERATORS)
+    return generator.build(compiled.tree, compiled.variables, compiled.shared), compiled.variables
+
+
+def evaluate_batch(expression: str, **arrays) -> np.ndarray:
+    kernel, variables = compile_batch(expression)
+    missing = [name for name in variables if name not in arrays]
+    if missing:
+        raise ExpressionError(f"Missing values for {', '.join(missing)}")
+    inputs = {name: np.asarray(value, dtype=_dtype(value)) for name, value in arrays.items()}
+    shape = np.broadcast_shapes(*(a.shape for a in inputs.values())) if inputs else ()
+    with np.errstate(all='ignore'):
+        result = kernel(**{name: inputs[name] for name in variables})
+    result = np.asarray(result, dtype=_dtype(result))
+    return np.array(np.broadcast_to(result, shape), dtype=result.dtype)
+
+
+def evaluate_batch_masked(expression: str, **arrays) -> np.ma.MaskedArray:
+    result = evaluate_batch(expression, **arrays)
+    return np.ma.masked_invalid(result)
@@ -0,0 +1,182 @@
+import sys
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .batch import compile_batch
+from .expression import ExpressionError
+from .solver import equation_expression
+
+
+DEFAULT_TOLERANCE = 1e-10
+DEFAULT_RELATIVE_TOLERANCE = 1e-10
+# Every level halves the intervals that are still too inaccurate.
+DEFAULT_MAX_LEVELS = 30
+# Past this many pending intervals every remaining one is accepted as is.
+MAX_INTERVALS = 1 << 20
+_EPSILON = sys.float_info.epsilon
+
+# 15-point Kronrod rule and its embedded 7-point Gauss rule on [-1, 1]
+# (QUADPACK qk15).
+_KRONROD_HALF_NODES = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0,
+])
+_KRONROD_HALF_WEIGHTS = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+])
+_GAUSS_HALF_WEIGHTS = np.array([
+    0.0, 0.129484966168869693270611432679082, 0.0, 0.279705391489276667901467771423780,
+    0.0, 0.381830050505118944950369775488975, 0.0, 0.417959183673469387755102040816327,
+])
+NODES = np.concatenate([-_KRONROD_HALF_NODES, _KRONROD_HALF_NODES[-2::-1]])
+KRONROD_WEIGHTS = np.concatenate([_KRONROD_HALF_WEIGHTS, _KRONROD_HALF_WEIGHTS[-2::-1]])
+GAUSS_WEIGHTS = np.concatenate([_GAUSS_HALF_WEIGHTS, _GAUSS_HALF_WEIGHTS[-2::-1]])
+
+# Central-difference stencils as (offsets in steps, weights); the second
+# half of each is the same rule with half the step, for extrapolation.
+_STENCILS = {
+    1: (np.array([-1.0, 1.0, -0.5, 0.5]), np.array([-0.5, 0.5, -1.0, 1.0])),
+    2: (np.array([-1.0, 0.0, 1.0, -0.5, 0.0, 0.5]), np.array([1.0, -2.0, 1.0, 4.0, -8.0, 4.0])),
+}
+# Step sizes that balance truncation against rounding after one
+# Richardson extrapolation.
+_STEPS = {1: _EPSILON ** (1 / 5), 2: _EPSILON ** (1 / 6)}
+
+BatchFunction = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def _batch_function(expression: str, var: str, variables: Optional[Dict[str, object]],
+                    *bounds) -> Tuple[BatchFunction, Tuple[int, ...], Tuple[np.ndarray, ...]]:
+    # Returns f(x, rows) evaluating the expression at points x for the
+    # parameter rows `rows`, the broadcast shape of all inputs and the
+    # bounds flattened to that shape.
+    kernel, names = compile_batch(equation_expression(expression))
+    variables = variables or {}
+    missing = [name for name in names if name != var and name not in variables]
+    if missing:
+        raise ExpressionError(f"Missing values for {', '.join(missing)}")
+    arrays = {name: np.asarray(value, dtype=float) for name, value in variables.items() if name in names}
+    bounds = [np.asarray(bound, dtype=float) for bound in bounds]
+    shape = np.broadcast_shapes(*(a.shape for a in bounds), *(a.shape for a in arrays.values()))
+    arrays = {name: np.broadcast_to(a, shape).ravel() for name, a in arrays.items()}
+    bounds = tuple(np.broadcast_to(a, shape).ravel() for a in bounds)
+
+    def f(x: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        # A constant integrand or one of the parameters only does not take
+        # `var` and is broadcast to the points instead.
+        parameters = {name: a[rows] for name, a in arrays.items()}
+        if var in names:
+            parameters[var] = x
+        with np.errstate(all='ignore'):
+            return np.broadcast_to(np.asarray(kernel(**parameters), dtype=float), x.shape)
+    return f, shape, bounds
+
+
+def _gauss_kronrod(f: BatchFunction, a: np.ndarray, b: np.ndarray,
+                   rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # All 15 nodes of every interval go to the kernel in one call.
+    center, half = 0.5 * (a + b), 0.5 * (b - a)
+    values = f(center[:, None] + half[:, None] * NODES, rows[:, None])
+    kronrod = values @ KRONROD_WEIGHTS * half
+    gauss = values @ GAUSS_WEIGHTS * half
+    return kronrod, np.abs(kronrod - gauss)
+
+
+def _finish(values: np.ndarray, errors: np.ndarray, shape: Tuple[int, ...], masked: bool):
+    values, errors = values.reshape(shape), errors.reshape(shape)
+    if masked:
+        return np.ma.masked_invalid(values), np.ma.masked_invalid(errors)
+    return values, errors
+
+
+def integrate_batch(expression: str, var: str, lower, upper, variables: Optional[Dict[str, object]] = None,
+                    tol: float = DEFAULT_TOLERANCE, rel_tol: float = DEFAULT_RELATIVE_TOLERANCE,
+                    max_levels: int = DEFAULT_MAX_LEVELS, masked: bool = False):
+    # Globally adaptive Gauss-Kronrod over many integrals at once. Each
+    # interval is accepted once its error is within its share, by length,
+    # of the row's tolerance; the others are halved and the halves of all
+    # rows are evaluated together at the next level.
+    f, shape, (lower, upper) = _batch_function(expression, var, variables, lower, upper)
+    n = lower.size
+    values, errors = np.zeros(n), np.zeros(n)
+    valid = np.isfinite(lower) & np.isfinite(upper)
+    a, b, rows = lower[valid], upper[valid], np.flatnonzero(valid)
+    length = np.abs(upper - lower)
+    length[length == 0] = 1
+    for level in range(max_levels):
+        if not rows.size:
+            break
+        value, error = _gauss_kronrod(f, a, b, rows)
+        finite = np.isfinite(value)
+        valid[rows[~finite]] = False
+        keep = finite & valid[rows]
+        a, b, rows, value, error = a[keep], b[keep], rows[keep], value[keep], error[keep]
+        estimate = values + np.bincount(rows, value, n)
+        tolerance = np.maximum(tol, rel_tol * np.abs(estimate))
+        share = np.abs(b - a) / length[rows]
+        last = level == max_levels - 1 or 2 * rows.size > MAX_INTERVALS
+        accepted = (error <= tolerance[rows] * share) | last
+        np.add.at(values, rows[accepted], value[accepted])
+        np.add.at(errors, rows[accepted], error[accepted])
+        a, b, rows = a[~accepted], b[~accepted], rows[~accepted]
+        middle = 0.5 * (a + b)
+        a, b, rows = np.concatenate([a, middle]), np.concatenate([middle, b]), np.concatenate([rows, rows])
+    values[~valid] = np.nan
+    errors[~valid] = np.nan
+    return _finish(values, errors, shape, masked)
+
+
+def integrate(expression: str, var: str = 'x', lower: float = 0.0, upper: float = 1.0,
+              variables: Optional[Dict[str, float]] = None, tol: float = DEFAULT_TOLERANCE,
+              rel_tol: float = DEFAULT_RELATIVE_TOLERANCE,
+              max_levels: int = DEFAULT_MAX_LEVELS) -> Optional[Tuple[float, float]]:
+    try:
+        values, errors = integrate_batch(expression, var, lower, upper, variables, tol, rel_tol, max_levels)
+    except ExpressionError:
+        return None
+    if values.shape or np.isnan(values):
+        return None
+    return float(values), float(errors)
+
+
+def derivative_batch(expression: str, var: str, at, variables: Optional[Dict[str, object]] = None,
+                     order: int = 1, step: Optional[float] = None, masked: bool = False):
+    # Central differences with steps h and h/2 combined by Richardson
+    # extrapolation; their difference is the error estimate. Every
+    # stencil point of every row is evaluated in one call.
+    if order not in _STENCILS:
+        raise ExpressionError(f"Unsupported derivative order {order}")
+    f, shape, (at,) = _batch_function(expression, var, variables, at)
+    offsets, weights = _STENCILS[order]
+    h = step if step is not None else _STEPS[order] * np.maximum(1.0, np.abs(at))
+    h = np.broadcast_to(np.asarray(h, dtype=float), at.shape)
+    points = at[:, None] + h[:, None] * offsets
+    half = len(offsets) // 2
+    # The step actually taken once x + h is rounded to a double.
+    steps = (points[:, half - 1] - points[:, 0]) / 2
+    values = f(points, np.arange(at.size)[:, None])
+    coarse = values[:, :half] @ weights[:half] / steps ** order
+    fine = values[:, half:] @ weights[half:] / steps ** order
+    result = fine + (fine - coarse) / 3
+    errors = np.abs(result - fine)
+    invalid = ~(np.isfinite(result) & np.isfinite(errors))
+    result[invalid] = np.nan
+    errors[invalid] = np.nan
+    return _finish(result, errors, shape, masked)
+
+
+def derivative(expression: str, var: str = 'x', at: float = 0.0, variables: Optional[Dict[str, float]] = None,
+               order: int = 1, step: Optional[float] = None) -> Optional[Tuple[float, float]]:
+    try:
+        values, errors = derivative_batch(expression, var, at, variables, order, step)
+    except ExpressionError:
+        return None
+    if values.shape or np.isnan(values):
+        return None
+    return float(values), float(errors)
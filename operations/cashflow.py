@@ -0,0 +1,150 @@
+from enum import IntEnum
+from typing import Tuple
+
+import numpy as np
+
+
+DEFAULT_GUESS = 0.1
+DEFAULT_TOLERANCE = 1e-10
+DEFAULT_MAX_ITERATIONS = 50
+# Rates (as fractions) at which every project is valued to find a sign
+# change for the rows Newton's method could not solve.
+BRACKET_RATES = np.array([-0.999, -0.99, -0.9, -0.75, -0.5, -0.25, -0.1, 0.0, 0.05, 0.1, 0.15,
+                          0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 100.0, 1000.0])
+
+
+class IrrStatus(IntEnum):
+    NEWTON = 0
+    BISECTION = 1
+    NO_ROOT = 2
+    INVALID = 3
+
+
+def _discount_factors(rates, exponents: np.ndarray) -> np.ndarray:
+    # (1 + rate)^-t for every rate (leading axes) and period t (last axis).
+    # exp/log1p is cheaper than pow and exact for t = 0.
+    with np.errstate(all='ignore'):
+        factors = np.exp(np.multiply.outer(-np.log1p(rates), exponents))
+    factors[np.asarray(rates) <= -1] = np.nan
+    return factors
+
+
+def net_present_value_batch(rates, cash_flows, masked: bool = False):
+    # One project per row of cash_flows, valued at its own rate (percent);
+    # the first flow is discounted one period, as in net_present_value.
+    flows = np.asarray(cash_flows, dtype=float)
+    rates = np.asarray(rates, dtype=float) / 100
+    exponents = np.arange(1, flows.shape[-1] + 1, dtype=float)
+    if rates.ndim == 0:
+        # A shared rate needs one vector of factors and a matrix product.
+        result = flows @ _discount_factors(rates, exponents)
+    else:
+        factors = _discount_factors(np.broadcast_to(rates, flows.shape[:-1]), exponents)
+        result = np.einsum('...t,...t->...', flows, factors)
+    if masked:
+        return np.ma.masked_invalid(result)
+    return result
+
+
+def net_present_value_grid(rates, cash_flows, masked: bool = False):
+    # Every project at every rate: the discount factors of all rates form
+    # one matrix, so the whole table is a single matrix product.
+    flows = np.asarray(cash_flows, dtype=float)
+    exponents = np.arange(1, flows.shape[-1] + 1, dtype=float)
+    factors = _discount_factors(np.atleast_1d(np.asarray(rates, dtype=float)) / 100, exponents)
+    result = flows @ factors.T
+    if masked:
+        return np.ma.masked_invalid(result)
+    return result
+
+
+def _npv(flows: np.ndarray, exponents: np.ndarray, rates: np.ndarray) -> np.ndarray:
+    return np.einsum('ij,ij->i', flows, _discount_factors(rates, exponents))
+
+
+def _newton(flows: np.ndarray, exponents: np.ndarray, rates: np.ndarray, tol: float,
+            max_iterations: int) -> np.ndarray:
+    # Updates `rates` in place and returns the rows that converged. A step
+    # past -100% goes halfway to it instead; rows leave the iteration once
+    # their step is within tolerance, or as failures once it is not finite.
+    weighted = flows * exponents
+    converged = np.zeros(rates.size, dtype=bool)
+    rows = np.arange(rates.size)
+    for _ in range(max_iterations):
+        if not rows.size:
+            break
+        rate = rates[rows]
+        factors = _discount_factors(rate, exponents)
+        npv = np.einsum('ij,ij->i', flows[rows], factors)
+        with np.errstate(all='ignore'):
+            slope = -np.einsum('ij,ij->i', weighted[rows], factors) / (1 + rate)
+            step = npv / slope
+        new = rate - step
+        outside = new <= -1
+        new[outside] = 0.5 * (rate[outside] - 1)
+        step[outside] = rate[outside] - new[outside]
+        failed = ~np.isfinite(new)
+        done = ~failed & (np.abs(step) <= tol * np.maximum(1.0, np.abs(new)))
+        rates[rows[~failed]] = new[~failed]
+        converged[rows[done]] = True
+        rows = rows[~(failed | done)]
+    return converged
+
+
+def _bisect(flows: np.ndarray, exponents: np.ndarray, guess: float,
+            tol: float) -> Tuple[np.ndarray, np.ndarray]:
+    # Values all rows at every bracketing rate with one matrix product and
+    # bisects, all rows together, the sign change nearest the guess.
+    grid = flows @ _discount_factors(BRACKET_RATES, exponents).T
+    change = (np.sign(grid[:, :-1]) * np.sign(grid[:, 1:]) <= 0) & np.isfinite(grid[:, :-1] + grid[:, 1:])
+    found = change.any(axis=1)
+    distance = np.abs(0.5 * (BRACKET_RATES[:-1] + BRACKET_RATES[1:]) - guess)
+    index = np.where(change, distance, np.inf).argmin(axis=1)[found]
+    rows = np.flatnonzero(found)
+    low, high = BRACKET_RATES[index], BRACKET_RATES[index + 1]
+    f_low = grid[rows, index]
+    negative_low = f_low < 0
+    steps = int(np.ceil(np.log2((high - low).max() / tol))) if rows.size else 0
+    flows = flows[rows]
+    for _ in range(steps):
+        mid = 0.5 * (low + high)
+        below = (_npv(flows, exponents, mid) < 0) == negative_low
+        low = np.where(below, mid, low)
+        high = np.where(below, high, mid)
+    root = np.full(found.size, np.nan)
+    root[rows] = np.where(f_low == 0, BRACKET_RATES[index], 0.5 * (low + high))
+    return root, found
+
+
+def internal_rate_of_return_batch(cash_flows, guess: float = DEFAULT_GUESS, tol: float = DEFAULT_TOLERANCE,
+                                  max_iterations: int = DEFAULT_MAX_ITERATIONS, masked: bool = False):
+    # IRR (percent) of every row of cash_flows, with the first flow
+    # undiscounted as in internal_rate_of_return, and an IrrStatus per row.
+    # Newton's method runs on all rows at once; the rows it cannot solve
+    # fall back to bisection on a bracket found by valuing them on a grid.
+    flows = np.asarray(cash_flows, dtype=float)
+    shape = flows.shape[:-1]
+    flows = flows.reshape(int(np.prod(shape)), flows.shape[-1])
+    exponents = np.arange(flows.shape[1], dtype=float)
+    rates = np.full(flows.shape[0], np.nan)
+    status = np.full(flows.shape[0], IrrStatus.INVALID, dtype=np.int8)
+    finite = np.isfinite(flows).all(axis=1) & (flows.shape[1] > 1)
+    # Without both an outflow and an inflow the NPV never changes sign.
+    signed = finite & (flows > 0).any(axis=1) & (flows < 0).any(axis=1)
+    status[finite & ~signed] = IrrStatus.NO_ROOT
+    rows = np.flatnonzero(signed)
+    if rows.size:
+        rate = np.full(rows.size, float(guess))
+        converged = _newton(flows[rows], exponents, rate, tol, max_iterations)
+        rates[rows[converged]] = rate[converged]
+        status[rows[converged]] = IrrStatus.NEWTON
+        rows = rows[~converged]
+    if rows.size:
+        root, found = _bisect(flows[rows], exponents, guess, tol)
+        rates[rows] = root
+        status[rows] = np.where(found, IrrStatus.BISECTION, IrrStatus.NO_ROOT)
+    rates = (rates * 100).reshape(shape)
+    status = status.reshape(shape)
+    if masked:
+        return np.ma.masked_invalid(rates), status
+    return rates, status
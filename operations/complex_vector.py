@@ -0,0 +1,76 @@
+from typing import Tuple
+
+import numpy as np
+
+from .vector import ArrayResult, _DEG_TO_RAD, _RAD_TO_DEG, _finish
+
+
+def _complex(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.complex128)
+
+
+def _binary(a, b) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    a, b = _complex(a), _complex(b)
+    return a, b, np.empty(np.broadcast_shapes(a.shape, b.shape), dtype=np.complex128)
+
+
+def add(a, b) -> np.ndarray:
+    a, b, out = _binary(a, b)
+    return np.add(a, b, out=out)
+
+
+def subtract(a, b) -> np.ndarray:
+    a, b, out = _binary(a, b)
+    return np.subtract(a, b, out=out)
+
+
+def multiply(a, b) -> np.ndarray:
+    a, b, out = _binary(a, b)
+    return np.multiply(a, b, out=out)
+
+
+def divide(a, b, masked: bool = False) -> ArrayResult:
+    a, b, out = _binary(a, b)
+    with np.errstate(all='ignore'):
+        np.divide(a, b, out=out)
+    out[np.broadcast_to(b == 0, out.shape)] = complex(np.nan, np.nan)
+    return _finish(out, None, masked)
+
+
+def magnitude(values) -> np.ndarray:
+    values = _complex(values)
+    return np.abs(values, out=np.empty(values.shape))
+
+
+def phase(values, degrees: bool = False) -> np.ndarray:
+    values = _complex(values)
+    out = np.arctan2(values.imag, values.real, out=np.empty(values.shape))
+    if degrees:
+        np.multiply(out, _RAD_TO_DEG, out=out)
+    return out
+
+
+def conjugate(values) -> np.ndarray:
+    values = _complex(values)
+    return np.conjugate(values, out=np.empty_like(values))
+
+
+def polar(values, degrees: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    return magnitude(values), phase(values, degrees)
+
+
+def rect(r, theta, degrees: bool = True) -> np.ndarray:
+    r = np.asarray(r, dtype=float)
+    theta = np.array(theta, dtype=float)
+    if degrees:
+        # One pass over the whole array instead of math.radians per value.
+        np.multiply(theta, _DEG_TO_RAD, out=theta)
+    out = np.empty(np.broadcast_shapes(r.shape, theta.shape), dtype=np.complex128)
+    # The real and imaginary parts are strided views into the same buffer,
+    # so both halves are written without a temporary complex array.
+    with np.errstate(all='ignore'):
+        np.cos(theta, out=out.real)
+        np.multiply(out.real, r, out=out.real)
+        np.sin(theta, out=out.imag)
+        np.multiply(out.imag, r, out=out.imag)
+    return out
@@ -0,0 +1,224 @@
+import math
+from typing import Callable, Union
+
+import numpy as np
+
+
+_LN_10 = math.log(10)
+
+
+def _scalar(value) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _function(scalar: Callable, array: Callable) -> Callable:
+    def apply(x):
+        return scalar(x) if _scalar(x) else array(x)
+    return apply
+
+
+_sqrt = _function(math.sqrt, np.sqrt)
+_exp = _function(math.exp, np.exp)
+_log = _function(math.log, np.log)
+_sin = _function(math.sin, np.sin)
+_cos = _function(math.cos, np.cos)
+_tan = _function(math.tan, np.tan)
+_asin = _function(math.asin, np.arcsin)
+_acos = _function(math.acos, np.arccos)
+_atan = _function(math.atan, np.arctan)
+_sinh = _function(math.sinh, np.sinh)
+_cosh = _function(math.cosh, np.cosh)
+_tanh = _function(math.tanh, np.tanh)
+
+
+def _pow(a, b):
+    # math.pow raises on a domain error where Python's ** would go complex.
+    if _scalar(a) and _scalar(b):
+        return math.pow(a, b)
+    return np.power(np.asarray(a, dtype=float), b)
+
+
+def _sign(x):
+    if _scalar(x):
+        return (x > 0) - (x < 0)
+    return np.sign(x)
+
+
+class Dual:
+    # value + grad * eps with eps^2 = 0. value is a float or an array;
+    # grad is a float for one direction or an array with the directions
+    # along its first axis, so one pass carries a whole gradient.
+    __slots__ = ('value', 'grad')
+    # Makes ndarray * Dual defer to Dual.__rmul__ instead of building an
+    # object array.
+    __array_ufunc__ = None
+
+    def __init__(self, value, grad=0.0):
+        self.value = value
+        self.grad = grad
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value!r}, {self.grad!r})"
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.grad + other.grad)
+        return Dual(self.value + other, self.grad)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.grad - other.grad)
+        return Dual(self.value - other, self.grad)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.grad)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.grad * other.value + other.grad * self.value)
+        return Dual(self.value * other, self.grad * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            value = self.value / other.value
+            return Dual(value, (self.grad - other.grad * value) / other.value)
+        return Dual(self.value / other, self.grad / other)
+
+    def __rtruediv__(self, other):
+        value = other / self.value
+        return Dual(value, -self.grad * value / self.value)
+
+    def __floordiv__(self, other):
+        other_value = other.value if isinstance(other, Dual) else other
+        return Dual(self.value // other_value, 0.0 * self.grad)
+
+    def __rfloordiv__(self, other):
+        return Dual(other // self.value, 0.0 * self.grad)
+
+    def __mod__(self, other):
+        if isinstance(other, Dual):
+            return self - other * (self // other).value
+        return Dual(self.value % other, self.grad)
+
+    def __rmod__(self, other):
+        return Dual(other, 0.0 * self.grad) % self
+
+    def __pow__(self, other):
+        return power(self, other)
+
+    def __rpow__(self, other):
+        return power(other, self)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.grad)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Dual(abs(self.value), _sign(self.value) * self.grad)
+
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, Dual) else other)
+
+    def __le__(self, other):
+        return self.value <= (other.value if isinstance(other, Dual) else other)
+
+    def __gt__(self, other):
+        return self.value > (other.value if isinstance(other, Dual) else other)
+
+    def __ge__(self, other):
+        return self.value >= (other.value if isinstance(other, Dual) else other)
+
+
+Number = Union[float, np.ndarray, Dual]
+
+
+def power(a: Number, b: Number) -> Number:
+    if not isinstance(b, Dual):
+        if not isinstance(a, Dual):
+            return _pow(a, b)
+        value = _pow(a.value, b)
+        if _scalar(b) and b == 0:
+            return Dual(value, 0.0 * a.grad)
+        if _scalar(a.value) and a.value != 0:
+            # a^(b-1) = a^b / a saves a second power.
+            return Dual(value, b * value / a.value * a.grad)
+        return Dual(value, b * _pow(a.value, b - 1) * a.grad)
+    if not isinstance(a, Dual):
+        value = _pow(a, b.value)
+        return Dual(value, value * _log(a) * b.grad)
+    value = _pow(a.value, b.value)
+    return Dual(value, value * (b.grad * _log(a.value) + b.value * a.grad / a.value))
+
+
+def _chain(x: Number, function: Callable, slope: Callable) -> Number:
+    # slope(value, result) is the derivative of function at value.
+    if not isinstance(x, Dual):
+        return function(x)
+    result = function(x.value)
+    return Dual(result, slope(x.value, result) * x.grad)
+
+
+def sqrt(x: Number) -> Number:
+    return _chain(x, _sqrt, lambda v, r: 0.5 / r)
+
+
+def exp(x: Number) -> Number:
+    return _chain(x, _exp, lambda v, r: r)
+
+
+def ln(x: Number) -> Number:
+    return _chain(x, _log, lambda v, r: 1 / v)
+
+
+def log10(x: Number) -> Number:
+    return _chain(x, lambda v: _log(v) / _LN_10, lambda v, r: 1 / (v * _LN_10))
+
+
+def sin(x: Number) -> Number:
+    return _chain(x, _sin, lambda v, r: _cos(v))
+
+
+def cos(x: Number) -> Number:
+    return _chain(x, _cos, lambda v, r: -_sin(v))
+
+
+def tan(x: Number) -> Number:
+    return _chain(x, _tan, lambda v, r: 1 + r * r)
+
+
+def asin(x: Number) -> Number:
+    return _chain(x, _asin, lambda v, r: 1 / _sqrt(1 - v * v))
+
+
+def acos(x: Number) -> Number:
+    return _chain(x, _acos, lambda v, r: -1 / _sqrt(1 - v * v))
+
+
+def atan(x: Number) -> Number:
+    return _chain(x, _atan, lambda v, r: 1 / (1 + v * v))
+
+
+def sinh(x: Number) -> Number:
+    return _chain(x, _sinh, lambda v, r: _cosh(v))
+
+
+def cosh(x: Number) -> Number:
+    return _chain(x, _cosh, lambda v, r: _sinh(v))
+
+
+def tanh(x: Number) -> Number:
+    return _chain(x, _tanh, lambda v, r: 1 - r * r)
+
+
+def value_of(x: Number):
+    return x.value if isinstance(x, Dual) else x
+
+
+def grad_of(x: Number):
+    return x.grad if isinstance(x, Dual) else 0.0
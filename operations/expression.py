@@ -0,0 +1,774 @@
+import cmath
+import math
+import re
+import keyword
+import operator
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from . import dual
+from .factorial import factorial
+
+
+CACHE_SIZE = 1024
+# Deeper nesting would overflow the recursive parser, optimizer and code
+# generator (CPython also caps nested parentheses in generated source).
+MAX_DEPTH = 100
+# Every integer up to 2**53 is exactly representable as a float.
+_MAX_EXACT_INT = 2 ** 53
+
+
+class ExpressionError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Num:
+    value: Union[int, float, complex]
+
+
+@dataclass(frozen=True)
+class Var:
+    name: str
+
+
+@dataclass(frozen=True)
+class UnaryOp:
+    op: str
+    operand: 'Node'
+
+
+@dataclass(frozen=True)
+class BinOp:
+    op: str
+    left: 'Node'
+    right: 'Node'
+
+
+@dataclass(frozen=True)
+class Call:
+    name: str
+    args: Tuple['Node', ...]
+
+
+Node = Union[Num, Var, UnaryOp, BinOp, Call]
+
+
+CONSTANTS = {
+    'pi': math.pi,
+    'e': math.e,
+}
+
+
+def _power(a, b):
+    # Python turns a negative base with a fractional exponent into a complex
+    # number; a real expression treats that as a domain error instead.
+    result = a ** b
+    if isinstance(result, complex) and not (isinstance(a, complex) or isinstance(b, complex)):
+        raise ValueError("math domain error")
+    return result
+
+
+def _complex_aware(real: Callable, complex_: Callable) -> Callable:
+    def apply(x):
+        if isinstance(x, complex):
+            return complex_(x)
+        return real(x)
+    return apply
+
+
+def _pow(a, b):
+    if isinstance(a, complex) or isinstance(b, complex):
+        return a ** b
+    return math.pow(a, b)
+
+
+SCALAR_FUNCTIONS: Dict[str, Callable] = {
+    'sqrt': math.sqrt,
+    'pow': math.pow,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'log': math.log10,
+    'ln': math.log,
+    'exp': math.exp,
+    'factorial': factorial,
+    'abs': abs,
+    'real': lambda z: z.real,
+    'imag': lambda z: z.imag,
+    'conj': lambda z: z.conjugate(),
+    'phase': cmath.phase,
+}
+
+# Used only for expressions that meet complex values, so real expressions
+# keep calling the math functions directly. Real arguments still get the
+# math semantics: sqrt(-1) is a domain error, not 1j.
+COMPLEX_FUNCTIONS: Dict[str, Callable] = {
+    **SCALAR_FUNCTIONS,
+    'sqrt': _complex_aware(math.sqrt, cmath.sqrt),
+    'pow': _pow,
+    'sin': _complex_aware(math.sin, cmath.sin),
+    'cos': _complex_aware(math.cos, cmath.cos),
+    'tan': _complex_aware(math.tan, cmath.tan),
+    'log': _complex_aware(math.log10, cmath.log10),
+    'ln': _complex_aware(math.log, cmath.log),
+    'exp': _complex_aware(math.exp, cmath.exp),
+}
+
+SCALAR_OPERATORS: Dict[str, Callable] = {
+    '^': _power,
+}
+
+
+def _not_differentiable(name: str) -> Callable:
+    def apply(*args):
+        raise ExpressionError(f"Cannot differentiate {name}()")
+    return apply
+
+
+# Used for forward-mode differentiation: the compiled expression is called
+# with dual numbers, so one pass yields the value and the gradient.
+DUAL_FUNCTIONS: Dict[str, Callable] = {
+    **{name: _not_differentiable(name) for name in SCALAR_FUNCTIONS},
+    'sqrt': dual.sqrt,
+    'pow': dual.power,
+    'sin': dual.sin,
+    'cos': dual.cos,
+    'tan': dual.tan,
+    'log': dual.log10,
+    'ln': dual.ln,
+    'exp': dual.exp,
+    'abs': abs,
+}
+
+DUAL_OPERATORS: Dict[str, Callable] = {
+    '^': dual.power,
+}
+
+FUNCTION_ARITY = {
+    'pow': 2,
+}
+
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?[jJ]?)
+      | (?P<name>[A-Za-z][A-Za-z0-9_]*)
+      | (?P<op>\*\*|//|[-+*/%^(),])
+    )""", re.VERBOSE)
+
+
+def tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    end = len(expression.rstrip())
+    while pos < end:
+        match = _TOKEN_RE.match(expression, pos)
+        if match is None:
+            raise ExpressionError(f"Unexpected character {expression[pos:].lstrip()[:1]!r} at position {pos}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    tokens.append(('end', ''))
+    return tokens
+
+
+class Parser:
+    # expr   := term (('+' | '-') term)*
+    # term   := unary (('*' | '/' | '//' | '%') unary)*
+    # unary  := ('+' | '-') unary | power
+    # power  := atom (('^' | '**') unary)?
+    # atom   := number | name | name '(' args ')' | '(' expr ')'
+
+    def __init__(self, expression: str):
+        self.tokens = tokenize(expression)
+        self.pos = 0
+        self.depth = 0
+
+    def parse(self) -> Node:
+        node = self._expr()
+        kind, text = self.tokens[self.pos]
+        if kind != 'end':
+            raise ExpressionError(f"Unexpected token {text!r}")
+        if tree_depth(node) > MAX_DEPTH:
+            raise ExpressionError("Expression is nested too deeply")
+        return node
+
+    def _peek(self) -> str:
+        return self.tokens[self.pos][1]
+
+    def _advance(self) -> Tuple[str, str]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect(self, text: str):
+        kind, found = self._advance()
+        if found != text or kind == 'end':
+            raise ExpressionError(f"Expected {text!r} but found {found or 'end of input'!r}")
+
+    def _expr(self) -> Node:
+        node = self._term()
+        while self._peek() in ('+', '-'):
+            op = self._advance()[1]
+            node = BinOp(op, node, self._term())
+        return node
+
+    def _term(self) -> Node:
+        node = self._unary()
+        while self._peek() in ('*', '/', '//', '%'):
+            op = self._advance()[1]
+            node = BinOp(op, node, self._unary())
+        return node
+
+    def _unary(self) -> Node:
+        # Every level of nesting (signs, parentheses, exponents and
+        # arguments) passes through here.
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise ExpressionError("Expression is nested too deeply")
+        try:
+            if self._peek() in ('+', '-'):
+                op = self._advance()[1]
+                return UnaryOp(op, self._unary())
+            return self._power()
+        finally:
+            self.depth -= 1
+
+    def _power(self) -> Node:
+        node = self._atom()
+        if self._peek() in ('^', '**'):
+            self._advance()
+            node = BinOp('^', node, self._unary())
+        return node
+
+    def _atom(self) -> Node:
+        kind, text = self._advance()
+        if kind == 'number':
+            if text[-1] in 'jJ':
+                return Num(complex(0, float(text[:-1])))
+            if any(c in text for c in '.eE'):
+                return Num(float(text))
+            return Num(int(text))
+        if kind == 'name':
+            if self._peek() == '(':
+                return self._call(text)
+            if text in SCALAR_FUNCTIONS:
+                raise ExpressionError(f"Function {text!r} must be called")
+            if text in CONSTANTS:
+                return Num(CONSTANTS[text])
+            if keyword.iskeyword(text):
+                raise ExpressionError(f"Invalid variable name {text!r}")
+            return Var(text)
+        if text == '(':
+            node = self._expr()
+            self._expect(')')
+            return node
+        raise ExpressionError(f"Unexpected token {text or 'end of input'!r}")
+
+    def _call(self, name: str) -> Node:
+        if name not in SCALAR_FUNCTIONS:
+            raise ExpressionError(f"Unknown function {name!r}")
+        self._expect('(')
+        args = []
+        if self._peek() != ')':
+            args.append(self._expr())
+            while self._peek() == ',':
+                self._advance()
+                args.append(self._expr())
+        self._expect(')')
+        arity = FUNCTION_ARITY.get(name, 1)
+        if len(args) != arity:
+            raise ExpressionError(f"{name}() takes {arity} argument(s), got {len(args)}")
+        return Call(name, tuple(args))
+
+
+def parse(expression: str) -> Node:
+    return Parser(expression).parse()
+
+
+def _children(node: Node) -> Tuple[Node, ...]:
+    if isinstance(node, UnaryOp):
+        return (node.operand,)
+    if isinstance(node, BinOp):
+        return (node.left, node.right)
+    if isinstance(node, Call):
+        return node.args
+    return ()
+
+
+def tree_depth(node: Node) -> int:
+    # Iterative, so it is safe on trees too deep to recurse over.
+    depth, stack = 0, [(node, 1)]
+    while stack:
+        node, level = stack.pop()
+        depth = max(depth, level)
+        stack.extend((child, level + 1) for child in _children(node))
+    return depth
+
+
+def free_variables(node: Node) -> Tuple[str, ...]:
+    names: Dict[str, None] = {}
+
+    def visit(n):
+        if isinstance(n, Var):
+            names.setdefault(n.name)
+        for child in _children(n):
+            visit(child)
+
+    visit(node)
+    return tuple(names)
+
+
+_FOLD_BINARY = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '//': operator.floordiv,
+    '%': operator.mod,
+    '^': _power,
+}
+
+_FOLD_UNARY = {
+    '+': operator.pos,
+    '-': operator.neg,
+}
+
+
+_LN_10 = math.log(10)
+
+
+def _product(*factors: Node) -> Node:
+    node = factors[0]
+    for factor in factors[1:]:
+        node = BinOp('*', node, factor)
+    return node
+
+
+def differentiate(node: Node, name: str) -> Node:
+    # Symbolic derivative with respect to `name`; the result is left for the
+    # optimizer to fold, so it can be compiled like any other expression.
+    if isinstance(node, Num):
+        return Num(0)
+    if isinstance(node, Var):
+        return Num(1 if node.name == name else 0)
+    if isinstance(node, UnaryOp):
+        return UnaryOp(node.op, differentiate(node.operand, name))
+    if isinstance(node, BinOp):
+        u, v = node.left, node.right
+        du, dv = differentiate(u, name), differentiate(v, name)
+        if node.op in ('+', '-'):
+            return BinOp(node.op, du, dv)
+        if node.op == '*':
+            return BinOp('+', _product(du, v), _product(u, dv))
+        if node.op == '/':
+            return BinOp('/', BinOp('-', _product(du, v), _product(u, dv)), _product(v, v))
+        if node.op == '//':
+            return Num(0)
+        if node.op == '%':
+            return BinOp('-', du, _product(dv, BinOp('//', u, v)))
+        if name not in free_variables(v):
+            return _product(v, BinOp('^', u, BinOp('-', v, Num(1))), du)
+        # d(u^v) = u^v (v' ln u + v u' / u)
+        return _product(node, BinOp('+', _product(dv, Call('ln', (u,))), BinOp('/', _product(v, du), u)))
+    if isinstance(node, Call):
+        if node.name == 'pow':
+            return differentiate(BinOp('^', *node.args), name)
+        u = node.args[0]
+        du = differentiate(u, name)
+        rules = {
+            'sqrt': lambda: BinOp('/', du, _product(Num(2), node)),
+            'sin': lambda: _product(Call('cos', (u,)), du),
+            'cos': lambda: UnaryOp('-', _product(Call('sin', (u,)), du)),
+            'tan': lambda: BinOp('/', du, _product(Call('cos', (u,)), Call('cos', (u,)))),
+            'log': lambda: BinOp('/', du, _product(u, Num(_LN_10))),
+            'ln': lambda: BinOp('/', du, u),
+            'exp': lambda: _product(node, du),
+            'abs': lambda: BinOp('/', _product(du, u), node),
+        }
+        if node.name in rules:
+            return rules[node.name]()
+        raise ExpressionError(f"Cannot differentiate {node.name}()")
+    raise ExpressionError(f"Unknown node {node!r}")
+
+
+def has_complex_constant(node: Node) -> bool:
+    if isinstance(node, Num):
+        return isinstance(node.value, complex)
+    return any(has_complex_constant(child) for child in _children(node))
+
+
+def count_operations(node: Node) -> int:
+    if isinstance(node, (Num, Var)):
+        return 0
+    return 1 + sum(count_operations(child) for child in _children(node))
+
+
+@dataclass
+class OptimizationReport:
+    constants_folded: int = 0
+    simplifications: int = 0
+    common_subexpressions: int = 0
+    operations_before: int = 0
+    operations_after: int = 0
+    rewrites: List[Tuple[Node, Node]] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (f"{self.operations_before} -> {self.operations_after} operations "
+                f"({self.constants_folded} folded, {self.simplifications} simplified, "
+                f"{self.common_subexpressions} shared)")
+
+    def details(self) -> List[str]:
+        return [f"{format_node(before)} -> {format_node(after)}" for before, after in self.rewrites]
+
+
+def _is_power_of_two(value: int) -> bool:
+    value = abs(value)
+    return value & (value - 1) == 0
+
+
+def _is_number(node: Node, value: int) -> bool:
+    # Num(0j) == Num(0), but x + 0j is complex and 1.0 * x is a float, so
+    # the identity rules only apply to integer constants.
+    return isinstance(node, Num) and type(node.value) is int and node.value == value
+
+
+class Optimizer:
+    def __init__(self, functions: Dict[str, Callable] = SCALAR_FUNCTIONS):
+        self.functions = functions
+        self.report = OptimizationReport()
+
+    def optimize(self, node: Node) -> Tuple[Node, Tuple[Node, ...], OptimizationReport]:
+        self.report = OptimizationReport(operations_before=count_operations(node))
+        node = self._rewrite(node)
+        shared = self._common_subexpressions(node)
+        self.report.common_subexpressions = len(shared)
+        self.report.operations_after = self._unique_operations(node)
+        return node, shared, self.report
+
+    def _rewrite(self, node: Node) -> Node:
+        if isinstance(node, UnaryOp):
+            node = UnaryOp(node.op, self._rewrite(node.operand))
+        elif isinstance(node, BinOp):
+            node = BinOp(node.op, self._rewrite(node.left), self._rewrite(node.right))
+        elif isinstance(node, Call):
+            node = Call(node.name, tuple(self._rewrite(arg) for arg in node.args))
+        else:
+            return node
+        folded = self._fold(node)
+        if folded is not None:
+            return folded
+        return self._simplify(node)
+
+    def _fold(self, node: Node) -> Optional[Num]:
+        try:
+            if isinstance(node, UnaryOp) and isinstance(node.operand, Num):
+                value = _FOLD_UNARY[node.op](node.operand.value)
+            elif isinstance(node, BinOp) and isinstance(node.left, Num) and isinstance(node.right, Num):
+                value = _FOLD_BINARY[node.op](node.left.value, node.right.value)
+            elif isinstance(node, Call) and all(isinstance(arg, Num) for arg in node.args):
+                value = self.functions[node.name](*(arg.value for arg in node.args))
+            else:
+                return None
+        except Exception:
+            # Leave the subtree alone so the error still surfaces at evaluation time.
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float, complex)):
+            return None
+        folded = Num(value)
+        self.report.constants_folded += 1
+        self.report.rewrites.append((node, folded))
+        return folded
+
+    def _simplify(self, node: Node) -> Node:
+        result = node
+        if isinstance(node, UnaryOp):
+            if node.op == '+':
+                result = node.operand
+            elif isinstance(node.operand, UnaryOp) and node.operand.op == '-':
+                result = node.operand.operand
+        elif isinstance(node, BinOp):
+            left, right = node.left, node.right
+            if node.op == '^' and _is_number(right, 2):
+                result = BinOp('*', left, left)
+            elif node.op == '^' and _is_number(right, 1):
+                result = left
+            elif node.op == '*' and _is_number(right, 1):
+                result = left
+            elif node.op == '*' and _is_number(left, 1):
+                result = right
+            elif node.op == '/' and _is_number(right, 1):
+                result = left
+            elif node.op in ('+', '-') and _is_number(right, 0):
+                result = left
+            elif node.op == '+' and _is_number(left, 0):
+                result = right
+            elif node.op == '*' and isinstance(right, Num) and isinstance(left, BinOp) and left.op == '*':
+                result = self._reassociate(node)
+        if result is not node:
+            self.report.simplifications += 1
+            self.report.rewrites.append((node, result))
+        return result
+
+    def _reassociate(self, node: BinOp) -> Node:
+        # (x * a) * b becomes x * (a * b) only when that cannot change the
+        # result: a and b are nonzero ints, one of them a power of two (an
+        # exact scaling of x) and the product exact as a float. Anything else
+        # rounds, overflows or underflows differently from the original order.
+        inner = node.left
+        if isinstance(inner.right, Num):
+            other, constant = inner.left, inner.right
+        elif isinstance(inner.left, Num):
+            other, constant = inner.right, inner.left
+        else:
+            return node
+        a, b = constant.value, node.right.value
+        if type(a) is not int or type(b) is not int or not a or not b:
+            return node
+        if abs(a * b) > _MAX_EXACT_INT or not (_is_power_of_two(a) or _is_power_of_two(b)):
+            return node
+        combined = self._fold(BinOp('*', constant, node.right))
+        if combined is None:
+            return node
+        return BinOp('*', other, combined)
+
+    def _common_subexpressions(self, node: Node) -> Tuple[Node, ...]:
+        counts: Counter = Counter()
+
+        def visit(n):
+            if isinstance(n, (Num, Var)):
+                return
+            counts[n] += 1
+            if counts[n] == 1:
+                for child in _children(n):
+                    visit(child)
+
+        visit(node)
+        return tuple(n for n, count in counts.items() if count > 1)
+
+    def _unique_operations(self, node: Node) -> int:
+        seen = set()
+
+        def visit(n):
+            if isinstance(n, (Num, Var)) or n in seen:
+                return
+            seen.add(n)
+            for child in _children(n):
+                visit(child)
+
+        visit(node)
+        return len(seen)
+
+
+def format_node(node: Node) -> str:
+    if isinstance(node, Num):
+        return repr(node.value)
+    if isinstance(node, Var):
+        return node.name
+    if isinstance(node, UnaryOp):
+        return f"{node.op}{format_node(node.operand)}"
+    if isinstance(node, BinOp):
+        return f"({format_node(node.left)} {node.op} {format_node(node.right)})"
+    return f"{node.name}({', '.join(format_node(arg) for arg in node.args)})"
+
+
+def optimize(node: Node) -> Tuple[Node, Tuple[Node, ...], OptimizationReport]:
+    return Optimizer().optimize(node)
+
+
+_PYTHON_OPERATORS = {
+    '+': '+',
+    '-': '-',
+    '*': '*',
+    '/': '/',
+    '//': '//',
+    '%': '%',
+    '^': '**',
+}
+
+
+_OPERATOR_SLOTS = {
+    '+': 'add',
+    '-': 'sub',
+    '*': 'mul',
+    '/': 'div',
+    '//': 'floordiv',
+    '%': 'mod',
+    '^': 'pow',
+}
+
+
+class CodeGenerator:
+    def __init__(self, functions: Dict[str, Callable], operators: Optional[Dict[str, Callable]] = None):
+        self.functions = functions
+        self.operators = operators or {}
+        self.namespace: Dict[str, object] = {'__builtins__': {}}
+        self.shared: Dict[Node, Optional[str]] = {}
+        self.statements: List[str] = []
+
+    def emit(self, node: Node) -> str:
+        if node in self.shared:
+            temp = self.shared[node]
+            if temp is None:
+                value = self._emit(node)
+                temp = f"_t{len(self.statements)}"
+                self.statements.append(f"{temp} = {value}")
+                self.shared[node] = temp
+            return temp
+        return self._emit(node)
+
+    def _emit(self, node: Node) -> str:
+        if isinstance(node, Num):
+            return self._constant(node.value)
+        if isinstance(node, Var):
+            return node.name
+        if isinstance(node, UnaryOp):
+            return f"({node.op}{self.emit(node.operand)})"
+        if isinstance(node, BinOp):
+            left, right = self.emit(node.left), self.emit(node.right)
+            if node.op in self.operators:
+                slot = f"_op_{_OPERATOR_SLOTS[node.op]}"
+                self.namespace[slot] = self.operators[node.op]
+                return f"{slot}({left}, {right})"
+            return f"({left} {_PYTHON_OPERATORS[node.op]} {right})"
+        if isinstance(node, Call):
+            slot = f"_f_{node.name}"
+            self.namespace[slot] = self.functions[node.name]
+            return f"{slot}({', '.join(self.emit(arg) for arg in node.args)})"
+        raise ExpressionError(f"Unknown node {node!r}")
+
+    def _constant(self, value) -> str:
+        if isinstance(value, (float, complex)) and not cmath.isfinite(value):
+            slot = f"_c{len(self.namespace)}"
+            self.namespace[slot] = value
+            return slot
+        return repr(value)
+
+    def build(self, node: Node, variables: Tuple[str, ...], shared: Tuple[Node, ...] = ()) -> Callable:
+        self.shared = dict.fromkeys(shared)
+        self.statements = []
+        body = self.emit(node)
+        lines = [f"def _compiled({', '.join(variables)}):"]
+        lines.extend(f"    {statement}" for statement in self.statements)
+        lines.append(f"    return {body}")
+        source = "\n".join(lines) + "\n"
+        exec(compile(source, '<expression>', 'exec'), self.namespace)
+        return self.namespace['_compiled']
+
+
+class CompiledExpr:
+    def __init__(self, source: str, tree: Node, optimize: bool = True, variables: Optional[Tuple[str, ...]] = None):
+        self.source = source
+        self.variables = free_variables(tree) if variables is None else variables
+        self._derivatives: Dict[str, 'CompiledExpr'] = {}
+        if optimize:
+            self.tree, self.shared, self.report = Optimizer(COMPLEX_FUNCTIONS).optimize(tree)
+        else:
+            self.tree, self.shared, self.report = tree, (), None
+        self._complex_function = None
+        self._dual_function = None
+        if isinstance(self.tree, Num) and not self.variables:
+            value = self.tree.value
+            self.function = lambda: value
+        elif has_complex_constant(self.tree):
+            self.function = self.complex_function
+        else:
+            self.function = CodeGenerator(SCALAR_FUNCTIONS, SCALAR_OPERATORS).build(self.tree, self.variables, self.shared)
+
+    @property
+    def complex_function(self) -> Callable:
+        if self._complex_function is None:
+            generator = CodeGenerator(COMPLEX_FUNCTIONS, SCALAR_OPERATORS)
+            self._complex_function = generator.build(self.tree, self.variables, self.shared)
+        return self._complex_function
+
+    @property
+    def dual_function(self) -> Callable:
+        if self._dual_function is None:
+            generator = CodeGenerator(DUAL_FUNCTIONS, DUAL_OPERATORS)
+            self._dual_function = generator.build(self.tree, self.variables, self.shared)
+        return self._dual_function
+
+    def value_and_gradient(self, **variables) -> Optional[Tuple[object, Dict[str, object]]]:
+        # Forward mode: variable i is seeded with the i-th unit direction, so
+        # a single evaluation carries every partial derivative. Arrays are
+        # differentiated elementwise and give NaN where the value is
+        # undefined; a scalar evaluation outside the domain gives None.
+        names = self.variables
+        if any(name not in variables for name in names):
+            return None
+        ndim = max((0 if isinstance(variables[name], (int, float)) else np.ndim(variables[name])
+                    for name in names), default=0)
+        if ndim == 0 and len(names) == 1:
+            seeds = [1.0]
+        else:
+            seeds = np.eye(len(names)).reshape((len(names), len(names)) + (1,) * ndim)
+        args = [dual.Dual(variables[name] if ndim == 0 else np.asarray(variables[name], dtype=float), seed)
+                for name, seed in zip(names, seeds)]
+        if ndim == 0:
+            try:
+                result = self.dual_function(*args)
+                # float() also rejects complex values, which have no real gradient.
+                value, grad = float(dual.value_of(result)), dual.grad_of(result)
+                if len(names) == 1:
+                    return value, {names[0]: float(grad)}
+                grad = np.broadcast_to(grad, (len(names),))
+                return value, {name: float(g) for name, g in zip(names, grad)}
+            except (ArithmeticError, ValueError, TypeError):
+                return None
+        with np.errstate(all='ignore'):
+            result = self.dual_function(*args)
+            shape = np.broadcast_shapes(*(np.shape(variables[name]) for name in names))
+            value = np.broadcast_to(dual.value_of(result), shape)
+            grad = np.broadcast_to(dual.grad_of(result), (len(names),) + shape)
+            complex_parts = (np.imag(value) != 0) | (np.imag(grad) != 0).any(axis=0)
+            value, grad = np.array(np.real(value), dtype=float), np.array(np.real(grad), dtype=float)
+        invalid = ~np.isfinite(value) | ~np.isfinite(grad).all(axis=0) | complex_parts
+        value[invalid] = np.nan
+        grad[:, invalid] = np.nan
+        return value, dict(zip(names, grad))
+
+    def derivative(self, name: str) -> 'CompiledExpr':
+        # Takes the same arguments as the expression itself, even when the
+        # derivative no longer depends on some of them.
+        if name not in self._derivatives:
+            tree = differentiate(self.tree, name)
+            self._derivatives[name] = CompiledExpr(f"d/d{name}({self.source})", tree, variables=self.variables)
+        return self._derivatives[name]
+
+    def __call__(self, *args, **variables):
+        try:
+            return self.function(*args, **variables)
+        except TypeError:
+            # math functions reject complex arguments; retry through cmath.
+            return self.complex_function(*args, **variables)
+
+    def evaluate(self, **variables) -> Optional[Union[float, complex]]:
+        try:
+            try:
+                result = self.function(**variables)
+            except TypeError:
+                # Values for names the expression does not use are ignored,
+                # and complex arguments are retried through cmath.
+                result = self(**{name: variables[name] for name in self.variables if name in variables})
+            if result is None or isinstance(result, complex):
+                return result
+            return float(result)
+        except MemoryError:
+            # Running out of memory is a resource limit, not an undefined result.
+            raise
+        except Exception:
+            return None
+
+    def __repr__(self) -> str:
+        return f"CompiledExpr({self.source!r}, variables={self.variables})"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(expression: str, optimize: bool = True) -> CompiledExpr:
+    return CompiledExpr(expression, parse(expression), optimize)
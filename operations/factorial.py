@@ -0,0 +1,130 @@
+import math
+from typing import Dict, Iterable, List, Optional
+
+
+SMALL_FACTORIALS: List[int] = [1]
+for _i in range(1, 171):
+    SMALL_FACTORIALS.append(SMALL_FACTORIALS[-1] * _i)
+del _i
+
+
+def _primes_up_to(n: int) -> List[int]:
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, math.isqrt(n) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, n + 1, i)))
+    return [i for i, flag in enumerate(sieve) if flag]
+
+
+def _legendre(n: int, p: int) -> int:
+    exponent = 0
+    while n:
+        n //= p
+        exponent += n
+    return exponent
+
+
+def product(values: Iterable[int]) -> int:
+    # Balanced pairwise multiplication keeps operands of similar size, which
+    # is where CPython's Karatsuba multiplication pays off.
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def range_product(start: int, stop: int, step: int = 1) -> int:
+    if step > 0 and start >= stop or step < 0 and start <= stop:
+        return 1
+    count = len(range(start, stop, step))
+    if count <= 32:
+        result = 1
+        for value in range(start, stop, step):
+            result *= value
+        return result
+    middle = start + (count // 2) * step
+    return range_product(start, middle, step) * range_product(middle, stop, step)
+
+
+def _from_prime_exponents(exponents: Dict[int, int]) -> int:
+    # n = prod(P_b ** 2**b), where P_b multiplies the primes whose exponent
+    # has bit b set; squaring from the top bit down shares the big squarings.
+    by_bit: Dict[int, List[int]] = {}
+    for prime, exponent in exponents.items():
+        bit = 0
+        while exponent:
+            if exponent & 1:
+                by_bit.setdefault(bit, []).append(prime)
+            exponent >>= 1
+            bit += 1
+    if not by_bit:
+        return 1
+    result = 1
+    for bit in range(max(by_bit), -1, -1):
+        result *= result
+        if bit in by_bit:
+            result *= product(by_bit[bit])
+    return result
+
+
+def factorial(n: int) -> Optional[int]:
+    if isinstance(n, float):
+        # Integral floats are accepted, as in the vectorized kernel.
+        if not n.is_integer():
+            return None
+        n = int(n)
+    if n < 0:
+        return None
+    if n < len(SMALL_FACTORIALS):
+        return SMALL_FACTORIALS[n]
+    # math.factorial already multiplies divide-and-conquer style; a
+    # prime-exponent product is no faster for a single factorial.
+    return math.factorial(n)
+
+
+def double_factorial(n: int) -> Optional[int]:
+    if n < -1:
+        return None
+    if n <= 0:
+        return 1
+    half = n // 2
+    if n % 2 == 0:
+        return factorial(half) << half
+    # (2k+1)!! = (2k+1)! / (2^k k!)
+    return factorial(n) // (factorial(half) << half)
+
+
+def falling_factorial(n: int, k: int) -> Optional[int]:
+    if k < 0:
+        return None
+    if 0 <= n < k:
+        return 0
+    return range_product(n, n - k, -1)
+
+
+def rising_factorial(n: int, k: int) -> Optional[int]:
+    if k < 0:
+        return None
+    return range_product(n, n + k)
+
+
+def multinomial(*counts: int) -> Optional[int]:
+    if any(k < 0 for k in counts):
+        return None
+    total = sum(counts)
+    if total < len(SMALL_FACTORIALS):
+        return SMALL_FACTORIALS[total] // product(SMALL_FACTORIALS[k] for k in counts)
+    exponents = {}
+    for p in _primes_up_to(total):
+        exponent = _legendre(total, p) - sum(_legendre(k, p) for k in counts if k >= p)
+        if exponent:
+            exponents[p] = exponent
+    return _from_prime_exponents(exponents)
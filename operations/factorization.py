@@ -0,0 +1,272 @@
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .memoize import MemoCache, _MISSING
+from .primes import is_prime
+
+
+TRIAL_DIVISION_LIMIT = 10_000
+# Pollard-Brent gets this many iterations before a cofactor is handed to
+# ECM; rho's cost grows with the square root of the smallest factor.
+RHO_ITERATIONS = 1 << 16
+FACTOR_CACHE_SIZE = 65536
+# (B1, B2, curves) per round; each round targets larger factors.
+ECM_SCHEDULE = (
+    (2_000, 150_000, 25),
+    (11_000, 1_100_000, 90),
+    (50_000, 4_000_000, 300),
+)
+_ECM_BABY_STEPS = 2310
+
+FACTOR_CACHE = MemoCache(FACTOR_CACHE_SIZE)
+
+
+@lru_cache(maxsize=1)
+def _trial_primes() -> Tuple[Tuple[int, ...], int]:
+    # Candidates come from the 2-3-5 wheel; the primorial lets a single gcd
+    # decide whether any of them divides n at all.
+    wheel = (4, 2, 4, 2, 4, 6, 2, 6)
+    primes = [2, 3, 5]
+    candidate, step = 7, 0
+    while candidate < TRIAL_DIVISION_LIMIT:
+        if is_prime(candidate):
+            primes.append(candidate)
+        candidate += wheel[step]
+        step = (step + 1) % len(wheel)
+    return tuple(primes), math.prod(primes)
+
+
+def _trial_division(n: int, factors: Dict[int, int]) -> int:
+    primes, primorial = _trial_primes()
+    if n < TRIAL_DIVISION_LIMIT ** 2:
+        # Small n finish before p * p > n; the gcd would cost more.
+        for p in primes:
+            if p * p > n:
+                break
+            if n % p == 0:
+                while n % p == 0:
+                    n //= p
+                    factors[p] = factors.get(p, 0) + 1
+        return n
+    shared = math.gcd(n, primorial)
+    for p in primes:
+        if shared == 1:
+            break
+        if shared % p == 0:
+            shared //= p
+            while n % p == 0:
+                n //= p
+                factors[p] = factors.get(p, 0) + 1
+    return n
+
+
+def _pollard_brent(n: int, c: int, max_iterations: Optional[int]) -> Optional[int]:
+    # Brent's cycle detection with gcds batched over `block` steps; on
+    # overshoot the last block is replayed one step at a time.
+    block = 128
+    y, r, q, g = 2, 1, 1, 1
+    iterations = 0
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            saved = y
+            for _ in range(min(block, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += block
+        iterations += r
+        r *= 2
+        if max_iterations is not None and iterations >= max_iterations and g == 1:
+            return None
+    if g == n:
+        while True:
+            saved = (saved * saved + c) % n
+            g = math.gcd(abs(x - saved), n)
+            if g > 1:
+                break
+    return g if g != n else None
+
+
+def _x_double(x: int, z: int, a24: int, n: int) -> Tuple[int, int]:
+    s = (x + z) * (x + z) % n
+    d = (x - z) * (x - z) % n
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+def _x_add(xp: int, zp: int, xq: int, zq: int, xd: int, zd: int, n: int) -> Tuple[int, int]:
+    u = (xp - zp) * (xq + zq)
+    v = (xp + zp) * (xq - zq)
+    return zd * (u + v) * (u + v) % n, xd * (u - v) * (u - v) % n
+
+
+def _ladder(k: int, x: int, z: int, a24: int, n: int) -> Tuple[int, int]:
+    # Montgomery ladder keeping (mP, (m + 1)P), whose difference is P.
+    x1, z1 = x, z
+    x2, z2 = _x_double(x, z, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            x1, z1 = _x_add(x2, z2, x1, z1, x, z, n)
+            x2, z2 = _x_double(x2, z2, a24, n)
+        else:
+            x2, z2 = _x_add(x1, z1, x2, z2, x, z, n)
+            x1, z1 = _x_double(x1, z1, a24, n)
+    return x1, z1
+
+
+@lru_cache(maxsize=None)
+def _stage_one_multiplier(b1: int) -> int:
+    multiplier = 1
+    for p in range(2, b1 + 1):
+        if is_prime(p):
+            power = p
+            while power * p <= b1:
+                power *= p
+            multiplier *= power
+    return multiplier
+
+
+def _ecm_curve(n: int, sigma: int, b1: int, b2: int) -> Optional[int]:
+    # Suyama's parametrisation of a Montgomery curve with a point of known
+    # coordinates; a24 = (A + 2) / 4.
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    x, z = pow(u, 3, n), pow(v, 3, n)
+    denominator = 16 * pow(u, 3, n) * v % n
+    g = math.gcd(denominator, n)
+    if g != 1:
+        return g if g != n else None
+    a24 = pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n) % n
+
+    x, z = _ladder(_stage_one_multiplier(b1), x, z, a24, n)
+    g = math.gcd(z, n)
+    if g != 1:
+        return g if g != n else None
+
+    # Stage 2: primes q = m*D +- j in (b1, b2] are caught by the cross
+    # product of the giant step mDQ and the baby step jQ.
+    D = _ECM_BABY_STEPS
+    baby = {}
+    x2, z2 = _x_double(x, z, a24, n)
+    previous, current = (x, z), (x, z)
+    baby[1] = current
+    x3, z3 = _x_add(x2, z2, x, z, x, z, n)
+    previous, current = current, (x3, z3)
+    for j in range(3, D // 2, 2):
+        if math.gcd(j, D) == 1:
+            baby[j] = current
+        following = _x_add(*current, x2, z2, *previous, n)
+        previous, current = current, following
+    xd, zd = _ladder(D, x, z, a24, n)
+    start = max(2, b1 // D)
+    giant_previous = _ladder((start - 1) * D, x, z, a24, n)
+    giant = _ladder(start * D, x, z, a24, n)
+    accumulator = 1
+    for m in range(start, b2 // D + 1):
+        xg, zg = giant
+        for j, (xb, zb) in baby.items():
+            if is_prime(m * D - j) or is_prime(m * D + j):
+                accumulator = accumulator * (xg * zb - xb * zg) % n
+        giant, giant_previous = _x_add(xg, zg, xd, zd, *giant_previous, n), giant
+    g = math.gcd(accumulator, n)
+    return g if 1 < g < n else None
+
+
+def _ecm(n: int) -> Optional[int]:
+    sigma = 6
+    for b1, b2, curves in ECM_SCHEDULE:
+        for _ in range(curves):
+            factor = _ecm_curve(n, sigma, b1, b2)
+            if factor is not None:
+                return factor
+            sigma += 1
+    return None
+
+
+def _integer_root(n: int, exponent: int) -> int:
+    x = 1 << -(-n.bit_length() // exponent)
+    while True:
+        y = ((exponent - 1) * x + n // x ** (exponent - 1)) // exponent
+        if y >= x:
+            return x
+        x = y
+
+
+def _perfect_power(n: int) -> Optional[Tuple[int, int]]:
+    # Called after trial division, so every prime factor exceeds the trial
+    # limit and bounds the exponent.
+    max_exponent = n.bit_length() // (TRIAL_DIVISION_LIMIT.bit_length() - 1)
+    for exponent in range(2, max_exponent + 1):
+        if not is_prime(exponent):
+            continue
+        root = math.isqrt(n) if exponent == 2 else _integer_root(n, exponent)
+        if root ** exponent == n:
+            return root, exponent
+    return None
+
+
+def _split(n: int, use_ecm: bool) -> int:
+    factor = _pollard_brent(n, 1, RHO_ITERATIONS)
+    if factor is None and use_ecm:
+        factor = _ecm(n)
+    c = 2
+    while factor is None:
+        factor = _pollard_brent(n, c, None)
+        c += 1
+    return factor
+
+
+def _factor_composite(n: int, factors: Dict[int, int], multiplicity: int, use_ecm: bool):
+    if n == 1:
+        return
+    if is_prime(n):
+        factors[n] = factors.get(n, 0) + multiplicity
+        return
+    power = _perfect_power(n)
+    if power is not None:
+        _factor_composite(power[0], factors, multiplicity * power[1], use_ecm)
+        return
+    cached = FACTOR_CACHE.get(n)
+    if cached is not _MISSING:
+        for p, e in cached:
+            factors[p] = factors.get(p, 0) + e * multiplicity
+        return
+    d = _split(n, use_ecm)
+    _factor_composite(d, factors, multiplicity, use_ecm)
+    _factor_composite(n // d, factors, multiplicity, use_ecm)
+
+
+def factorize(n: int, use_ecm: bool = True) -> Optional[Dict[int, int]]:
+    if n <= 0:
+        return None
+    factors: Dict[int, int] = {}
+    if n < TRIAL_DIVISION_LIMIT ** 2:
+        # Trial division alone settles these faster than a cache lookup.
+        rest = _trial_division(n, factors)
+        if rest > 1:
+            factors[rest] = factors.get(rest, 0) + 1
+        return factors
+    cached = FACTOR_CACHE.get(n)
+    if cached is not _MISSING:
+        return dict(cached)
+    rest = _trial_division(n, factors)
+    if rest > 1:
+        if rest < TRIAL_DIVISION_LIMIT ** 2:
+            factors[rest] = factors.get(rest, 0) + 1
+        else:
+            _factor_composite(rest, factors, 1, use_ecm)
+    result = tuple(sorted(factors.items()))
+    FACTOR_CACHE.put(n, result)
+    return dict(result)
+
+
+def prime_factors(n: int, use_ecm: bool = True) -> Optional[List[int]]:
+    factors = factorize(n, use_ecm)
+    if factors is None:
+        return None
+    return [p for p, e in factors.items() for _ in range(e)]
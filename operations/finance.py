@@ -1,8 +1,16 @@
 import math
 from typing import Optional
 
+import numpy as np
+
+from . import amortization, cashflow
+from .dual import Dual
+
 
 class FinanceOperations:
+    # Generators can only be consumed once, so they are never memoized.
+    IMPURE_OPERATIONS = frozenset({'amortization_rows', 'amortization_batch'})
+
     @staticmethod
     def simple_interest(principal: float, rate: float, time: float) -> float:
         return principal * (1 + (rate / 100) * time)
@@ -38,19 +46,37 @@ class FinanceOperations:
 
     @staticmethod
     def internal_rate_of_return(cash_flows: list, guess: float = 0.1) -> Optional[float]:
-        def npv_at_rate(rate):
-            return sum(cf / math.pow(1 + rate, i) for i, cf in enumerate(cash_flows))
-        
+        flows = np.asarray(cash_flows, dtype=float)
+        exponents = -np.arange(flows.size, dtype=float)
         rate = guess
         for _ in range(100):
-            npv = npv_at_rate(rate)
+            # Seeding the rate as a dual number gives the NPV and its slope
+            # from one vectorized pass over the cash flows.
+            with np.errstate(all='ignore'):
+                terms = flows * (1 + Dual(rate, 1.0)) ** exponents
+            npv, derivative = terms.value.sum(), terms.grad.sum()
             if abs(npv) < 0.0001:
-                return rate * 100
-            derivative = sum(-i * cf / math.pow(1 + rate, i + 1) for i, cf in enumerate(cash_flows))
-            if derivative == 0:
-                return None
+                return float(rate * 100)
+            if derivative == 0 or not math.isfinite(npv):
+                break
             rate = rate - npv / derivative
-        return None
+        # Newton's method stalled or diverged: bisect a bracketed root.
+        rates, _ = cashflow.internal_rate_of_return_batch(flows, guess)
+        return float(rates) if math.isfinite(rates) else None
+
+    @staticmethod
+    def net_present_value_batch(rates, cash_flows, masked: bool = False):
+        return cashflow.net_present_value_batch(rates, cash_flows, masked)
+
+    @staticmethod
+    def net_present_value_grid(rates, cash_flows, masked: bool = False):
+        return cashflow.net_present_value_grid(rates, cash_flows, masked)
+
+    @staticmethod
+    def internal_rate_of_return_batch(cash_flows, guess: float = cashflow.DEFAULT_GUESS,
+                                      tol: float = cashflow.DEFAULT_TOLERANCE,
+                                      max_iterations: int = cashflow.DEFAULT_MAX_ITERATIONS, masked: bool = False):
+        return cashflow.internal_rate_of_return_batch(cash_flows, guess, tol, max_iterations, masked)
 
     @staticmethod
     def payment(principal: float, rate: float, n_periods: int) -> Optional[float]:
@@ -77,7 +103,28 @@ class FinanceOperations:
         pmt = FinanceOperations.payment(principal, rate, n_periods)
         if pmt is None:
             return None
-        return principal * math.pow(1 + r, payments_made) - pmt * (math.pow(1 + r, payments_made) - 1) / r
+        if r == 0:
+            return principal - pmt * payments_made
+        growth = math.pow(1 + r, payments_made)
+        return principal * growth - pmt * (growth - 1) / r
+
+    @staticmethod
+    def amortization_schedule(principal: float, rate: float, n_periods: int,
+                              extra_payments: Optional[amortization.ExtraPayments] = None,
+                              rate_changes: Optional[amortization.RateChanges] = None) -> Optional[dict]:
+        if principal <= 0 or n_periods <= 0:
+            return None
+        return amortization.amortization_schedule(principal, rate, n_periods, extra_payments, rate_changes)
+
+    @staticmethod
+    def amortization_rows(principal: float, rate: float, n_periods: int,
+                          extra_payments: Optional[amortization.ExtraPayments] = None,
+                          rate_changes: Optional[amortization.RateChanges] = None):
+        return amortization.amortization_rows(principal, rate, n_periods, extra_payments, rate_changes)
+
+    @staticmethod
+    def amortization_batch(principals, rates, n_periods: int, extra_payments=0.0, rate_changes=None):
+        return amortization.amortization_batch(principals, rates, n_periods, extra_payments, rate_changes)
 
     @staticmethod
     def depreciation_straight_line(cost: float, salvage: float, life: float) -> float:
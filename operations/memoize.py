@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    bypassed: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class MemoCache:
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.stats.misses += 1
+                return _MISSING
+            value, expires = entry
+            if expires is not None and self.clock() >= expires:
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                self.stats.size = len(self._entries)
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            expires = self.clock() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+            self.stats.size = len(self._entries)
+
+    def bypass(self):
+        with self._lock:
+            self.stats.bypassed += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    hash(value)
+    return (type(value), value)
+
+
+def _copy_result(value):
+    # Containers are copied down to their arrays so that callers cannot
+    # change the cached value.
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, list):
+        return [_copy_result(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_result(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        items = [_copy_result(v) for v in value]
+        return type(value)(*items) if hasattr(value, '_fields') else tuple(items)
+    return value
+
+
+def memoize(function: Callable, cache: MemoCache) -> Callable:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (_freeze(args), _freeze(kwargs))
+        except TypeError:
+            # Unhashable arguments such as NumPy arrays are passed straight through.
+            cache.bypass()
+            return function(*args, **kwargs)
+        value = cache.get(key)
+        if value is _MISSING:
+            value = function(*args, **kwargs)
+            if isinstance(value, Iterator):
+                # A generator can only be consumed once.
+                cache.bypass()
+                return value
+            cache.put(key, value)
+        return _copy_result(value)
+
+    wrapper.cache = cache
+    return wrapper
+
+
+class MemoizedOperations:
+    def __init__(self, operations_class: type, maxsize: int = 256, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.operations_class = operations_class
+        self.caches: Dict[str, MemoCache] = {}
+        impure = getattr(operations_class, 'IMPURE_OPERATIONS', frozenset())
+        for name, attribute in vars(operations_class).items():
+            if name.startswith('_') or name in impure or not isinstance(attribute, staticmethod):
+                continue
+            cache = MemoCache(maxsize, ttl, clock)
+            self.caches[name] = cache
+            setattr(self, name, memoize(getattr(operations_class, name), cache))
+
+    def __getattr__(self, name: str):
+        return getattr(self.operations_class, name)
+
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        return {name: cache.stats for name, cache in self.caches.items()}
+
+    def cache_clear(self):
+        for cache in self.caches.values():
+            cache.clear()
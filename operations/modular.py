@@ -0,0 +1,177 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .primes import is_prime
+
+
+# Tables are never grown past this many entries; larger Lucas digits fall
+# back to an O(r) product.
+TABLE_LIMIT = 1 << 22
+# Below this modulus every product of two residues fits in int64.
+_INT64_MODULUS = 1 << 31
+
+
+class FactorialTable:
+    def __init__(self, modulus: int):
+        self.modulus = modulus
+        self.dtype = np.int64 if modulus < _INT64_MODULUS else object
+        self.factorials = np.ones(1, dtype=self.dtype)
+        self.inverse_factorials = np.ones(1, dtype=self.dtype)
+
+    @property
+    def size(self) -> int:
+        return len(self.factorials)
+
+    def extend(self, n: int):
+        # Tables only go up to modulus - 1, where every k! is invertible;
+        # they grow at least geometrically so repeated queries stay O(1).
+        top = min(max(n, 2 * self.size), self.modulus - 1, TABLE_LIMIT)
+        start = self.size
+        if top < start:
+            return
+        p = self.modulus
+        factorials = [int(self.factorials[-1])]
+        for k in range(start, top + 1):
+            factorials.append(factorials[-1] * k % p)
+        inverses = [pow(factorials[-1], -1, p)]
+        for k in range(top, start, -1):
+            inverses.append(inverses[-1] * k % p)
+        inverses.reverse()
+        self.factorials = np.concatenate([self.factorials, np.array(factorials[1:], dtype=self.dtype)])
+        self.inverse_factorials = np.concatenate([self.inverse_factorials, np.array(inverses, dtype=self.dtype)])
+
+    def covers(self, n: int) -> bool:
+        if n >= self.size:
+            self.extend(n)
+        return n < self.size
+
+    def comb(self, n: int, r: int) -> int:
+        # Requires 0 <= r <= n < modulus.
+        p = self.modulus
+        if self.covers(n):
+            inverses = self.inverse_factorials
+            return int(self.factorials[n]) * int(inverses[r]) % p * int(inverses[n - r]) % p
+        r = min(r, n - r)
+        numerator = denominator = 1
+        for k in range(r):
+            numerator = numerator * (n - k) % p
+            denominator = denominator * (k + 1) % p
+        return numerator * pow(denominator, -1, p) % p
+
+    def perm(self, n: int, r: int) -> int:
+        # Requires 0 <= r <= n < modulus.
+        p = self.modulus
+        if self.covers(n):
+            return int(self.factorials[n]) * int(self.inverse_factorials[n - r]) % p
+        result = 1
+        for k in range(n - r + 1, n + 1):
+            result = result * k % p
+        return result
+
+
+@lru_cache(maxsize=16)
+def factorial_table(modulus: int) -> FactorialTable:
+    return FactorialTable(modulus)
+
+
+@lru_cache(maxsize=64)
+def _prime_modulus(modulus: int) -> bool:
+    return is_prime(modulus)
+
+
+def _valid(n: int, r: int, modulus: int) -> bool:
+    return 0 <= r <= n and _prime_modulus(modulus)
+
+
+def comb_mod(n: int, r: int, modulus: int) -> Optional[int]:
+    if not _valid(n, r, modulus):
+        return None
+    table = factorial_table(modulus)
+    result = 1
+    # Lucas' theorem: C(n, r) is the product of C(n_i, r_i) over the base-p
+    # digits, so only residues below the modulus are ever looked up.
+    while r:
+        n_digit, r_digit = n % modulus, r % modulus
+        if r_digit > n_digit:
+            return 0
+        result = result * table.comb(n_digit, r_digit) % modulus
+        n //= modulus
+        r //= modulus
+    return result
+
+
+def perm_mod(n: int, r: int, modulus: int) -> Optional[int]:
+    if not _valid(n, r, modulus):
+        return None
+    # n (n - 1) ... (n - r + 1) includes a multiple of p unless the whole
+    # run sits strictly between two multiples.
+    if r >= modulus or n // modulus != (n - r) // modulus:
+        return 0
+    return factorial_table(modulus).perm(n % modulus, r)
+
+
+def _batch_inputs(n, r, modulus: int) -> Tuple[np.ndarray, np.ndarray, bool]:
+    n, r = np.broadcast_arrays(np.asarray(n), np.asarray(r))
+    vectorized = n.size and n.dtype.kind in 'iu' and r.dtype.kind in 'iu' and modulus < _INT64_MODULUS
+    return n, r, bool(vectorized)
+
+
+def _scalar_batch(function, n: np.ndarray, r: np.ndarray, modulus: int) -> np.ma.MaskedArray:
+    values = [function(int(a), int(b), modulus) for a, b in zip(n.ravel().tolist(), r.ravel().tolist())]
+    mask = np.array([v is None for v in values], dtype=bool).reshape(n.shape)
+    data = np.array([0 if v is None else v for v in values], dtype=object).reshape(n.shape)
+    return np.ma.masked_array(data, mask=mask)
+
+
+def _table_arrays(modulus: int, largest: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    table = factorial_table(modulus)
+    if not table.covers(largest):
+        return None
+    return table.factorials, table.inverse_factorials
+
+
+def comb_mod_batch(n, r, modulus: int) -> Optional[np.ma.MaskedArray]:
+    if not _prime_modulus(modulus):
+        return None
+    original_n, original_r, vectorized = _batch_inputs(n, r, modulus)
+    if not vectorized:
+        return _scalar_batch(comb_mod, original_n, original_r, modulus)
+    n, r = original_n.astype(np.int64), original_r.astype(np.int64)
+    invalid = (r < 0) | (r > n)
+    n, r = np.where(invalid, 0, n), np.where(invalid, 0, r)
+    result = np.ones(n.shape, dtype=np.int64)
+    while r.any():
+        n_digit, r_digit = n % modulus, r % modulus
+        zero = r_digit > n_digit
+        r_digit = np.where(zero, 0, r_digit)
+        tables = _table_arrays(modulus, int(n_digit.max()))
+        if tables is None:
+            return _scalar_batch(comb_mod, original_n, original_r, modulus)
+        factorials, inverses = tables
+        digit = factorials[n_digit] * inverses[r_digit] % modulus * inverses[n_digit - r_digit] % modulus
+        result = np.where(zero, 0, result * digit % modulus)
+        n //= modulus
+        r //= modulus
+    return np.ma.masked_array(result, mask=invalid)
+
+
+def perm_mod_batch(n, r, modulus: int) -> Optional[np.ma.MaskedArray]:
+    if not _prime_modulus(modulus):
+        return None
+    original_n, original_r, vectorized = _batch_inputs(n, r, modulus)
+    if not vectorized:
+        return _scalar_batch(perm_mod, original_n, original_r, modulus)
+    n, r = original_n.astype(np.int64), original_r.astype(np.int64)
+    invalid = (r < 0) | (r > n)
+    n, r = np.where(invalid, 0, n), np.where(invalid, 0, r)
+    zero = (r >= modulus) | (n // modulus != (n - r) // modulus)
+    high = np.where(zero, 0, n % modulus)
+    low = np.where(zero, 0, high - r)
+    tables = _table_arrays(modulus, int(high.max()))
+    if tables is None:
+        return _scalar_batch(perm_mod, original_n, original_r, modulus)
+    factorials, inverses = tables
+    result = np.where(zero, 0, factorials[high] * inverses[low] % modulus)
+    return np.ma.masked_array(result, mask=invalid)
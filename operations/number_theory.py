@@ -0,0 +1,239 @@
+import math
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .factorization import factorize
+from .sieve import odd_base_primes
+
+
+def totient(n: int) -> Optional[int]:
+    factors = factorize(n)
+    if factors is None:
+        return None
+    result = n
+    for p in factors:
+        result = result // p * (p - 1)
+    return result
+
+
+def divisor_count(n: int) -> Optional[int]:
+    factors = factorize(n)
+    if factors is None:
+        return None
+    return math.prod(e + 1 for e in factors.values())
+
+
+def divisor_sum(n: int, k: int = 1) -> Optional[int]:
+    factors = factorize(n)
+    if factors is None or k < 0:
+        return None
+    if k == 0:
+        return math.prod(e + 1 for e in factors.values())
+    return math.prod((p ** (k * (e + 1)) - 1) // (p ** k - 1) for p, e in factors.items())
+
+
+def divisors(n: int) -> Optional[list]:
+    factors = factorize(n)
+    if factors is None:
+        return None
+    result = [1]
+    for p, e in factors.items():
+        result = [d * p ** i for d in result for i in range(e + 1)]
+    return sorted(result)
+
+
+def mobius(n: int) -> Optional[int]:
+    factors = factorize(n)
+    if factors is None:
+        return None
+    if any(e > 1 for e in factors.values()):
+        return 0
+    return -1 if len(factors) % 2 else 1
+
+
+def mod_inverse(a: int, m: int) -> Optional[int]:
+    if m <= 0:
+        return None
+    try:
+        return pow(a, -1, m)
+    except ValueError:
+        return None
+
+
+def mod_pow(base: int, exponent: int, modulus: int) -> Optional[int]:
+    if modulus <= 0:
+        return None
+    try:
+        return pow(base, exponent, modulus)
+    except ValueError:
+        return None
+
+
+def crt(remainders: Iterable[int], moduli: Iterable[int]) -> Optional[Tuple[int, int]]:
+    # Returns (x, m) with x the smallest non-negative solution modulo
+    # m = lcm(moduli); moduli need not be coprime.
+    x, m = 0, 1
+    remainders, moduli = list(remainders), list(moduli)
+    if len(remainders) != len(moduli):
+        return None
+    for r, modulus in zip(remainders, moduli):
+        if modulus <= 0:
+            return None
+        g = math.gcd(m, modulus)
+        if (r - x) % g:
+            return None
+        step = modulus // g
+        t = (r - x) // g * pow(m // g, -1, step) % step
+        x += m * t
+        m *= step
+        x %= m
+    return x, m
+
+
+def _integer_list(values) -> List[int]:
+    if isinstance(values, np.ndarray):
+        return values.ravel().tolist()
+    return [int(v) for v in values]
+
+
+def gcd_many(values: Iterable[int]) -> int:
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'iu':
+        return int(np.gcd.reduce(values, axis=None)) if values.size else 0
+    return math.gcd(*_integer_list(values))
+
+
+def _balanced_reduce(function: Callable[[int, int], int], values: list, empty: int) -> int:
+    # Pairing neighbours keeps operands of similar size, like factorial.product.
+    if not values:
+        return empty
+    while len(values) > 1:
+        paired = [function(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def lcm_many(values: Iterable[int]) -> int:
+    # Always exact: NumPy's lcm.reduce would silently wrap around in int64.
+    return abs(_balanced_reduce(math.lcm, _integer_list(values), 1))
+
+
+def gcd_array(a, b) -> np.ndarray:
+    a, b = np.asarray(a), np.asarray(b)
+    if a.dtype.kind in 'iu' and b.dtype.kind in 'iu':
+        return np.gcd(a, b)
+    return np.frompyfunc(lambda x, y: math.gcd(int(x), int(y)), 2, 1)(a, b)
+
+
+def product_tree(values: List[int]) -> List[List[int]]:
+    tree = [list(values)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        parent = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parent.append(level[-1])
+        tree.append(parent)
+    return tree
+
+
+def batch_gcd(moduli: Iterable[int]) -> Optional[List[int]]:
+    # Bernstein's batch gcd: the remainder tree reduces the product P of all
+    # moduli to P mod n**2 for each n, and gcd(P mod n**2 / n, n) is the gcd
+    # of n with the product of all the other moduli.
+    moduli = _integer_list(moduli)
+    if any(n <= 0 for n in moduli):
+        return None
+    if not moduli:
+        return []
+    tree = product_tree(moduli)
+    remainders = tree[-1]
+    for level in reversed(tree[:-1]):
+        remainders = [remainders[i // 2] % (n * n) for i, n in enumerate(level)]
+    return [math.gcd(r // n, n) for r, n in zip(remainders, moduli)]
+
+
+def _multiplicative_range(start: int, stop: int, f: Callable[[object, np.ndarray], np.ndarray]) -> np.ndarray:
+    # Evaluates the multiplicative function with f(p, e) = value at p**e
+    # for every n in [start, stop). Every n has at most one prime factor
+    # above sqrt(stop), which is what remains once the base primes are
+    # divided out.
+    size = max(0, stop - start)
+    result = np.ones(size, dtype=np.int64)
+    rest = np.arange(start, start + size, dtype=np.int64)
+    primes = np.concatenate([[2], odd_base_primes(math.isqrt(max(stop - 1, 0)))]).astype(np.int64)
+    # Primes with many multiples in the window are handled one slice at a
+    # time; the rest hit it only a few times each and are batched.
+    split = np.searchsorted(primes, max(2, size // 64), 'right')
+    for p in primes[:split].tolist():
+        first = -(-start // p) * p - start
+        if first >= size:
+            continue
+        exponent = np.zeros(len(range(first, size, p)), dtype=np.int64)
+        power = p
+        while power < stop:
+            # Multiples of p**k are every p**(k-1)-th multiple of p.
+            offset = -(-start // power) * power - start
+            if offset >= size:
+                break
+            rest[offset::power] //= p
+            exponent[(offset - first) // p::power // p] += 1
+            power *= p
+        result[first::p] *= f(p, exponent)
+
+    large = primes[split:]
+    if len(large):
+        first = -(-start // large) * large - start
+        counts = np.maximum(0, -(-(size - first) // large))
+        owner = np.repeat(np.arange(len(large)), counts)
+        step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        p = large[owner]
+        index = first[owner] + step * p
+        exponent = np.ones(len(index), dtype=np.int64)
+        part = rest[index] // p
+        divisible = part % p == 0
+        while divisible.any():
+            exponent += divisible
+            part[divisible] //= p[divisible]
+            divisible = part % p == 0
+        # One n can appear for several primes, so the updates are unbuffered.
+        np.multiply.at(result, index, f(p, exponent))
+        np.floor_divide.at(rest, index, p ** exponent)
+
+    index = np.flatnonzero(rest > 1)
+    result[index] *= f(rest[index], np.ones(len(index), dtype=np.int64))
+    return result
+
+
+def _prime_power_divisor_sum(p, e: np.ndarray) -> np.ndarray:
+    # 1 + p + ... + p**e by Horner's rule; (p**(e + 1) - 1) // (p - 1)
+    # would overflow int64 for the large leftover primes.
+    total = np.ones(len(e), dtype=np.int64)
+    for k in range(int(e.max(initial=0))):
+        total = np.where(e > k, total * p + 1, total)
+    return total
+
+
+def totient_range(start: int, stop: int) -> Optional[np.ndarray]:
+    if start < 1:
+        return None
+    return _multiplicative_range(start, stop, lambda p, e: p ** (e - 1) * (p - 1))
+
+
+def mobius_range(start: int, stop: int) -> Optional[np.ndarray]:
+    if start < 1:
+        return None
+    return _multiplicative_range(start, stop, lambda p, e: np.where(e > 1, 0, -1))
+
+
+def divisor_count_range(start: int, stop: int) -> Optional[np.ndarray]:
+    if start < 1:
+        return None
+    return _multiplicative_range(start, stop, lambda p, e: e + 1)
+
+
+def divisor_sum_range(start: int, stop: int) -> Optional[np.ndarray]:
+    if start < 1:
+        return None
+    return _multiplicative_range(start, stop, _prime_power_divisor_sum)
@@ -0,0 +1,164 @@
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from .batch import compile_batch
+from .expression import ExpressionError
+
+
+DEFAULT_SAMPLES = 512
+DEFAULT_MAX_DEPTH = 8
+# Midpoints are added where the curve leaves its chord by more than this
+# fraction of the plotted height.
+DEFAULT_TOLERANCE = 1e-3
+# Uniform samples per pixel before adaptive refinement.
+SAMPLES_PER_PIXEL = 2
+# The cache is rebuilt from the visible range once it grows past this.
+MAX_CACHED_POINTS = 1 << 20
+
+Curve = Tuple[np.ndarray, np.ndarray]
+CurveFunction = Callable[[np.ndarray], np.ndarray]
+
+
+def curve_function(expression: str, var: str = 'x') -> CurveFunction:
+    # Vectorized y = f(x); undefined and complex values come back as NaN so
+    # they show as gaps in the curve.
+    kernel, names = compile_batch(expression)
+    missing = [name for name in names if name != var]
+    if missing:
+        raise ExpressionError(f"Missing values for {', '.join(missing)}")
+
+    def f(x: np.ndarray) -> np.ndarray:
+        with np.errstate(all='ignore'):
+            y = np.asarray(kernel(**{var: x}) if names else kernel())
+        if np.iscomplexobj(y):
+            y = np.where(y.imag == 0, y.real, np.nan)
+        y = np.array(np.broadcast_to(y, x.shape), dtype=float)
+        y[~np.isfinite(y)] = np.nan
+        return y
+    return f
+
+
+def tabulate(expression: str, var: str, start: float, stop: float, n: int = DEFAULT_SAMPLES) -> Curve:
+    x = np.linspace(start, stop, n)
+    return x, curve_function(expression, var)(x)
+
+
+def _scale(y: np.ndarray) -> float:
+    # Percentiles keep a pole from flattening the rest of the curve.
+    finite = y[np.isfinite(y)]
+    if finite.size < 2:
+        return 1.0
+    low, high = np.percentile(finite, [2, 98])
+    return float(high - low) or 1.0
+
+
+def adaptive_sample(f: CurveFunction, start: float, stop: float, samples: int = DEFAULT_SAMPLES,
+                    max_depth: int = DEFAULT_MAX_DEPTH, tolerance: float = DEFAULT_TOLERANCE,
+                    scale: Optional[float] = None) -> Curve:
+    # Starts from a uniform grid and, level by level, halves the segments
+    # next to a point that leaves its chord or where the curve starts or
+    # stops being defined. All new midpoints of a level are evaluated in
+    # one call.
+    x = np.linspace(start, stop, max(samples, 2))
+    y = f(x)
+    limit = tolerance * (scale if scale is not None else _scale(y))
+    smallest = abs(stop - start) * 1e-9
+    for _ in range(max_depth):
+        dx = np.diff(x)
+        with np.errstate(all='ignore'):
+            chord = y[:-2] + (y[2:] - y[:-2]) * (dx[:-1] / (x[2:] - x[:-2]))
+        bent = np.abs(y[1:-1] - chord) > limit
+        refine = np.zeros(dx.size, dtype=bool)
+        refine[:-1] |= bent
+        refine[1:] |= bent
+        refine |= np.isnan(y[:-1]) != np.isnan(y[1:])
+        refine &= dx > smallest
+        segments = np.flatnonzero(refine)
+        if not segments.size:
+            break
+        middle = 0.5 * (x[segments] + x[segments + 1])
+        x = np.insert(x, segments + 1, middle)
+        y = np.insert(y, segments + 1, f(middle))
+    return x, y
+
+
+def decimate(x: np.ndarray, y: np.ndarray, x_min: float, x_max: float, width: int) -> Curve:
+    # Min/max decimation: each pixel column keeps its first, lowest,
+    # highest and last point, which draws the same pixels as the full
+    # curve. One point beyond each edge keeps the line running off-screen.
+    lo = max(int(np.searchsorted(x, x_min)) - 1, 0)
+    hi = int(np.searchsorted(x, x_max, side='right')) + 1
+    x, y = x[lo:hi], y[lo:hi]
+    if x.size <= 4 * width or x_max <= x_min:
+        return x, y
+    column = np.floor((x - x_min) * (width / (x_max - x_min))).astype(np.int64)
+    starts = np.flatnonzero(np.concatenate([[True], column[1:] != column[:-1]]))
+    ends = np.concatenate([starts[1:], [x.size]]) - 1
+    first, last = y[starts], y[ends]
+    with np.errstate(all='ignore'):
+        low, high = np.fmin.reduceat(y, starts), np.fmax.reduceat(y, starts)
+    rising = ~(first > last)
+    middle = 0.5 * (x[starts] + x[ends])
+    xs = np.stack([x[starts], middle, middle, x[ends]], axis=1)
+    ys = np.stack([first, np.where(rising, low, high), np.where(rising, high, low), last], axis=1)
+    return xs.ravel(), ys.ravel()
+
+
+class CurveSampler:
+    # Keeps the samples of the range seen so far. Panning samples only the
+    # strip that came into view; zooming in past the cached resolution
+    # resamples the visible range.
+    def __init__(self, expression: str, var: str = 'x', max_depth: int = DEFAULT_MAX_DEPTH,
+                 tolerance: float = DEFAULT_TOLERANCE):
+        self.expression = expression
+        self.function = curve_function(expression, var)
+        self.max_depth = max_depth
+        self.tolerance = tolerance
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.step = 0.0
+        self.scale: Optional[float] = None
+        self.evaluations = 0
+
+    def _f(self, x: np.ndarray) -> np.ndarray:
+        self.evaluations += x.size
+        return self.function(x)
+
+    def _sample(self, start: float, stop: float, step: float) -> Curve:
+        samples = int(np.ceil((stop - start) / step)) + 1
+        return adaptive_sample(self._f, start, stop, samples, self.max_depth, self.tolerance, self.scale)
+
+    def sample(self, x_min: float, x_max: float, width: int) -> Curve:
+        step = (x_max - x_min) / (max(width, 1) * SAMPLES_PER_PIXEL)
+        if (not self.x.size or step < self.step / 2 or self.x.size > MAX_CACHED_POINTS
+                or x_max < self.x[0] or x_min > self.x[-1]):
+            self.step = step
+            self.scale = None
+            self.x, self.y = self._sample(x_min, x_max, step)
+            self.scale = _scale(self.y)
+            return self.x, self.y
+        # Zooming out samples the new strips at the coarser step.
+        step = max(step, self.step)
+        if x_min < self.x[0]:
+            x, y = self._sample(x_min, self.x[0], step)
+            self.x, self.y = np.concatenate([x[:-1], self.x]), np.concatenate([y[:-1], self.y])
+        if x_max > self.x[-1]:
+            x, y = self._sample(self.x[-1], x_max, step)
+            self.x, self.y = np.concatenate([self.x, x[1:]]), np.concatenate([self.y, y[1:]])
+        self.step = max(self.step, step)
+        return self.x, self.y
+
+    def visible(self, x_min: float, x_max: float, width: int) -> Curve:
+        x, y = self.sample(x_min, x_max, width)
+        return decimate(x, y, x_min, x_max, width)
+
+    def y_range(self) -> Tuple[float, float]:
+        finite = self.y[np.isfinite(self.y)]
+        if not finite.size:
+            return -1.0, 1.0
+        low, high = np.percentile(finite, [2, 98])
+        if high == low:
+            return float(low) - 1, float(high) + 1
+        margin = 0.1 * (high - low)
+        return float(low - margin), float(high + margin)
@@ -0,0 +1,148 @@
+import math
+from functools import lru_cache
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+
+# Odd numbers below this limit are answered from a bit-packed sieve.
+SIEVE_LIMIT = 1 << 22
+# These Miller-Rabin bases are a proof of primality below 2**64.
+DETERMINISTIC_LIMIT = 1 << 64
+_DETERMINISTIC_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+_TRIAL_PRIMES_LIMIT = 1000
+
+
+@lru_cache(maxsize=1)
+def _sieve() -> Tuple[np.ndarray, bytes]:
+    # Bit i stands for the odd number 2i + 1.
+    flags = np.ones(SIEVE_LIMIT // 2, dtype=bool)
+    flags[0] = False
+    for i in range(1, (math.isqrt(SIEVE_LIMIT) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            flags[p * p // 2::p] = False
+    bits = np.packbits(flags, bitorder='little')
+    return bits, bits.tobytes()
+
+
+@lru_cache(maxsize=1)
+def _small_primorial() -> int:
+    return math.prod(p for p in range(3, _TRIAL_PRIMES_LIMIT, 2) if _sieve_lookup(p))
+
+
+def _sieve_lookup(n: int) -> bool:
+    i = n >> 1
+    return bool(_sieve()[1][i >> 3] >> (i & 7) & 1)
+
+
+def is_strong_probable_prime(n: int, base: int) -> bool:
+    base %= n
+    if base == 0:
+        return True
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _jacobi(a: int, n: int) -> int:
+    a %= n
+    result = 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def is_strong_lucas_probable_prime(n: int) -> bool:
+    if n == 2:
+        return True
+    if n < 2 or not n & 1 or math.isqrt(n) ** 2 == n:
+        return False
+    # Selfridge's parameters: the first D in 5, -7, 9, -11, ... with (D/n) = -1.
+    D = 5
+    while True:
+        jacobi = _jacobi(D, n)
+        if jacobi == -1:
+            break
+        if jacobi == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    # Binary ladder for U_d, V_d and Q^d, halving exactly since n is odd.
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == '1':
+            U, V = P * U + V, D * U + P * V
+            U = ((U + n if U & 1 else U) >> 1) % n
+            V = ((V + n if V & 1 else V) >> 1) % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def is_prime(n: int) -> bool:
+    if n < SIEVE_LIMIT:
+        if n < 3:
+            return n == 2
+        return bool(n & 1) and _sieve_lookup(n)
+    if not n & 1 or math.gcd(n, _small_primorial()) != 1:
+        return False
+    if n < DETERMINISTIC_LIMIT:
+        return all(is_strong_probable_prime(n, base) for base in _DETERMINISTIC_BASES)
+    # Baillie-PSW: no composite is known to pass both tests.
+    return is_strong_probable_prime(n, 2) and is_strong_lucas_probable_prime(n)
+
+
+def _sieve_lookup_array(values: np.ndarray) -> np.ndarray:
+    index = values >> 1
+    bits = _sieve()[0]
+    return ((bits[index >> 3] >> (index & 7).astype(np.uint8)) & 1).astype(bool)
+
+
+def is_prime_batch(values: Union[Iterable[int], np.ndarray]) -> np.ndarray:
+    array = np.asarray(values if isinstance(values, np.ndarray) else list(values))
+    if array.dtype.kind == 'f':
+        integral = np.isfinite(array) & (array == np.floor(array)) & (np.abs(array) < 2.0 ** 63)
+        result = np.zeros(array.shape, dtype=bool)
+        result[integral] = is_prime_batch(array[integral].astype(np.int64))
+        return result
+    if array.dtype.kind not in 'iu':
+        return np.array([is_prime(int(value)) for value in array.ravel()], dtype=bool).reshape(array.shape)
+    result = np.zeros(array.shape, dtype=bool)
+    small = (array >= 0) & (array < SIEVE_LIMIT)
+    candidates = array[small].astype(np.int64)
+    result[small] = _sieve_lookup_array(candidates) & (candidates & 1 == 1) | (candidates == 2)
+    large = array >= SIEVE_LIMIT
+    if large.any():
+        # 64-bit modular products overflow NumPy integers, so the few large
+        # values go through the scalar Miller-Rabin path.
+        result[large] = [is_prime(value) for value in array[large].tolist()]
+    return result
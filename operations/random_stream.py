@@ -0,0 +1,91 @@
+import json
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+
+Size = Union[int, Tuple[int, ...]]
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def _valid_size(size: Size) -> bool:
+    sizes = size if isinstance(size, tuple) else (size,)
+    return all(isinstance(n, (int, np.integer)) and n >= 0 for n in sizes)
+
+
+class RandomStream:
+    def __init__(self, seed: Optional[int] = None, seed_sequence: Optional[np.random.SeedSequence] = None):
+        # Without a seed the entropy comes from the OS, but it is kept in
+        # seed_sequence.entropy so the run can still be replayed.
+        self.seed_sequence = seed_sequence if seed_sequence is not None else np.random.SeedSequence(seed)
+        self.generator = np.random.Generator(np.random.PCG64(self.seed_sequence))
+
+    @property
+    def entropy(self) -> int:
+        return self.seed_sequence.entropy
+
+    def spawn(self, n: int) -> List['RandomStream']:
+        # Children get statistically independent streams and are themselves
+        # reproducible from (entropy, spawn_key), like SeedSequence.spawn.
+        return [RandomStream(seed_sequence=child) for child in self.seed_sequence.spawn(n)]
+
+    def uniform(self, size: Size, low: float = 0.0, high: float = 1.0) -> Optional[np.ndarray]:
+        if not _valid_size(size) or low > high:
+            return None
+        if low == 0.0 and high == 1.0:
+            return self.generator.random(size)
+        return self.generator.uniform(low, high, size)
+
+    def integers(self, size: Size, low: int, high: int) -> Optional[np.ndarray]:
+        # Both bounds are inclusive, as in random.randint.
+        if not _valid_size(size) or low > high or low < _INT64_MIN or high > _INT64_MAX:
+            return None
+        return self.generator.integers(low, high, size, dtype=np.int64, endpoint=True)
+
+    def normal(self, size: Size, mean: float = 0.0, std: float = 1.0) -> Optional[np.ndarray]:
+        if not _valid_size(size) or std < 0:
+            return None
+        values = self.generator.standard_normal(size)
+        if std != 1.0:
+            values *= std
+        if mean != 0.0:
+            values += mean
+        return values
+
+    def get_state(self) -> dict:
+        sequence = self.seed_sequence
+        return {
+            'entropy': sequence.entropy,
+            'spawn_key': list(sequence.spawn_key),
+            'n_children_spawned': sequence.n_children_spawned,
+            'bit_generator': self.generator.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        self.seed_sequence = np.random.SeedSequence(
+            state['entropy'], spawn_key=tuple(state['spawn_key']),
+            n_children_spawned=state['n_children_spawned'])
+        bit_generator = np.random.PCG64(self.seed_sequence)
+        bit_generator.state = state['bit_generator']
+        self.generator = np.random.Generator(bit_generator)
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'RandomStream':
+        stream = cls.__new__(cls)
+        stream.set_state(state)
+        return stream
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.get_state(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'RandomStream':
+        with open(path) as f:
+            return cls.from_state(json.load(f))
+
+
+def spawn_streams(seed: Optional[int], n: int) -> List[RandomStream]:
+    return RandomStream(seed).spawn(n)
@@ -0,0 +1,279 @@
+import math
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Optional, Tuple, Union
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from .expression import BinOp, Call, ExpressionError, Node, Num, UnaryOp, Var, compile_expression, parse
+
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_MAX_DIGITS = 1_000_000
+DEFAULT_INLINE_DIGITS = 1000
+FLOAT_DIGITS = 309.0
+_LOG10_2 = math.log10(2)
+_POLL_INTERVAL = 0.05
+
+
+class ResourceLimitError(RuntimeError):
+    pass
+
+
+def _value_digits(value) -> Tuple[float, bool]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return FLOAT_DIGITS, False
+    if isinstance(value, int):
+        return (math.log10(abs(value)) if value else 0.0), True
+    if value == 0 or not math.isfinite(value):
+        return 0.0, False
+    return max(0.0, math.log10(abs(value))), False
+
+
+def _exponent_value(digits: float) -> float:
+    return math.inf if digits > 300 else 10 ** digits
+
+
+def _estimate(node: Node, variables: Dict[str, object]) -> Tuple[float, bool, float]:
+    # Returns an upper bound on log10(|value|), whether the value is an
+    # exact integer (only integers can grow past the float range) and the
+    # bound for the largest value computed anywhere in the subtree, since
+    # log(factorial(n)) is small but costs as much as factorial(n).
+    if isinstance(node, Num):
+        return _with_largest(_value_digits(node.value))
+    if isinstance(node, Var):
+        return _with_largest(_value_digits(variables.get(node.name, 0.0)))
+    if isinstance(node, UnaryOp):
+        return _estimate(node.operand, variables)
+    if isinstance(node, BinOp):
+        left, left_int, left_largest = _estimate(node.left, variables)
+        right, right_int, right_largest = _estimate(node.right, variables)
+        largest = max(left_largest, right_largest)
+        exact = left_int and right_int
+        if node.op in ('+', '-'):
+            digits = max(left, right) + _LOG10_2
+        elif node.op == '*':
+            digits = left + right
+        elif node.op == '/':
+            digits, exact = FLOAT_DIGITS, False
+        elif node.op in ('//', '%'):
+            digits = left
+        else:
+            digits = _exponent_value(right) * max(left, _LOG10_2)
+        digits = digits if exact else min(digits, FLOAT_DIGITS)
+        return digits, exact, max(largest, digits)
+    if isinstance(node, Call):
+        args = [_estimate(arg, variables) for arg in node.args]
+        largest = max(arg[2] for arg in args)
+        if node.name == 'factorial':
+            n = _exponent_value(args[0][0])
+            digits = math.lgamma(n + 1) / math.log(10) if math.isfinite(n) else math.inf
+            return digits, True, max(largest, digits)
+        if node.name == 'abs':
+            return args[0]
+        if node.name == 'sqrt':
+            return min(args[0][0] / 2, FLOAT_DIGITS), False, largest
+        return FLOAT_DIGITS, False, max(largest, FLOAT_DIGITS)
+    raise ExpressionError(f"Unknown node {node!r}")
+
+
+def _with_largest(estimate: Tuple[float, bool]) -> Tuple[float, bool, float]:
+    return estimate[0], estimate[1], estimate[0]
+
+
+def estimate_digits(expression: str, **variables) -> float:
+    return _estimate(parse(expression), variables)[0]
+
+
+def estimate_largest_digits(expression: str, **variables) -> float:
+    return _estimate(parse(expression), variables)[2]
+
+
+def _apply_limits(cpu_seconds: Optional[float], memory_bytes: Optional[int]):
+    if resource is None:
+        return
+    if memory_bytes is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    if cpu_seconds is not None:
+        # RLIMIT_CPU counts the whole process, so each job gets a budget on
+        # top of the CPU time the worker has already used.
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        budget = math.ceil(usage.ru_utime + usage.ru_stime + cpu_seconds)
+        hard = resource.getrlimit(resource.RLIMIT_CPU)[1]
+        resource.setrlimit(resource.RLIMIT_CPU, (budget, hard))
+
+
+def _worker_main(connection, cpu_seconds: Optional[float], memory_bytes: Optional[int]):
+    _apply_limits(None, memory_bytes)
+    connection.send(('ready', None))
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        expression, variables = job
+        _apply_limits(cpu_seconds, None)
+        try:
+            connection.send(('ok', compile_expression(expression).evaluate(**variables)))
+        except MemoryError:
+            connection.send(('limit', "memory limit exceeded"))
+        except Exception as exc:
+            connection.send(('error', exc))
+
+
+class _Worker:
+    def __init__(self, context, cpu_seconds: Optional[float], memory_bytes: Optional[int]):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child, cpu_seconds, memory_bytes), daemon=True)
+        self.process.start()
+        child.close()
+        # Wait out interpreter start-up so it is not charged to the first job.
+        self.connection.recv()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.connection.close()
+
+
+class SandboxExecutor:
+    def __init__(self, workers: int = 2, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 cpu_seconds: Optional[float] = None, memory_bytes: Optional[int] = None,
+                 max_digits: float = DEFAULT_MAX_DIGITS, inline_digits: float = DEFAULT_INLINE_DIGITS):
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_bytes
+        self.max_digits = max_digits
+        self.inline_digits = inline_digits
+        self.rejected = 0
+        self.killed = 0
+        # Workers are spawned rather than forked because the dispatcher
+        # threads are already running when a replacement is started.
+        self._context = multiprocessing.get_context('spawn')
+        self._jobs: queue.Queue = queue.Queue()
+        self._cancel_requests = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._dispatch, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def submit(self, expression: str, **variables) -> Future:
+        if self._closed:
+            raise RuntimeError("executor is shut down")
+        future: Future = Future()
+        try:
+            # Limits apply to the largest intermediate value, not just the result.
+            digits = _estimate(parse(expression), variables)[2]
+        except (ExpressionError, RecursionError) as exc:
+            future.set_exception(exc)
+            return future
+        if digits > self.max_digits:
+            self.rejected += 1
+            future.set_exception(ResourceLimitError(
+                f"evaluation would reach about {digits:.3g} digits (limit {self.max_digits:.3g})"))
+            return future
+        if digits <= self.inline_digits:
+            # Small results are cheap by construction; running them in the
+            # caller keeps normal latency independent of busy workers.
+            if future.set_running_or_notify_cancel():
+                future.set_result(compile_expression(expression).evaluate(**variables))
+            return future
+        self._jobs.put((future, expression, variables))
+        return future
+
+    def evaluate(self, expression: str, **variables) -> Optional[Union[float, complex]]:
+        return self.submit(expression, **variables).result()
+
+    def cancel(self, future: Future) -> bool:
+        # Pending jobs are dropped by Future.cancel(); a running job is
+        # noticed by its dispatcher, which kills the worker process.
+        if future.cancel():
+            return True
+        with self._lock:
+            if future.done():
+                return False
+            self._cancel_requests.add(future)
+        return True
+
+    def shutdown(self):
+        self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _dispatch(self):
+        # Workers start with the first job that needs one; most executors
+        # only ever evaluate inline.
+        worker = None
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                future, expression, variables = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if worker is None:
+                    worker = _Worker(self._context, self.cpu_seconds, self.memory_bytes)
+                failure = self._run(worker, future, expression, variables)
+                if failure is not None:
+                    worker.kill()
+                    self.killed += 1
+                    with self._lock:
+                        self._cancel_requests.discard(future)
+                        future.set_exception(failure)
+                    worker = None
+        finally:
+            if worker is not None:
+                worker.stop()
+
+    def _run(self, worker: _Worker, future: Future, expression: str, variables: dict) -> Optional[Exception]:
+        # Returns the error to report when the worker has to be killed.
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        try:
+            worker.connection.send((expression, variables))
+            while not worker.connection.poll(_POLL_INTERVAL):
+                if future in self._cancel_requests:
+                    return CancelledError()
+                if deadline is not None and time.monotonic() >= deadline:
+                    return FutureTimeoutError(f"evaluation exceeded {self.timeout} s")
+            status, value = worker.connection.recv()
+        except (EOFError, OSError):
+            return ResourceLimitError("worker exceeded its CPU or memory limit")
+        with self._lock:
+            self._cancel_requests.discard(future)
+            if status == 'ok':
+                future.set_result(value)
+            elif status == 'error':
+                future.set_exception(value)
+            else:
+                future.set_exception(ResourceLimitError(value))
+        return None
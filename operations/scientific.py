@@ -1,28 +1,55 @@
 import math
 import cmath
 import random
-from typing import Union, Optional, Tuple
+from typing import Dict, List, Union, Optional, Tuple
+from .factorial import factorial, double_factorial, falling_factorial, rising_factorial, multinomial
+from . import vector
+from .vector import _DEG_TO_RAD, _RAD_TO_DEG
+from . import complex_vector
+from .primes import is_prime, is_prime_batch
+from .factorization import factorize, prime_factors
+from .sieve import nth_prime, prime_count, primes_in_range
+from . import number_theory
+from .random_stream import RandomStream, spawn_streams
+from .modular import comb_mod, comb_mod_batch, perm_mod, perm_mod_batch
+from . import solver
+from . import calculus
+from . import dual
+from . import plotting
+from .expression import ExpressionError, compile_expression
 
 
 class ScientificOperations:
+    IMPURE_OPERATIONS = frozenset({'random', 'randint', 'random_stream', 'spawn_random_streams', 'primes_in_range'})
+
     @staticmethod
     def sin(angle: float, degrees: bool = True) -> float:
-        if degrees:
-            angle = math.radians(angle)
-        return math.sin(angle)
+        try:
+            if degrees:
+                angle = math.radians(angle)
+            return math.sin(angle)
+        except TypeError:
+            # Dual numbers differentiate through the same call.
+            return dual.sin(angle * _DEG_TO_RAD if degrees else angle)
 
     @staticmethod
     def cos(angle: float, degrees: bool = True) -> float:
-        if degrees:
-            angle = math.radians(angle)
-        return math.cos(angle)
+        try:
+            if degrees:
+                angle = math.radians(angle)
+            return math.cos(angle)
+        except TypeError:
+            # Dual numbers differentiate through the same call.
+            return dual.cos(angle * _DEG_TO_RAD if degrees else angle)
 
     @staticmethod
     def tan(angle: float, degrees: bool = True) -> Optional[float]:
-        if degrees:
-            angle = math.radians(angle)
         try:
+            if degrees:
+                angle = math.radians(angle)
             return math.tan(angle)
+        except TypeError:
+            return dual.tan(angle * _DEG_TO_RAD if degrees else angle)
         except:
             return None
 
@@ -30,37 +57,60 @@ class ScientificOperations:
     def asin(value: float, degrees: bool = True) -> Optional[float]:
         if abs(value) > 1:
             return None
-        result = math.asin(value)
+        try:
+            result = math.asin(value)
+        except TypeError:
+            result = dual.asin(value)
+            return result * _RAD_TO_DEG if degrees else result
         return math.degrees(result) if degrees else result
 
     @staticmethod
     def acos(value: float, degrees: bool = True) -> Optional[float]:
         if abs(value) > 1:
             return None
-        result = math.acos(value)
+        try:
+            result = math.acos(value)
+        except TypeError:
+            result = dual.acos(value)
+            return result * _RAD_TO_DEG if degrees else result
         return math.degrees(result) if degrees else result
 
     @staticmethod
     def atan(value: float, degrees: bool = True) -> float:
-        result = math.atan(value)
+        try:
+            result = math.atan(value)
+        except TypeError:
+            result = dual.atan(value)
+            return result * _RAD_TO_DEG if degrees else result
         return math.degrees(result) if degrees else result
 
     @staticmethod
     def sinh(x: float) -> float:
-        return math.sinh(x)
+        try:
+            return math.sinh(x)
+        except TypeError:
+            return dual.sinh(x)
 
     @staticmethod
     def cosh(x: float) -> float:
-        return math.cosh(x)
+        try:
+            return math.cosh(x)
+        except TypeError:
+            return dual.cosh(x)
 
     @staticmethod
     def tanh(x: float) -> float:
-        return math.tanh(x)
+        try:
+            return math.tanh(x)
+        except TypeError:
+            return dual.tanh(x)
 
     @staticmethod
     def log(x: float, base: float = 10) -> Optional[float]:
         if x <= 0:
             return None
+        if isinstance(x, dual.Dual):
+            return dual.ln(x) / math.log(base)
         if base == 10:
             return math.log10(x)
         elif base == math.e:
@@ -72,15 +122,72 @@ class ScientificOperations:
     def ln(x: float) -> Optional[float]:
         if x <= 0:
             return None
-        return math.log(x)
+        try:
+            return math.log(x)
+        except TypeError:
+            return dual.ln(x)
 
     @staticmethod
     def exp(x: float) -> float:
-        return math.exp(x)
+        try:
+            return math.exp(x)
+        except TypeError:
+            return dual.exp(x)
+
+    @staticmethod
+    def sin_array(angles, degrees: bool = True, masked: bool = False):
+        return vector.sin(angles, degrees, masked)
+
+    @staticmethod
+    def cos_array(angles, degrees: bool = True, masked: bool = False):
+        return vector.cos(angles, degrees, masked)
+
+    @staticmethod
+    def tan_array(angles, degrees: bool = True, masked: bool = False):
+        return vector.tan(angles, degrees, masked)
+
+    @staticmethod
+    def asin_array(values, degrees: bool = True, masked: bool = False):
+        return vector.asin(values, degrees, masked)
+
+    @staticmethod
+    def acos_array(values, degrees: bool = True, masked: bool = False):
+        return vector.acos(values, degrees, masked)
+
+    @staticmethod
+    def atan_array(values, degrees: bool = True, masked: bool = False):
+        return vector.atan(values, degrees, masked)
+
+    @staticmethod
+    def sinh_array(values, masked: bool = False):
+        return vector.sinh(values, masked)
+
+    @staticmethod
+    def cosh_array(values, masked: bool = False):
+        return vector.cosh(values, masked)
+
+    @staticmethod
+    def tanh_array(values, masked: bool = False):
+        return vector.tanh(values, masked)
+
+    @staticmethod
+    def log_array(values, base: float = 10, masked: bool = False):
+        return vector.log(values, base, masked)
+
+    @staticmethod
+    def ln_array(values, masked: bool = False):
+        return vector.ln(values, masked)
+
+    @staticmethod
+    def exp_array(values, masked: bool = False):
+        return vector.exp(values, masked)
 
     @staticmethod
     def power(base: float, exponent: float) -> float:
-        return math.pow(base, exponent)
+        try:
+            return math.pow(base, exponent)
+        except TypeError:
+            return dual.power(base, exponent)
 
     @staticmethod
     def nth_root(x: float, n: float) -> Optional[float]:
@@ -101,9 +208,23 @@ class ScientificOperations:
 
     @staticmethod
     def factorial(n: int) -> Optional[int]:
-        if n < 0:
-            return None
-        return math.factorial(n)
+        return factorial(n)
+
+    @staticmethod
+    def double_factorial(n: int) -> Optional[int]:
+        return double_factorial(n)
+
+    @staticmethod
+    def falling_factorial(n: int, k: int) -> Optional[int]:
+        return falling_factorial(n, k)
+
+    @staticmethod
+    def rising_factorial(n: int, k: int) -> Optional[int]:
+        return rising_factorial(n, k)
+
+    @staticmethod
+    def multinomial(*counts: int) -> Optional[int]:
+        return multinomial(*counts)
 
     @staticmethod
     def combinations(n: int, r: int) -> Optional[int]:
@@ -117,6 +238,22 @@ class ScientificOperations:
             return None
         return math.perm(n, r)
 
+    @staticmethod
+    def comb_mod(n: int, r: int, modulus: int) -> Optional[int]:
+        return comb_mod(n, r, modulus)
+
+    @staticmethod
+    def perm_mod(n: int, r: int, modulus: int) -> Optional[int]:
+        return perm_mod(n, r, modulus)
+
+    @staticmethod
+    def comb_mod_batch(n, r, modulus: int):
+        return comb_mod_batch(n, r, modulus)
+
+    @staticmethod
+    def perm_mod_batch(n, r, modulus: int):
+        return perm_mod_batch(n, r, modulus)
+
     @staticmethod
     def gamma(x: float) -> Optional[float]:
         if x <= 0 and x == int(x):
@@ -135,11 +272,22 @@ class ScientificOperations:
         except:
             return None
 
+    @staticmethod
+    def gamma_array(values, masked: bool = False):
+        return vector.gamma(values, masked)
+
+    @staticmethod
+    def log_gamma_array(values, masked: bool = False):
+        return vector.log_gamma(values, masked)
+
     @staticmethod
     def sqrt(x: float) -> Optional[float]:
         if x < 0:
             return None
-        return math.sqrt(x)
+        try:
+            return math.sqrt(x)
+        except TypeError:
+            return dual.sqrt(x)
 
     @staticmethod
     def abs(x: float) -> float:
@@ -165,36 +313,45 @@ class ScientificOperations:
     def randint(min_val: int, max_val: int) -> int:
         return random.randint(min_val, max_val)
 
+    @staticmethod
+    def random_stream(seed: Optional[int] = None) -> RandomStream:
+        return RandomStream(seed)
+
+    @staticmethod
+    def spawn_random_streams(seed: Optional[int], n: int) -> List[RandomStream]:
+        return spawn_streams(seed, n)
+
     @staticmethod
     def prime_factorization(n: int) -> Optional[list]:
-        if n <= 0:
-            return None
-        factors = []
-        d = 2
-        temp = n
-        while d * d <= temp:
-            while temp % d == 0:
-                factors.append(d)
-                temp //= d
-            d += 1
-        if temp > 1:
-            factors.append(temp)
-        return factors
+        return prime_factors(n)
+
+    @staticmethod
+    def factorize(n: int, use_ecm: bool = True) -> Optional[Dict[int, int]]:
+        return factorize(n, use_ecm)
 
     @staticmethod
     def is_prime(n: int) -> bool:
-        if n <= 1:
-            return False
-        if n <= 3:
-            return True
-        if n % 2 == 0 or n % 3 == 0:
-            return False
-        i = 5
-        while i * i <= n:
-            if n % i == 0 or n % (i + 2) == 0:
+        if isinstance(n, float):
+            if not n.is_integer():
                 return False
-            i += 6
-        return True
+            n = int(n)
+        return is_prime(n)
+
+    @staticmethod
+    def is_prime_batch(values):
+        return is_prime_batch(values)
+
+    @staticmethod
+    def primes_in_range(start: int, stop: int, workers: Optional[int] = None):
+        return primes_in_range(start, stop, workers)
+
+    @staticmethod
+    def prime_count(x: int) -> int:
+        return prime_count(x)
+
+    @staticmethod
+    def nth_prime(n: int) -> Optional[int]:
+        return nth_prime(n)
 
     @staticmethod
     def gcd(a: int, b: int) -> int:
@@ -202,7 +359,71 @@ class ScientificOperations:
 
     @staticmethod
     def lcm(a: int, b: int) -> int:
-        return abs(a * b) // math.gcd(a, b)
+        return math.lcm(a, b)
+
+    @staticmethod
+    def gcd_many(values: List[int]) -> int:
+        return number_theory.gcd_many(values)
+
+    @staticmethod
+    def lcm_many(values: List[int]) -> int:
+        return number_theory.lcm_many(values)
+
+    @staticmethod
+    def gcd_array(a, b):
+        return number_theory.gcd_array(a, b)
+
+    @staticmethod
+    def batch_gcd(moduli: List[int]) -> Optional[List[int]]:
+        return number_theory.batch_gcd(moduli)
+
+    @staticmethod
+    def totient(n: int) -> Optional[int]:
+        return number_theory.totient(n)
+
+    @staticmethod
+    def divisor_count(n: int) -> Optional[int]:
+        return number_theory.divisor_count(n)
+
+    @staticmethod
+    def divisor_sum(n: int, k: int = 1) -> Optional[int]:
+        return number_theory.divisor_sum(n, k)
+
+    @staticmethod
+    def divisors(n: int) -> Optional[list]:
+        return number_theory.divisors(n)
+
+    @staticmethod
+    def mobius(n: int) -> Optional[int]:
+        return number_theory.mobius(n)
+
+    @staticmethod
+    def mod_inverse(a: int, m: int) -> Optional[int]:
+        return number_theory.mod_inverse(a, m)
+
+    @staticmethod
+    def mod_pow(base: int, exponent: int, modulus: int) -> Optional[int]:
+        return number_theory.mod_pow(base, exponent, modulus)
+
+    @staticmethod
+    def crt(remainders: List[int], moduli: List[int]) -> Optional[Tuple[int, int]]:
+        return number_theory.crt(remainders, moduli)
+
+    @staticmethod
+    def totient_range(start: int, stop: int):
+        return number_theory.totient_range(start, stop)
+
+    @staticmethod
+    def mobius_range(start: int, stop: int):
+        return number_theory.mobius_range(start, stop)
+
+    @staticmethod
+    def divisor_count_range(start: int, stop: int):
+        return number_theory.divisor_count_range(start, stop)
+
+    @staticmethod
+    def divisor_sum_range(start: int, stop: int):
+        return number_theory.divisor_sum_range(start, stop)
 
     @staticmethod
     def complex_add(a: complex, b: complex) -> complex:
@@ -242,6 +463,95 @@ class ScientificOperations:
     def complex_rect(r: float, theta: float) -> complex:
         return cmath.rect(r, math.radians(theta))
 
+    @staticmethod
+    def complex_add_array(a, b):
+        return complex_vector.add(a, b)
+
+    @staticmethod
+    def complex_subtract_array(a, b):
+        return complex_vector.subtract(a, b)
+
+    @staticmethod
+    def complex_multiply_array(a, b):
+        return complex_vector.multiply(a, b)
+
+    @staticmethod
+    def complex_divide_array(a, b, masked: bool = False):
+        return complex_vector.divide(a, b, masked)
+
+    @staticmethod
+    def complex_magnitude_array(values):
+        return complex_vector.magnitude(values)
+
+    @staticmethod
+    def complex_phase_array(values, degrees: bool = False):
+        return complex_vector.phase(values, degrees)
+
+    @staticmethod
+    def complex_conjugate_array(values):
+        return complex_vector.conjugate(values)
+
+    @staticmethod
+    def complex_polar_array(values, degrees: bool = False):
+        return complex_vector.polar(values, degrees)
+
+    @staticmethod
+    def complex_rect_array(r, theta, degrees: bool = True):
+        return complex_vector.rect(r, theta, degrees)
+
+    @staticmethod
+    def solve(expression: str, var: str = 'x', bracket: Optional[Tuple[float, float]] = None,
+              guess: Optional[float] = None, tol: float = solver.DEFAULT_TOLERANCE,
+              max_iterations: int = solver.DEFAULT_MAX_ITERATIONS,
+              variables: Optional[Dict[str, float]] = None) -> Optional[float]:
+        return solver.solve(expression, var, bracket, guess, tol, max_iterations, variables)
+
+    @staticmethod
+    def solve_batch(expression: str, var: str, lower, upper, variables: Optional[Dict[str, object]] = None,
+                    tol: float = solver.DEFAULT_TOLERANCE, max_iterations: int = solver.DEFAULT_MAX_ITERATIONS,
+                    masked: bool = False):
+        return solver.solve_batch(expression, var, lower, upper, variables, tol, max_iterations, masked)
+
+    @staticmethod
+    def integrate(expression: str, var: str = 'x', lower: float = 0.0, upper: float = 1.0,
+                  variables: Optional[Dict[str, float]] = None, tol: float = calculus.DEFAULT_TOLERANCE,
+                  rel_tol: float = calculus.DEFAULT_RELATIVE_TOLERANCE) -> Optional[Tuple[float, float]]:
+        return calculus.integrate(expression, var, lower, upper, variables, tol, rel_tol)
+
+    @staticmethod
+    def integrate_batch(expression: str, var: str, lower, upper, variables: Optional[Dict[str, object]] = None,
+                        tol: float = calculus.DEFAULT_TOLERANCE, rel_tol: float = calculus.DEFAULT_RELATIVE_TOLERANCE,
+                        masked: bool = False):
+        return calculus.integrate_batch(expression, var, lower, upper, variables, tol, rel_tol, masked=masked)
+
+    @staticmethod
+    def derivative(expression: str, var: str = 'x', at: float = 0.0, variables: Optional[Dict[str, float]] = None,
+                   order: int = 1) -> Optional[Tuple[float, float]]:
+        return calculus.derivative(expression, var, at, variables, order)
+
+    @staticmethod
+    def derivative_batch(expression: str, var: str, at, variables: Optional[Dict[str, object]] = None,
+                         order: int = 1, masked: bool = False):
+        return calculus.derivative_batch(expression, var, at, variables, order, masked=masked)
+
+    @staticmethod
+    def tabulate(expression: str, var: str = 'x', start: float = -10.0, stop: float = 10.0,
+                 n: int = plotting.DEFAULT_SAMPLES, adaptive: bool = False):
+        try:
+            if adaptive:
+                return plotting.adaptive_sample(plotting.curve_function(expression, var), start, stop, n)
+            return plotting.tabulate(expression, var, start, stop, n)
+        except ExpressionError:
+            return None
+
+    @staticmethod
+    def value_and_gradient(expression: str, **variables):
+        try:
+            compiled = compile_expression(expression)
+        except ExpressionError:
+            return None
+        return compiled.value_and_gradient(**variables)
+
     @staticmethod
     def to_scientific_notation(x: float, precision: int = 10) -> str:
         return f"{x:.{precision}e}"
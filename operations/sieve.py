@@ -0,0 +1,163 @@
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+from .primes import SIEVE_LIMIT, _sieve
+
+
+# Odd numbers per segment: 1 MiB of flags, which stays in L2 while every
+# base prime crosses it off.
+SEGMENT_SIZE = 1 << 20
+# Base primes below this are crossed off one slice at a time; the rest hit
+# a segment only a few times each, so their indices are generated together.
+_SLICE_PRIME_LIMIT = 1 << 12
+
+
+@lru_cache(maxsize=1)
+def _small_flags() -> np.ndarray:
+    # Element i is True when 2i + 1 is prime, for 2i + 1 < SIEVE_LIMIT.
+    return np.unpackbits(_sieve()[0], bitorder='little').astype(bool)
+
+
+@lru_cache(maxsize=8)
+def _odd_primes_below_power_of_two(bits: int) -> np.ndarray:
+    limit = 1 << bits
+    if limit <= SIEVE_LIMIT:
+        return (np.flatnonzero(_small_flags()[:limit // 2]) * 2 + 1).astype(np.int64)
+    return np.concatenate([_segment_primes(lo, min(lo + 2 * SEGMENT_SIZE, limit))
+                           for lo in range(3, limit, 2 * SEGMENT_SIZE)])
+
+
+def odd_base_primes(limit: int) -> np.ndarray:
+    primes = _odd_primes_below_power_of_two(max(2, (limit + 1).bit_length()))
+    return primes[:np.searchsorted(primes, limit, 'right')]
+
+
+def _mark_segment(lo: int, hi: int) -> np.ndarray:
+    # flags[i] describes the odd number lo_odd + 2i, for lo <= lo_odd + 2i < hi.
+    lo_odd = lo | 1
+    size = max(0, (hi - lo_odd + 1) // 2)
+    flags = np.ones(size, dtype=bool)
+    if size == 0:
+        return flags
+    if lo_odd == 1:
+        flags[0] = False
+    primes = odd_base_primes(math.isqrt(hi - 1))
+    split = np.searchsorted(primes, _SLICE_PRIME_LIMIT)
+    for p in primes[:split].tolist():
+        start = max(p * p, -(-lo_odd // p) * p)
+        if not start & 1:
+            start += p
+        flags[(start - lo_odd) // 2::p] = False
+
+    large = primes[split:]
+    if len(large):
+        start = np.maximum(large * large, -(-lo_odd // large) * large)
+        start += np.where(start & 1, 0, large)
+        first = (start - lo_odd) // 2
+        counts = np.maximum(0, -(-(size - first) // large))
+        owner = np.repeat(np.arange(len(large)), counts)
+        step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        flags[first[owner] + step * large[owner]] = False
+    return flags
+
+
+def _segment_primes(lo: int, hi: int) -> np.ndarray:
+    odd = (np.flatnonzero(_mark_segment(lo, hi)) * 2 + (lo | 1)).astype(np.int64)
+    if lo <= 2 < hi:
+        return np.concatenate([np.array([2], dtype=np.int64), odd])
+    return odd
+
+
+def _segment_count(lo: int, hi: int) -> int:
+    return int(np.count_nonzero(_mark_segment(lo, hi))) + (1 if lo <= 2 < hi else 0)
+
+
+def _map_segments(function: Callable, start: int, stop: int, workers: Optional[int],
+                  segment_size: int) -> Iterator:
+    span = 2 * segment_size
+    bounds = [(lo, min(lo + span, stop)) for lo in range(max(start, 0), stop, span)]
+    workers = os.cpu_count() if workers is None else workers
+    if workers <= 1 or len(bounds) <= 1:
+        for lo, hi in bounds:
+            yield function(lo, hi)
+        return
+
+    # A bounded number of segments is in flight and results come back in
+    # order, so primes stream out sorted with flat memory use.
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for lo, hi in bounds:
+            pending.append(pool.submit(function, lo, hi))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_prime_segments(start: int, stop: int, workers: Optional[int] = None,
+                        segment_size: int = SEGMENT_SIZE) -> Iterator[np.ndarray]:
+    return _map_segments(_segment_primes, start, stop, workers, segment_size)
+
+
+def primes_in_range(start: int, stop: int, workers: Optional[int] = None,
+                    segment_size: int = SEGMENT_SIZE) -> Iterator[int]:
+    for segment in iter_prime_segments(start, stop, workers, segment_size):
+        yield from segment.tolist()
+
+
+def count_primes_in_range(start: int, stop: int, workers: Optional[int] = None,
+                          segment_size: int = SEGMENT_SIZE) -> int:
+    return sum(_map_segments(_segment_count, start, stop, workers, segment_size))
+
+
+def _lucy_prime_count(x: int) -> int:
+    # Lucy_Hedgehog's method: small[v] and large[i - 1] hold the count of
+    # numbers up to v and x // i that survive sieving by the primes so far.
+    r = math.isqrt(x)
+    small = np.arange(-1, r, dtype=np.int64)
+    large = x // np.arange(1, r + 1, dtype=np.int64) - 1
+    for p in np.concatenate([[2], odd_base_primes(r)]).tolist():
+        below = int(small[p - 1])
+        square = p * p
+        count = min(r, x // square)
+        within = min(count, r // p)
+        # x // (i p) is large[i p - 1] while i p <= r, otherwise small[x // (i p)].
+        large[:within] -= large[p - 1:within * p:p] - below
+        if count > within:
+            multiples = np.arange(within + 1, count + 1, dtype=np.int64) * p
+            large[within:count] -= small[x // multiples] - below
+        if square <= r:
+            small[square:] -= small[np.arange(square, r + 1) // p] - below
+    return int(large[0])
+
+
+def prime_count(x: int) -> int:
+    if x < 2:
+        return 0
+    if x < SIEVE_LIMIT:
+        return int(np.count_nonzero(_small_flags()[:(x - 1) // 2 + 1])) + 1
+    return _lucy_prime_count(x)
+
+
+def nth_prime(n: int, workers: Optional[int] = None) -> Optional[int]:
+    if n < 1:
+        return None
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+    # Rosser and Dusart bounds: n(ln n + ln ln n - 1) <= p_n < n(ln n + ln ln n).
+    log_n = math.log(n)
+    lower = int(n * (log_n + math.log(log_n) - 1))
+    upper = int(n * (log_n + math.log(log_n))) + 1
+    count = prime_count(lower - 1)
+    for segment in iter_prime_segments(lower, upper + 1, workers):
+        if count + len(segment) >= n:
+            return int(segment[n - count - 1])
+        count += len(segment)
+    return None
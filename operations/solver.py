@@ -0,0 +1,252 @@
+import math
+import sys
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .batch import compile_batch
+from .expression import CompiledExpr, ExpressionError, compile_expression
+
+
+DEFAULT_TOLERANCE = 1e-12
+DEFAULT_MAX_ITERATIONS = 100
+# Newton steps are halved at most this many times looking for a smaller |f|.
+_MAX_HALVINGS = 40
+_EPSILON = sys.float_info.epsilon
+
+ScalarFunction = Callable[[float], float]
+
+
+def equation_expression(equation: str) -> str:
+    # "lhs = rhs" is solved as lhs - (rhs) = 0.
+    if equation.count('=') != 1:
+        return equation
+    lhs, rhs = equation.split('=')
+    return f"({lhs}) - ({rhs})"
+
+
+def _scalar_function(compiled: CompiledExpr, call: Callable, var: str,
+                     variables: Dict[str, float]) -> ScalarFunction:
+    names = compiled.variables
+    args = [variables.get(name) for name in names]
+    position = names.index(var)
+
+    def f(x: float) -> float:
+        args[position] = x
+        value = float(call(*args))
+        if not math.isfinite(value):
+            raise ValueError("non-finite value")
+        return value
+    return f
+
+
+def _numeric_derivative(f: ScalarFunction) -> ScalarFunction:
+    def df(x: float) -> float:
+        h = _EPSILON ** (1 / 3) * max(1.0, abs(x))
+        return (f(x + h) - f(x - h)) / (2 * h)
+    return df
+
+
+def _tolerance(tol: float, x: float) -> float:
+    return 2 * _EPSILON * abs(x) + 0.5 * tol
+
+
+def brent(f: ScalarFunction, a: float, b: float, tol: float = DEFAULT_TOLERANCE,
+          max_iterations: int = DEFAULT_MAX_ITERATIONS) -> Optional[float]:
+    # Brent's method: inverse quadratic interpolation or a secant step when
+    # it stays well inside the bracket, bisection otherwise.
+    fa, fb = f(a), f(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if (fa > 0) == (fb > 0):
+        return None
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iterations):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = _tolerance(tol, b)
+        m = 0.5 * (c - b)
+        if abs(m) <= tol1 or fb == 0:
+            return b
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * m * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, m)
+        fb = f(b)
+    return None
+
+
+def safeguarded_newton(f: ScalarFunction, df: ScalarFunction, a: float, b: float,
+                       guess: Optional[float] = None, tol: float = DEFAULT_TOLERANCE,
+                       max_iterations: int = DEFAULT_MAX_ITERATIONS) -> Optional[float]:
+    # Newton steps that would leave the bracket, or that shrink it more
+    # slowly than bisection would, are replaced by a bisection step.
+    fa, fb = f(a), f(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if (fa > 0) == (fb > 0):
+        return None
+    low, high = (a, b) if fa < 0 else (b, a)
+    x = guess if guess is not None and min(a, b) < guess < max(a, b) else 0.5 * (a + b)
+    step = previous_step = abs(b - a)
+    fx, slope = f(x), df(x)
+    for _ in range(max_iterations):
+        if fx == 0:
+            return x
+        if ((x - high) * slope - fx) * ((x - low) * slope - fx) > 0 or abs(2 * fx) > abs(previous_step * slope):
+            previous_step, step = step, 0.5 * (high - low)
+            x = low + step
+        else:
+            previous_step, step = step, fx / slope
+            x -= step
+        if abs(step) <= _tolerance(tol, x):
+            return x
+        fx, slope = f(x), df(x)
+        if fx < 0:
+            low = x
+        else:
+            high = x
+    return None
+
+
+def newton(f: ScalarFunction, df: ScalarFunction, guess: float, tol: float = DEFAULT_TOLERANCE,
+           max_iterations: int = DEFAULT_MAX_ITERATIONS) -> Optional[float]:
+    # Without a bracket the step is halved until |f| decreases, which keeps
+    # Newton from being thrown far away by a small derivative.
+    x, fx = guess, f(guess)
+    for _ in range(max_iterations):
+        if fx == 0:
+            return x
+        slope = df(x)
+        if slope == 0 or not math.isfinite(slope):
+            return None
+        step = fx / slope
+        for _ in range(_MAX_HALVINGS):
+            candidate = x - step
+            try:
+                f_candidate = f(candidate)
+            except (ArithmeticError, ValueError):
+                f_candidate = math.inf
+            if abs(f_candidate) < abs(fx):
+                break
+            step *= 0.5
+        else:
+            return x if abs(step) <= _tolerance(tol, x) else None
+        x, fx = candidate, f_candidate
+        if abs(step) <= _tolerance(tol, x):
+            return x
+    return None
+
+
+def solve(expression: str, var: str = 'x', bracket: Optional[Tuple[float, float]] = None,
+          guess: Optional[float] = None, tol: float = DEFAULT_TOLERANCE,
+          max_iterations: int = DEFAULT_MAX_ITERATIONS,
+          variables: Optional[Dict[str, float]] = None) -> Optional[float]:
+    # A bracket alone uses Brent's method, a guess alone Newton's method and
+    # both together Newton's method safeguarded by the bracket.
+    variables = variables or {}
+    try:
+        compiled = compile_expression(equation_expression(expression))
+    except ExpressionError:
+        return None
+    if var not in compiled.variables or any(n != var and n not in variables for n in compiled.variables):
+        return None
+    if bracket is None and guess is None:
+        return None
+    f = _scalar_function(compiled, compiled.function, var, variables)
+    try:
+        if guess is None:
+            root = brent(f, bracket[0], bracket[1], tol, max_iterations)
+        else:
+            try:
+                derivative = compiled.derivative(var)
+                df = _scalar_function(derivative, derivative.function, var, variables)
+            except ExpressionError:
+                df = _numeric_derivative(f)
+            if bracket is None:
+                return newton(f, df, guess, tol, max_iterations)
+            root = safeguarded_newton(f, df, bracket[0], bracket[1], guess, tol, max_iterations)
+        if root is not None and abs(f(root)) > max(abs(f(bracket[0])), abs(f(bracket[1]))):
+            # The sign changed across a pole, not a root.
+            return None
+        return root
+    except (ArithmeticError, ValueError, TypeError):
+        return None
+
+
+def solve_batch(expression: str, var: str, lower, upper, variables: Optional[Dict[str, object]] = None,
+                tol: float = DEFAULT_TOLERANCE, max_iterations: int = DEFAULT_MAX_ITERATIONS,
+                masked: bool = False):
+    # Bisection over whole arrays: one evaluation of the batch kernel per
+    # step advances every equation. Each step halves every bracket, so the
+    # number of steps the widest bracket needs to reach the tolerance is
+    # known up front and the loop stops there.
+    kernel, names = compile_batch(equation_expression(expression))
+    variables = variables or {}
+    missing = [name for name in names if name != var and name not in variables]
+    if var not in names or missing:
+        raise ExpressionError(f"Missing values for {', '.join(missing) or var}")
+    arrays = {name: np.asarray(value, dtype=float) for name, value in variables.items() if name in names}
+    low, high = np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+    shape = np.broadcast_shapes(low.shape, high.shape, *(a.shape for a in arrays.values()))
+    low, high = np.array(np.broadcast_to(low, shape)), np.array(np.broadcast_to(high, shape))
+
+    def f(x):
+        with np.errstate(all='ignore'):
+            return np.broadcast_to(np.asarray(kernel(**arrays, **{var: x}), dtype=float), shape)
+
+    f_low, f_high = f(low), f(high)
+    valid = np.isfinite(f_low) & np.isfinite(f_high) & (np.sign(f_low) * np.sign(f_high) <= 0)
+    negative_low = f_low < 0
+    endpoint = np.where(f_low == 0, low, np.where(f_high == 0, high, np.nan))
+    steps = 0
+    if valid.any():
+        with np.errstate(all='ignore'):
+            target = 2 * _tolerance(tol, np.maximum(np.abs(low), np.abs(high)))
+            needed = np.log2(np.abs(high - low) / target)[valid]
+        steps = int(min(max_iterations, max(0.0, np.ceil(needed.max()))))
+    mid = np.empty(shape)
+    below = np.empty(shape, dtype=bool)
+    for _ in range(steps):
+        np.add(low, high, out=mid)
+        mid *= 0.5
+        # Keep the half whose ends still have opposite signs.
+        np.less(f(mid), 0, out=below)
+        np.equal(below, negative_low, out=below)
+        np.copyto(low, mid, where=below)
+        np.copyto(high, mid, where=~below)
+    root = np.where(np.isnan(endpoint), 0.5 * (low + high), endpoint)
+    # A bracket across a pole or a gap in the domain changes sign without
+    # a root; bisection then closes in on a value larger than either end.
+    with np.errstate(all='ignore'):
+        residual = np.abs(f(root))
+    valid &= np.isfinite(residual) & (residual <= np.maximum(np.abs(f_low), np.abs(f_high)))
+    root[~valid] = np.nan
+    if masked:
+        return np.ma.masked_invalid(root)
+    return root
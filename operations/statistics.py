@@ -0,0 +1,313 @@
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+DEFAULT_COMPRESSION = 200
+DEFAULT_CHUNK_SIZE = 100_000
+# Scalar updates are buffered and folded into the digest this many at a time.
+_BUFFER_FACTOR = 5
+
+
+class TDigest:
+    # Merging t-digest: centroids are (mean, weight) pairs kept sorted, small
+    # near the tails and large in the middle, so quantiles stay accurate in
+    # constant memory and two digests merge by compressing their union.
+    def __init__(self, compression: float = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._buffer: List[float] = []
+
+    @property
+    def count(self) -> float:
+        self._flush()
+        return float(self.weights.sum())
+
+    def update(self, value: float):
+        self._buffer.append(value)
+        if len(self._buffer) >= _BUFFER_FACTOR * self.compression:
+            self._flush()
+
+    def update_array(self, values: np.ndarray):
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size:
+            self._flush()
+            values = np.sort(values)
+            self._add(values, np.ones(values.size))
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        other._flush()
+        self._flush()
+        if other.weights.size:
+            self._add(other.means, other.weights)
+            self.minimum = min(self.minimum, other.minimum)
+            self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def _flush(self):
+        if self._buffer:
+            values = np.sort(np.array(self._buffer))
+            self._buffer = []
+            self._add(values, np.ones(values.size))
+
+    def _add(self, means: np.ndarray, weights: np.ndarray):
+        # Both sides are already sorted, so they are merged rather than
+        # sorted again: each centroid goes in front of the new values
+        # that are not smaller than it.
+        self.minimum = min(self.minimum, means[0])
+        self.maximum = max(self.maximum, means[-1])
+        slots = np.searchsorted(means, self.means) + np.arange(self.means.size)
+        size = means.size + self.means.size
+        inserted = np.zeros(size, dtype=bool)
+        inserted[slots] = True
+        merged_means, merged_weights = np.empty(size), np.empty(size)
+        merged_means[slots], merged_weights[slots] = self.means, self.weights
+        merged_means[~inserted], merged_weights[~inserted] = means, weights
+        self._compress(merged_means, merged_weights)
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray):
+        # Every item goes to the unit interval of the scale function that
+        # holds its midpoint, so neighbours sharing an interval become one
+        # centroid. The scale is k1(q) = delta / (2 pi) asin(2q - 1) plus
+        # the logarithmic k3, whose intervals shrink in proportion to q (or
+        # 1 - q): k1 alone leaves the extreme tails a few wide centroids.
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        midpoint = (cumulative - weights / 2) / total
+        k1 = self.compression / (2 * math.pi) * np.arcsin(2 * midpoint - 1)
+        normalizer = self.compression / (4 * math.log(max(total / self.compression, 1.0)) + 21)
+        k3 = normalizer * np.where(midpoint <= 0.5, np.log(2 * midpoint), -np.log(2 * (1 - midpoint)))
+        k = np.floor(k1 + k3)
+        starts = np.flatnonzero(np.concatenate([[True], k[1:] != k[:-1]]))
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def quantile(self, q: float) -> Optional[float]:
+        self._flush()
+        if not self.weights.size or not 0 <= q <= 1:
+            return None
+        total = self.weights.sum()
+        # Each centroid stands at the middle of its weight; the ends are
+        # pinned to the exact minimum and maximum.
+        positions = np.concatenate([[0.0], np.cumsum(self.weights) - self.weights / 2, [total]])
+        values = np.concatenate([[self.minimum], self.means, [self.maximum]])
+        return float(np.interp(q * total, positions, values))
+
+
+class RunningStatistics:
+    # compression=None skips the digest for callers that only need moments.
+    def __init__(self, compression: Optional[float] = DEFAULT_COMPRESSION):
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._minimum = math.inf
+        self._maximum = -math.inf
+        self.digest = TDigest(compression) if compression else None
+
+    def _add_to_sum(self, value: float):
+        # Neumaier's compensated summation keeps the running total exact to
+        # a few ulps however many values are added.
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def update(self, value: float):
+        if math.isnan(value):
+            return
+        # Welford's update.
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        self._add_to_sum(value)
+        self._minimum = min(self._minimum, value)
+        self._maximum = max(self._maximum, value)
+        if self.digest is not None:
+            self.digest.update(value)
+
+    def update_array(self, values) -> 'RunningStatistics':
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size:
+            chunk = RunningStatistics(None)
+            chunk.count = values.size
+            chunk._mean = float(values.mean())
+            chunk._m2 = float(np.square(values - chunk._mean).sum())
+            chunk._sum = float(values.sum())
+            chunk._minimum = float(values.min())
+            chunk._maximum = float(values.max())
+            self.merge(chunk)
+            if self.digest is not None:
+                self.digest.update_array(values)
+        return self
+
+    def merge(self, other: 'RunningStatistics') -> 'RunningStatistics':
+        if not other.count:
+            return self
+        # Chan et al.'s pairwise combination of the two (count, mean, M2).
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self._add_to_sum(other._sum)
+        self._add_to_sum(other._compensation)
+        self._minimum = min(self._minimum, other._minimum)
+        self._maximum = max(self._maximum, other._maximum)
+        if self.digest is not None and other.digest is not None:
+            self.digest.merge(other.digest)
+        return self
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._mean if self.count else None
+
+    @property
+    def total(self) -> float:
+        return self._sum + self._compensation
+
+    @property
+    def minimum(self) -> Optional[float]:
+        return self._minimum if self.count else None
+
+    @property
+    def maximum(self) -> Optional[float]:
+        return self._maximum if self.count else None
+
+    def variance(self, sample: bool = True) -> Optional[float]:
+        if self.count < (2 if sample else 1):
+            return None
+        return self._m2 / (self.count - 1 if sample else self.count)
+
+    def std(self, sample: bool = True) -> Optional[float]:
+        variance = self.variance(sample)
+        return math.sqrt(variance) if variance is not None else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.digest is None:
+            return None
+        return self.digest.quantile(q)
+
+    def median(self) -> Optional[float]:
+        return self.quantile(0.5)
+
+    def summary(self, quantiles: Sequence[float] = (0.25, 0.5, 0.75)) -> Dict[str, Optional[float]]:
+        result = {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.mean,
+            'variance': self.variance(),
+            'std': self.std(),
+            'min': self.minimum,
+            'max': self.maximum,
+        }
+        for q in quantiles:
+            result[f'p{q * 100:g}'] = self.quantile(q)
+        return result
+
+
+def _parse_value(line: str, column: Optional[int], delimiter: Optional[str]) -> float:
+    if column is not None:
+        line = line.split(delimiter)[column]
+    return float(line)
+
+
+def parse_lines(lines: Iterable[str], column: Optional[int] = None, delimiter: Optional[str] = None) -> np.ndarray:
+    # Lines that do not hold a number (headers, blanks, short rows) are skipped.
+    values = []
+    for line in lines:
+        try:
+            values.append(_parse_value(line, column, delimiter))
+        except (ValueError, IndexError):
+            pass
+    return np.array(values, dtype=float)
+
+
+def iter_file_chunks(path: str, column: Optional[int] = None, delimiter: Optional[str] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    with open(path) as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                return
+            yield parse_lines(lines, column, delimiter)
+
+
+def _chunk_statistics(lines: List[str], column: Optional[int], delimiter: Optional[str],
+                      compression: float) -> RunningStatistics:
+    return RunningStatistics(compression).update_array(parse_lines(lines, column, delimiter))
+
+
+def statistics_from_file(path: str, column: Optional[int] = None, delimiter: Optional[str] = None,
+                         workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         compression: float = DEFAULT_COMPRESSION) -> RunningStatistics:
+    result = RunningStatistics(compression)
+    if workers <= 1:
+        for values in iter_file_chunks(path, column, delimiter, chunk_size):
+            result.update_array(values)
+        return result
+
+    # Chunks are parsed and summarised in worker processes and the partial
+    # results merged here; only a bounded number of chunks is in flight.
+    with open(path) as f, ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            lines = list(islice(f, chunk_size))
+            if lines:
+                pending.append(pool.submit(_chunk_statistics, lines, column, delimiter, compression))
+            if pending and (not lines or len(pending) >= workers * 2):
+                result.merge(pending.popleft().result())
+            if not lines and not pending:
+                return result
+
+
+class StatisticsOperations:
+    @staticmethod
+    def describe(values, quantiles: Sequence[float] = (0.25, 0.5, 0.75)) -> Optional[Dict[str, Optional[float]]]:
+        stats = RunningStatistics().update_array(values)
+        if not stats.count:
+            return None
+        return stats.summary(quantiles)
+
+    @staticmethod
+    def describe_file(path: str, column: Optional[int] = None, delimiter: Optional[str] = None,
+                      workers: int = 1) -> Optional[Dict[str, Optional[float]]]:
+        try:
+            stats = statistics_from_file(path, column, delimiter, workers)
+        except OSError:
+            return None
+        if not stats.count:
+            return None
+        return stats.summary()
+
+    @staticmethod
+    def mean(values) -> Optional[float]:
+        return RunningStatistics(None).update_array(values).mean
+
+    @staticmethod
+    def variance(values, sample: bool = True) -> Optional[float]:
+        return RunningStatistics(None).update_array(values).variance(sample)
+
+    @staticmethod
+    def std(values, sample: bool = True) -> Optional[float]:
+        return RunningStatistics(None).update_array(values).std(sample)
+
+    @staticmethod
+    def quantile(values, q: float) -> Optional[float]:
+        return RunningStatistics().update_array(values).quantile(q)
+
+    @staticmethod
+    def median(values) -> Optional[float]:
+        return RunningStatistics().update_array(values).median()
@@ -0,0 +1,189 @@
+import math
+from typing import Tuple, Union
+
+import numpy as np
+
+from .factorial import SMALL_FACTORIALS
+
+
+ArrayResult = Union[np.ndarray, np.ma.MaskedArray]
+
+# Same constants as math.radians / math.degrees so results match the
+# scalar operations bit for bit.
+_DEG_TO_RAD = math.pi / 180.0
+_RAD_TO_DEG = 180.0 / math.pi
+
+# Lanczos approximation, g = 7, n = 9.
+_LANCZOS_G = 7.0
+_LANCZOS_COEFFICIENTS = (
+    0.99999999999980993,
+    676.5203681218851,
+    -1259.1392167224028,
+    771.32342877765313,
+    -176.61502916214059,
+    12.507343278686905,
+    -0.13857109526572012,
+    9.9843695780195716e-6,
+    1.5056327351493116e-7,
+)
+_HALF_LOG_2PI = 0.5 * math.log(2 * math.pi)
+# Lanczos is a few ulps off at integers, where gamma(n) = (n - 1)! is
+# known exactly; these are looked up instead.
+_GAMMA_TABLE = np.array(SMALL_FACTORIALS, dtype=float)
+_LOG_GAMMA_TABLE = np.array([math.lgamma(n + 1) for n in range(len(SMALL_FACTORIALS))])
+_SQRT_2PI = math.sqrt(2 * math.pi)
+
+
+def _prepare(values) -> Tuple[np.ndarray, np.ndarray]:
+    values = np.asarray(values, dtype=float)
+    return values, np.empty_like(values)
+
+
+def _finish(out: np.ndarray, invalid, masked: bool) -> ArrayResult:
+    if invalid is not None:
+        out[invalid] = np.nan
+    if masked:
+        return np.ma.masked_invalid(out)
+    return out
+
+
+def _overflowed(out: np.ndarray, values: np.ndarray) -> np.ndarray:
+    return np.isinf(out) & np.isfinite(values)
+
+
+def _angle(values: np.ndarray, out: np.ndarray, degrees: bool) -> np.ndarray:
+    if degrees:
+        return np.multiply(values, _DEG_TO_RAD, out=out)
+    return values
+
+
+def _forward_trig(kernel):
+    def apply(angles, degrees: bool = True, masked: bool = False) -> ArrayResult:
+        angles, out = _prepare(angles)
+        with np.errstate(all='ignore'):
+            kernel(_angle(angles, out, degrees), out=out)
+        return _finish(out, None, masked)
+    return apply
+
+
+def _inverse_trig(kernel, bounded: bool):
+    def apply(values, degrees: bool = True, masked: bool = False) -> ArrayResult:
+        values, out = _prepare(values)
+        with np.errstate(all='ignore'):
+            kernel(values, out=out)
+            if degrees:
+                np.multiply(out, _RAD_TO_DEG, out=out)
+        return _finish(out, np.abs(values) > 1 if bounded else None, masked)
+    return apply
+
+
+def _hyperbolic(kernel):
+    def apply(values, masked: bool = False) -> ArrayResult:
+        values, out = _prepare(values)
+        with np.errstate(all='ignore'):
+            kernel(values, out=out)
+        return _finish(out, _overflowed(out, values), masked)
+    return apply
+
+
+sin = _forward_trig(np.sin)
+cos = _forward_trig(np.cos)
+tan = _forward_trig(np.tan)
+asin = _inverse_trig(np.arcsin, True)
+acos = _inverse_trig(np.arccos, True)
+atan = _inverse_trig(np.arctan, False)
+sinh = _hyperbolic(np.sinh)
+cosh = _hyperbolic(np.cosh)
+tanh = _hyperbolic(np.tanh)
+exp = _hyperbolic(np.exp)
+
+
+def log(values, base: float = 10, masked: bool = False) -> ArrayResult:
+    values, out = _prepare(values)
+    with np.errstate(all='ignore'):
+        if base == 10:
+            np.log10(values, out=out)
+        elif base == math.e:
+            np.log(values, out=out)
+        elif base <= 0 or base == 1:
+            out.fill(np.nan)
+        else:
+            np.log(values, out=out)
+            np.divide(out, math.log(base), out=out)
+    return _finish(out, values <= 0, masked)
+
+
+def ln(values, masked: bool = False) -> ArrayResult:
+    return log(values, math.e, masked)
+
+
+def _lanczos_sum(z: np.ndarray) -> np.ndarray:
+    total = np.full_like(z, _LANCZOS_COEFFICIENTS[0])
+    term = np.empty_like(z)
+    for i, coefficient in enumerate(_LANCZOS_COEFFICIENTS[1:], 1):
+        np.add(z, i, out=term)
+        np.divide(coefficient, term, out=term)
+        total += term
+    return total
+
+
+def _positive_lgamma(x: np.ndarray) -> np.ndarray:
+    z = x - 1
+    t = z + _LANCZOS_G + 0.5
+    return _HALF_LOG_2PI + (z + 0.5) * np.log(t) - t + np.log(_lanczos_sum(z))
+
+
+def _positive_gamma(x: np.ndarray) -> np.ndarray:
+    z = x - 1
+    t = z + _LANCZOS_G + 0.5
+    # t ** (z + 0.5) overflows long before the result does, so it is split
+    # into two halves around exp(-t).
+    half = np.power(t, (z + 0.5) / 2)
+    return _SQRT_2PI * half * (half * np.exp(-t)) * _lanczos_sum(z)
+
+
+def _use_table(values: np.ndarray, out: np.ndarray, table: np.ndarray):
+    integral = (values >= 1) & (values <= len(table)) & (values == np.floor(values))
+    if integral.any():
+        out[integral] = table[values[integral].astype(np.intp) - 1]
+
+
+def _sin_pi(x: np.ndarray) -> np.ndarray:
+    # sin(pi x) loses its relative precision near integers unless the
+    # argument is reduced first: sin(pi x) = (-1)^k sin(pi (x - k)).
+    k = np.round(x)
+    sign = np.where(np.fmod(k, 2) == 0, 1.0, -1.0)
+    return sign * np.sin(np.pi * (x - k))
+
+
+def gamma(values, masked: bool = False) -> ArrayResult:
+    values, out = _prepare(values)
+    with np.errstate(all='ignore'):
+        reflect = values < 0.5
+        if reflect.any():
+            out[~reflect] = _positive_gamma(values[~reflect])
+            x = values[reflect]
+            # Reflection formula: gamma(x) = pi / (sin(pi x) gamma(1 - x)).
+            out[reflect] = np.pi / (_sin_pi(x) * _positive_gamma(1 - x))
+        else:
+            out[...] = _positive_gamma(values)
+        _use_table(values, out, _GAMMA_TABLE)
+        out[np.isposinf(values)] = np.inf
+        invalid = ((values <= 0) & (values == np.floor(values))) | _overflowed(out, values) | np.isneginf(values)
+    return _finish(out, invalid, masked)
+
+
+def log_gamma(values, masked: bool = False) -> ArrayResult:
+    values, out = _prepare(values)
+    with np.errstate(all='ignore'):
+        reflect = (values > 0) & (values < 0.5)
+        if reflect.any():
+            out[~reflect] = _positive_lgamma(values[~reflect])
+            x = values[reflect]
+            out[reflect] = np.log(np.pi / np.abs(_sin_pi(x))) - _positive_lgamma(1 - x)
+        else:
+            out[...] = _positive_lgamma(values)
+        _use_table(values, out, _LOG_GAMMA_TABLE)
+        out[np.isposinf(values)] = np.inf
+        invalid = (values <= 0) | _overflowed(out, values)
+    return _finish(out, invalid, masked)
@@ -0,0 +1,103 @@
+import pytest
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import FinanceOperations, MemoizedOperations
+from operations.amortization import (ScheduleRow, amortization_batch, amortization_rows,
+                                     amortization_schedule)
+
+
+class TestAmortizationSchedule:
+    def test_closed_form_matches_rows(self):
+        schedule = amortization_schedule(250000, 4.5, 360)
+        rows = list(amortization_rows(250000, 4.5, 360))
+        assert len(rows) == 360
+        np.testing.assert_array_equal(schedule['period'], np.arange(1, 361))
+        for name in ('payment', 'interest', 'principal', 'balance'):
+            np.testing.assert_allclose(schedule[name], [getattr(row, name) for row in rows], atol=1e-6)
+
+    def test_level_payment(self):
+        schedule = amortization_schedule(250000, 4.5, 360)
+        payment = FinanceOperations.payment(250000, 4.5, 360)
+        np.testing.assert_allclose(schedule['payment'], payment)
+        assert schedule['balance'][-1] == 0
+        assert schedule['principal'].sum() == pytest.approx(250000)
+        assert schedule['interest'].sum() == pytest.approx(payment * 360 - 250000)
+
+    def test_remaining_balance_agrees(self):
+        schedule = amortization_schedule(250000, 4.5, 360)
+        assert FinanceOperations.remaining_balance(250000, 4.5, 360, 120) == pytest.approx(schedule['balance'][119])
+
+    def test_remaining_balance_zero_rate(self):
+        assert FinanceOperations.remaining_balance(1200, 0, 12, 3) == pytest.approx(900)
+
+    def test_zero_rate(self):
+        schedule = amortization_schedule(1200, 0, 12)
+        np.testing.assert_allclose(schedule['payment'], 100)
+        np.testing.assert_allclose(schedule['interest'], 0)
+        np.testing.assert_allclose(schedule['balance'], np.arange(1100, -1, -100))
+
+    def test_extra_payments_shorten_term(self):
+        schedule = amortization_schedule(250000, 4.5, 360, 200)
+        base = amortization_schedule(250000, 4.5, 360)
+        assert len(schedule['period']) < 360
+        assert schedule['balance'][-1] == 0
+        assert schedule['principal'].sum() == pytest.approx(250000)
+        assert schedule['interest'].sum() < base['interest'].sum()
+
+    def test_extra_payments_by_period(self):
+        rows = list(amortization_rows(10000, 6, 24, {1: 1000}))
+        base = list(amortization_rows(10000, 6, 24))
+        assert rows[0].principal == pytest.approx(base[0].principal + 1000)
+        assert rows[1].payment == pytest.approx(base[1].payment)
+
+    def test_rate_reset_reamortizes(self):
+        schedule = amortization_schedule(100000, 5, 360, rate_changes={61: 7})
+        balance = schedule['balance'][59]
+        expected = FinanceOperations.payment(balance, 7, 300)
+        assert schedule['payment'][59] == pytest.approx(FinanceOperations.payment(100000, 5, 360))
+        np.testing.assert_allclose(schedule['payment'][60:], expected)
+        assert schedule['interest'][60] == pytest.approx(balance * 0.07 / 12)
+        assert schedule['balance'][-1] == 0
+
+    def test_rows_are_streamed(self):
+        rows = amortization_rows(250000, 4.5, 360)
+        assert isinstance(next(rows), ScheduleRow)
+
+    def test_rows_are_not_memoized(self):
+        finance = MemoizedOperations(FinanceOperations)
+        assert len(list(finance.amortization_rows(1200, 5, 12))) == 12
+        assert len(list(finance.amortization_rows(1200, 5, 12))) == 12
+        assert 'amortization_rows' not in finance.cache_stats()
+        assert len(list(finance.amortization_batch([1200.0], 5, 12))) == 12
+        assert len(list(finance.amortization_batch([1200.0], 5, 12))) == 12
+
+    def test_invalid_input_is_empty(self):
+        assert list(amortization_rows(0, 5, 12)) == []
+        assert amortization_schedule(1000, 5, 0)['period'].size == 0
+        assert FinanceOperations.amortization_schedule(-1, 5, 12) is None
+
+
+class TestAmortizationBatch:
+    def test_matches_single_loans(self):
+        principals = np.array([100000.0, 250000.0, 5000.0])
+        rates = np.array([3.0, 4.5, 0.0])
+        totals = np.zeros(3)
+        for row in amortization_batch(principals, rates, 120, rate_changes={25: [4.0, 5.0, 1.0]}):
+            totals += row.interest
+        for i in range(3):
+            schedule = amortization_schedule(principals[i], rates[i], 120, rate_changes={25: [4.0, 5.0, 1.0][i]})
+            assert totals[i] == pytest.approx(schedule['interest'].sum())
+        assert np.all(row.balance == 0)
+
+    def test_extra_payments_pay_off_early(self):
+        rows = list(amortization_batch([10000.0, 10000.0], 6, 60, [0.0, 500.0]))
+        balances = np.array([row.balance for row in rows])
+        assert balances[-1, 1] == 0 and balances[30, 1] == 0 and balances[30, 0] > 0
+        principal = np.array([row.principal for row in rows]).sum(axis=0)
+        np.testing.assert_allclose(principal, 10000)
+
+    def test_scalar_principal_broadcasts(self):
+        row = next(amortization_batch(1000.0, np.array([0.0, 12.0]), 10))
+        np.testing.assert_allclose(row.interest, [0, 10])
@@ -0,0 +1,59 @@
+import pytest
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ArithmeticOperations, ExpressionError, evaluate_batch, evaluate_batch_masked
+
+
+class TestEvaluateBatch:
+    def test_matches_scalar_path(self):
+        x = np.array([3.0, -1.5, 0.0, 2.0])
+        y = np.array([4.0, 2.0, 0.0, -7.0])
+        t = np.array([0.0, 1.0, 0.5, 2.0])
+        expr = "sqrt(x^2 + y^2) * exp(-t)"
+        result = evaluate_batch(expr, x=x, y=y, t=t)
+        expected = [ArithmeticOperations.evaluate(expr, x=a, y=b, t=c) for a, b, c in zip(x, y, t)]
+        assert result == pytest.approx(expected)
+
+    def test_nan_where_scalar_returns_none(self):
+        x = np.array([-2.0, 0.0, 4.0])
+        assert np.isnan(evaluate_batch("1 / x", x=x)[1])
+        assert np.isnan(evaluate_batch("sqrt(x)", x=x)[0])
+        assert np.isnan(evaluate_batch("ln(x)", x=x)[:2]).all()
+        assert np.isnan(evaluate_batch("x ^ 0.5", x=x)[0])
+        assert np.isnan(evaluate_batch("exp(x * 1000)", x=x)[2])
+
+    def test_factorial(self):
+        result = evaluate_batch("factorial(n)", n=[0, 5, 2.5, -1, 200])
+        assert result[:2].tolist() == [1.0, 120.0]
+        assert np.isnan(result[2:]).all()
+
+    def test_broadcasting_and_constants(self):
+        assert evaluate_batch("x * 2 + pi", x=[[1, 2], [3, 4]]).shape == (2, 2)
+        assert evaluate_batch("2 + 3").item() == 5
+
+    def test_masked(self):
+        result = evaluate_batch_masked("1 / x", x=[0.0, 2.0])
+        assert result.mask.tolist() == [True, False]
+        assert result[1] == 0.5
+
+    def test_missing_variable(self):
+        with pytest.raises(ExpressionError):
+            evaluate_batch("x + y", x=[1.0])
+
+    def test_complex_arrays(self):
+        z = np.array([1 + 1j, -4 + 0j, 0j, 2])
+        for expr in ("z * 2 + 1j", "sqrt(z)", "1 / z", "ln(z)", "conj(z) * phase(z)", "z // 2"):
+            result = evaluate_batch(expr, z=z)
+            assert result.dtype == np.complex128 or expr == "z // 2"
+            expected = [ArithmeticOperations.evaluate(expr, z=complex(v)) for v in z]
+            for value, scalar in zip(result.tolist(), expected):
+                if scalar is None:
+                    assert np.isnan(value)
+                else:
+                    assert value == pytest.approx(scalar)
+
+    def test_complex_literal_with_real_input(self):
+        assert evaluate_batch("x + 1j", x=[1.0, 2.0]).tolist() == [1 + 1j, 2 + 1j]
+        assert np.isnan(evaluate_batch("sqrt(x)", x=[-1.0])).all()
@@ -0,0 +1,63 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks import Benchmark, build_benchmarks, compare_results, load_results, run_benchmarks, save_results
+from benchmarks.__main__ import main
+
+
+def _results(**seconds):
+    return {'metadata': {}, 'results': {name: {'seconds': value} for name, value in seconds.items()}}
+
+
+class TestBenchmarkSuite:
+    def test_covers_every_module(self):
+        groups = {benchmark.group for benchmark in build_benchmarks()}
+        assert {'arithmetic', 'scientific', 'finance', 'programming', 'model', 'evaluate'} <= groups
+
+    def test_small_large_scalar_and_batch(self):
+        benchmarks = build_benchmarks()
+        assert {b.size for b in benchmarks} == {'small', 'large'}
+        assert {b.kind for b in benchmarks} == {'scalar', 'batch'}
+
+    def test_names_are_unique(self):
+        names = [benchmark.name for benchmark in build_benchmarks()]
+        assert len(names) == len(set(names))
+
+
+class TestBenchmarkRunner:
+    def test_run_filtered(self):
+        results = run_benchmarks("arithmetic.add", min_time=0.001, repeat=2)
+        assert list(results['results']) == ["arithmetic.add"]
+        assert results['results']["arithmetic.add"]['seconds'] > 0
+        assert 'python' in results['metadata']
+
+    def test_run_custom_benchmarks(self):
+        calls = []
+        benchmark = Benchmark("custom", "test", "small", "scalar", lambda: calls.append(1))
+        results = run_benchmarks(min_time=0.001, repeat=3, benchmarks=[benchmark])
+        assert results['results']['custom']['calls'] >= 1
+        assert len(calls) >= 3
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        save_results(_results(a=1.0), path)
+        assert load_results(path) == _results(a=1.0)
+
+    def test_compare_flags_regressions(self):
+        comparisons = {c.name: c for c in compare_results(_results(a=1.0, b=1.0, c=1.0, gone=1.0),
+                                                          _results(a=1.05, b=1.5, c=0.5, new=1.0))}
+        assert set(comparisons) == {'a', 'b', 'c'}
+        assert not comparisons['a'].regressed(0.1)
+        assert comparisons['b'].regressed(0.1)
+        assert comparisons['b'].ratio == pytest.approx(1.5)
+        assert comparisons['c'].improved(0.1)
+
+    def test_compare_exit_code(self, tmp_path, capsys):
+        baseline = str(tmp_path / "baseline.json")
+        current = str(tmp_path / "current.json")
+        save_results(_results(a=1.0), baseline)
+        save_results(_results(a=2.0), current)
+        assert main(["compare", baseline, current]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
+        assert main(["compare", baseline, current, "--threshold", "1.5"]) == 0
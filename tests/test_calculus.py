@@ -0,0 +1,126 @@
+import pytest
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ExpressionError, ScientificOperations
+from operations.calculus import GAUSS_WEIGHTS, KRONROD_WEIGHTS, NODES, derivative, derivative_batch, integrate, integrate_batch
+
+
+class TestRules:
+    def test_weights(self):
+        assert KRONROD_WEIGHTS.sum() == pytest.approx(2)
+        assert GAUSS_WEIGHTS.sum() == pytest.approx(2)
+        assert np.allclose(NODES, -NODES[::-1])
+
+    def test_exact_for_polynomials(self):
+        for degree in range(20):
+            exact = 0 if degree % 2 else 2 / (degree + 1)
+            assert KRONROD_WEIGHTS @ NODES ** degree == pytest.approx(exact, abs=1e-14)
+
+
+class TestIntegrate:
+    def test_smooth(self):
+        value, error = integrate("sin(x)", 'x', 0, math.pi)
+        assert value == pytest.approx(2, abs=1e-12)
+        assert error < 1e-10
+
+    def test_gaussian(self):
+        value, _ = integrate("exp(-x^2)", 'x', -5, 5)
+        assert value == pytest.approx(math.sqrt(math.pi), rel=1e-10)
+
+    def test_endpoint_singularity(self):
+        value, error = integrate("1/sqrt(x)", 'x', 0, 1)
+        assert abs(value - 2) <= max(error, 1e-5)
+
+    def test_reversed_and_empty(self):
+        assert integrate("x", 'x', 1, 0)[0] == pytest.approx(-0.5)
+        assert integrate("x", 'x', 2, 2) == (0.0, 0.0)
+
+    def test_variables(self):
+        assert integrate("x^k", 'x', 0, 1, {'k': 3})[0] == pytest.approx(0.25)
+        assert integrate("t^2", 't', 0, 3)[0] == pytest.approx(9)
+
+    def test_constant_integrands(self):
+        assert integrate("5", 'x', 0, 1) == pytest.approx((5, 0))
+        assert integrate("y", 'x', 0, 1, {'y': 2}) == pytest.approx((2, 0))
+        values, _ = integrate_batch("y", 'x', 0, [1, 2], {'y': [2, 3]})
+        np.testing.assert_allclose(values, [2, 6])
+
+    def test_invalid(self):
+        assert integrate("ln(x)", 'x', -1, 1) is None
+        assert integrate("1/x", 'x', -1, 1) is None
+        assert integrate("x + a", 'x', 0, 1) is None
+        assert integrate("x +", 'x', 0, 1) is None
+        assert integrate("x", 'x', 0, math.inf) is None
+
+
+class TestIntegrateBatch:
+    def test_one_integral_per_row(self):
+        k = np.linspace(0.5, 10, 1000)
+        values, errors = integrate_batch("exp(-k * x)", 'x', 0, 1, {'k': k})
+        np.testing.assert_allclose(values, (1 - np.exp(-k)) / k, rtol=1e-10)
+        assert np.all(errors < 1e-8)
+
+    def test_per_row_limits(self):
+        values, _ = integrate_batch("x", 'x', [0, 0, 1], [[1, 2, 3]])
+        assert values.shape == (1, 3)
+        np.testing.assert_allclose(values[0], [0.5, 2, 4])
+
+    def test_invalid_rows(self):
+        values, errors = integrate_batch("ln(x * a)", 'x', 0.5, 1, {'a': [1, -1]})
+        assert math.isfinite(values[0]) and np.isnan(values[1]) and np.isnan(errors[1])
+        masked, _ = integrate_batch("ln(x * a)", 'x', 0.5, 1, {'a': [1, -1]}, masked=True)
+        assert masked.mask.tolist() == [False, True]
+
+    def test_missing_variable(self):
+        with pytest.raises(ExpressionError):
+            integrate_batch("x * a", 'x', 0, 1)
+
+
+class TestDerivative:
+    def test_first_order(self):
+        value, error = derivative("sin(x)", 'x', 1.0)
+        assert value == pytest.approx(math.cos(1), abs=1e-9)
+        assert error < 1e-6
+
+    def test_second_order(self):
+        value, _ = derivative("sin(x)", 'x', 1.0, order=2)
+        assert value == pytest.approx(-math.sin(1), abs=1e-7)
+
+    def test_constant_functions(self):
+        assert derivative("3", 'x', 1.0) == (0, 0)
+        assert derivative("y^2", 'x', 1.0, {'y': 3}, order=2) == (0, 0)
+        values, _ = derivative_batch("y * 2", 'x', [1.0, 2.0], {'y': 3})
+        np.testing.assert_array_equal(values, [0, 0])
+
+    def test_scaled_step(self):
+        assert derivative("x^3", 'x', 1e6)[0] == pytest.approx(3e12, rel=1e-8)
+
+    def test_invalid(self):
+        assert derivative("ln(x)", 'x', 0.0) is None
+        assert derivative("x", 'x', 0.0, order=3) is None
+
+    def test_batch(self):
+        x = np.linspace(0, 1, 10000)
+        values, errors = derivative_batch("sin(x) * exp(x)", 'x', x)
+        np.testing.assert_allclose(values, (np.cos(x) + np.sin(x)) * np.exp(x), atol=1e-9)
+        values, _ = derivative_batch("a * x^2", 'x', [1, 2, 3], {'a': 2})
+        np.testing.assert_allclose(values, [4, 8, 12])
+
+    def test_batch_invalid_points(self):
+        values, _ = derivative_batch("sqrt(x)", 'x', [-1, 1], masked=True)
+        assert values.mask.tolist() == [True, False]
+
+
+class TestScientificWrappers:
+    def test_integrate(self):
+        assert ScientificOperations.integrate("x^2", 'x', 0, 3)[0] == pytest.approx(9)
+        values, _ = ScientificOperations.integrate_batch("x * a", 'x', 0, 1, {'a': [2, 4]})
+        np.testing.assert_allclose(values, [1, 2])
+
+    def test_derivative(self):
+        assert ScientificOperations.derivative("exp(x)", 'x', 0)[0] == pytest.approx(1)
+        values, _ = ScientificOperations.derivative_batch("x^2", 'x', [1, 2])
+        np.testing.assert_allclose(values, [2, 4])
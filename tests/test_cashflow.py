@@ -0,0 +1,84 @@
+import pytest
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import FinanceOperations
+from operations.cashflow import (IrrStatus, internal_rate_of_return_batch, net_present_value_batch,
+                                 net_present_value_grid)
+
+
+@pytest.fixture
+def projects():
+    rng = np.random.default_rng(0)
+    return np.concatenate([-rng.uniform(500, 2000, (200, 1)), rng.uniform(-50, 250, (200, 11))], axis=1)
+
+
+class TestNetPresentValueBatch:
+    def test_matches_scalar(self, projects):
+        values = net_present_value_batch(8, projects)
+        for i in range(0, 200, 37):
+            assert values[i] == pytest.approx(FinanceOperations.net_present_value(8, list(projects[i])))
+
+    def test_rate_per_row(self, projects):
+        rates = np.linspace(0, 20, 200)
+        values = net_present_value_batch(rates, projects)
+        for i in (0, 99, 199):
+            assert values[i] == pytest.approx(FinanceOperations.net_present_value(rates[i], list(projects[i])))
+
+    def test_grid(self, projects):
+        grid = net_present_value_grid([0, 8, 15], projects)
+        assert grid.shape == (200, 3)
+        np.testing.assert_allclose(grid[:, 0], projects.sum(axis=1))
+        np.testing.assert_allclose(grid[:, 1], net_present_value_batch(8, projects))
+
+    def test_rate_outside_domain(self):
+        values = net_present_value_batch(np.array([-100.0, 10.0]), [[100, 100], [110, 0]])
+        assert np.isnan(values[0]) and values[1] == pytest.approx(100)
+        assert net_present_value_batch(np.array([-100.0, 10.0]), [[100, 100], [110, 0]], masked=True).mask[0]
+
+
+class TestInternalRateOfReturnBatch:
+    def test_matches_scalar(self, projects):
+        rates, status = internal_rate_of_return_batch(projects)
+        assert np.all(status <= IrrStatus.BISECTION)
+        assert (status == IrrStatus.NEWTON).sum() > 190
+        for i in range(0, 200, 37):
+            assert rates[i] == pytest.approx(FinanceOperations.internal_rate_of_return(list(projects[i])), abs=1e-5)
+
+    def test_npv_is_zero_at_irr(self, projects):
+        rates, _ = internal_rate_of_return_batch(projects)
+        # net_present_value discounts the first flow one period.
+        np.testing.assert_allclose(net_present_value_batch(rates, projects), 0, atol=1e-6)
+
+    def test_bisection_fallback(self):
+        flows = np.array([[-1000.0, 300, 300, 300, 300, 300], [-100, 0, 0, 0, 0, 1e6]])
+        rates, status = internal_rate_of_return_batch(flows, max_iterations=0)
+        assert np.all(status == IrrStatus.BISECTION)
+        newton, _ = internal_rate_of_return_batch(flows)
+        np.testing.assert_allclose(rates, newton, rtol=1e-8)
+
+    def test_root_on_bracket(self):
+        rates, status = internal_rate_of_return_batch([[-100.0, 0, 400]], max_iterations=0)
+        assert status[0] == IrrStatus.BISECTION and rates[0] == pytest.approx(100)
+
+    def test_status_per_row(self):
+        flows = np.array([[-100.0, 110], [100, 100], [-100, np.nan], [-100, 50]])
+        rates, status = internal_rate_of_return_batch(flows)
+        assert list(status) == [IrrStatus.NEWTON, IrrStatus.NO_ROOT, IrrStatus.INVALID, IrrStatus.NEWTON]
+        assert rates[0] == pytest.approx(10) and rates[3] == pytest.approx(-50)
+        assert np.isnan(rates[1]) and np.isnan(rates[2])
+
+    def test_masked(self):
+        rates, _ = internal_rate_of_return_batch([[100.0, 100], [-100, 110]], masked=True)
+        assert rates.mask[0] and rates[1] == pytest.approx(10)
+
+    def test_shapes(self):
+        rates, status = internal_rate_of_return_batch([-100.0, 121])
+        assert rates.shape == () and rates == pytest.approx(21)
+        rates, status = internal_rate_of_return_batch(np.zeros((2, 3, 0)))
+        assert rates.shape == (2, 3) and np.all(status == IrrStatus.INVALID)
+
+    def test_scalar_falls_back_to_bisection(self):
+        # The Newton iteration cannot start at -100%.
+        assert FinanceOperations.internal_rate_of_return([-100, 0, 0, 0, 0, 1e6], -1) == pytest.approx(530.957, abs=1e-3)
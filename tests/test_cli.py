@@ -0,0 +1,38 @@
+import io
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cli import evaluate_line, evaluate_lines, run_batch
+from cli.batch import main
+
+
+class TestBatchCli:
+    def test_evaluate_line(self):
+        assert evaluate_line("1 + 2\n") == "3.0"
+        assert evaluate_line("   \n") == ""
+        assert evaluate_line("1/0") == "error: division by zero"
+        assert evaluate_line("x + 1") == "error: undefined variable x"
+        assert evaluate_line("2 +").startswith("error:")
+        assert evaluate_line("(1+2j) * 2") == "(2+4j)"
+
+    def test_results_keep_input_order(self):
+        lines = [f"{i} * 2\n" for i in range(50)]
+        results = list(evaluate_lines(lines, workers=2, chunk_size=7))
+        assert results == [str(float(i * 2)) for i in range(50)]
+
+    def test_run_batch(self):
+        source = io.StringIO("sqrt(16)\n\nfoo(1)\n2^10\n")
+        destination = io.StringIO()
+        assert run_batch(source, destination, chunk_size=2) == 4
+        lines = destination.getvalue().splitlines()
+        assert lines[0] == "4.0"
+        assert lines[1] == ""
+        assert lines[2].startswith("error:")
+        assert lines[3] == "1024.0"
+
+    def test_main_with_files(self, tmp_path):
+        source = tmp_path / "input.txt"
+        output = tmp_path / "output.txt"
+        source.write_text("1+1\n3*3\n")
+        assert main([str(source), "-o", str(output)]) == 0
+        assert output.read_text() == "2.0\n9.0\n"
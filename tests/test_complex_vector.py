@@ -0,0 +1,73 @@
+import pytest
+import cmath
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ScientificOperations
+from operations import complex_vector
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=200) + 1j * rng.normal(size=200)
+    b = rng.normal(size=200) + 1j * rng.normal(size=200)
+    return a, b
+
+
+class TestComplexArrays:
+    def test_arithmetic_matches_scalar(self, values):
+        a, b = values
+        sci = ScientificOperations
+        pairs = list(zip(a.tolist(), b.tolist()))
+        assert complex_vector.add(a, b).tolist() == [sci.complex_add(x, y) for x, y in pairs]
+        assert complex_vector.subtract(a, b).tolist() == [sci.complex_subtract(x, y) for x, y in pairs]
+        assert np.allclose(complex_vector.multiply(a, b), [sci.complex_multiply(x, y) for x, y in pairs],
+                           rtol=1e-15, atol=0)
+        assert np.allclose(complex_vector.divide(a, b), [sci.complex_divide(x, y) for x, y in pairs],
+                           rtol=1e-15, atol=0)
+
+    def test_divide_by_zero(self):
+        result = complex_vector.divide([1 + 1j, 2], [0, 1j])
+        assert cmath.isnan(result[0]) and result[1] == -2j
+        masked = complex_vector.divide([1 + 1j, 2], [0, 1j], masked=True)
+        assert masked.mask.tolist() == [True, False]
+
+    def test_polar_and_rect(self, values):
+        a, _ = values
+        magnitude, phase = complex_vector.polar(a)
+        expected = [cmath.polar(z) for z in a.tolist()]
+        assert np.allclose(magnitude, [r for r, _ in expected], rtol=1e-15, atol=0)
+        assert np.allclose(phase, [t for _, t in expected], rtol=1e-15, atol=0)
+        assert np.allclose(complex_vector.phase(a, degrees=True), np.degrees(phase))
+        r, theta = np.abs(a.real), a.imag * 100
+        assert complex_vector.rect(r, theta).tolist() == [ScientificOperations.complex_rect(x, t)
+                                                          for x, t in zip(r.tolist(), theta.tolist())]
+        assert complex_vector.rect(2, math.pi / 2, degrees=False) == pytest.approx(2j)
+
+    def test_conjugate_and_broadcasting(self):
+        assert complex_vector.conjugate([1 + 2j, 3]).tolist() == [1 - 2j, 3]
+        assert complex_vector.multiply([[1j], [2]], [1, 1j]).shape == (2, 2)
+        assert complex_vector.rect([1, 2, 3], 0).tolist() == [1, 2, 3]
+
+    def test_contiguous_complex128(self):
+        strided = (np.arange(10) * (1 + 1j))[::2]
+        result = complex_vector.add(strided, 1)
+        assert result.dtype == np.complex128 and result.flags['C_CONTIGUOUS']
+        assert complex_vector.magnitude([3 + 4j]).dtype == np.float64
+
+
+class TestScientificComplexArrays:
+    def test_operations(self):
+        sci = ScientificOperations
+        assert sci.complex_add_array([1j], [1]).tolist() == [1 + 1j]
+        assert sci.complex_subtract_array([1j], [1]).tolist() == [-1 + 1j]
+        assert sci.complex_multiply_array([1j], [1j]).tolist() == [-1]
+        assert sci.complex_divide_array([1j], [1j]).tolist() == [1]
+        assert sci.complex_magnitude_array([3 + 4j]).tolist() == [5]
+        assert sci.complex_phase_array([1j], degrees=True).tolist() == [90]
+        assert sci.complex_conjugate_array([1j]).tolist() == [-1j]
+        assert sci.complex_polar_array([2j])[0].tolist() == [2]
+        assert sci.complex_rect_array([1], [180]) == pytest.approx([-1])
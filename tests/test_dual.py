@@ -0,0 +1,128 @@
+import pytest
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import FinanceOperations, ScientificOperations, compile_expression
+from operations import dual
+from operations.dual import Dual
+
+
+class TestDual:
+    def test_arithmetic(self):
+        x = Dual(3.0, 1.0)
+        result = (2 * x * x - x / 4 + 1) / (x - 1)
+        value = (2 * 9 - 0.75 + 1) / 2
+        slope = ((4 * 3 - 0.25) * 2 - (2 * 9 - 0.75 + 1)) / 4
+        assert result.value == pytest.approx(value)
+        assert result.grad == pytest.approx(slope)
+        assert (5 - x).grad == -1
+        assert (6 / x).grad == pytest.approx(-6 / 9)
+        assert (-x).grad == -1 and abs(-x).grad == 1
+
+    def test_powers(self):
+        x = Dual(2.0, 1.0)
+        assert (x ** 3).grad == pytest.approx(12)
+        assert (x ** 0).grad == 0
+        assert (3 ** x).grad == pytest.approx(9 * math.log(3))
+        assert (x ** x).grad == pytest.approx(4 * (math.log(2) + 1))
+        assert dual.power(Dual(0.0, 1.0), 2).grad == 0
+        with pytest.raises(ValueError):
+            dual.power(Dual(-8.0, 1.0), 1 / 3)
+
+    @pytest.mark.parametrize("name, slope", [
+        ("sqrt", lambda v: 0.5 / math.sqrt(v)), ("exp", math.exp), ("ln", lambda v: 1 / v),
+        ("log10", lambda v: 1 / (v * math.log(10))), ("sin", math.cos), ("cos", lambda v: -math.sin(v)),
+        ("tan", lambda v: 1 / math.cos(v) ** 2), ("asin", lambda v: 1 / math.sqrt(1 - v * v)),
+        ("acos", lambda v: -1 / math.sqrt(1 - v * v)), ("atan", lambda v: 1 / (1 + v * v)),
+        ("sinh", math.cosh), ("cosh", math.sinh), ("tanh", lambda v: 1 / math.cosh(v) ** 2),
+    ])
+    def test_functions(self, name, slope):
+        result = getattr(dual, name)(Dual(0.4, 1.0))
+        assert result.grad == pytest.approx(slope(0.4))
+        assert getattr(dual, name)(0.4) == result.value
+
+    def test_gradient_direction_vector(self):
+        x, y = Dual(2.0, np.array([1.0, 0.0])), Dual(5.0, np.array([0.0, 1.0]))
+        result = dual.sin(x * y)
+        np.testing.assert_allclose(result.grad, math.cos(10) * np.array([5, 2]))
+
+    def test_arrays(self):
+        x = np.linspace(0.1, 2, 50)
+        result = dual.exp(Dual(x, 1.0) * 2)
+        np.testing.assert_allclose(result.value, np.exp(2 * x))
+        np.testing.assert_allclose(result.grad, 2 * np.exp(2 * x))
+        scaled = np.full(50, 3.0) * Dual(x, 1.0)
+        assert isinstance(scaled, Dual)
+        np.testing.assert_allclose(scaled.grad, 3)
+
+
+class TestValueAndGradient:
+    def test_scalar(self):
+        value, gradient = compile_expression("x^2 * y + sin(x) / y").value_and_gradient(x=1.5, y=2.0)
+        assert value == pytest.approx(2.25 * 2 + math.sin(1.5) / 2)
+        assert gradient['x'] == pytest.approx(6 + math.cos(1.5) / 2)
+        assert gradient['y'] == pytest.approx(2.25 - math.sin(1.5) / 4)
+
+    def test_matches_symbolic_derivative(self):
+        source = "2^x + x % 3 + abs(x) + sqrt(x) + log(x) + exp(x) + tan(x) + pow(x, 2.5) + x // 2"
+        compiled = compile_expression(source)
+        for x in (0.7, 1.3, 2.9):
+            assert compiled.value_and_gradient(x=x)[1]['x'] == pytest.approx(compiled.derivative('x')(x=x))
+
+    def test_arrays(self):
+        x = np.linspace(-1, 2, 7)
+        value, gradient = compile_expression("sqrt(x) * a").value_and_gradient(x=x, a=3.0)
+        assert value.shape == gradient['x'].shape == gradient['a'].shape == (7,)
+        valid = x > 0
+        np.testing.assert_allclose(gradient['x'][valid], 1.5 / np.sqrt(x[valid]))
+        np.testing.assert_allclose(gradient['a'][valid], np.sqrt(x[valid]))
+        assert np.isnan(value[~valid]).all() and np.isnan(gradient['x'][~valid]).all()
+
+    def test_constant(self):
+        assert compile_expression("5").value_and_gradient() == (5.0, {})
+        assert compile_expression("x - x + 1").value_and_gradient(x=2.0)[1] == {'x': 0.0}
+
+    def test_invalid(self):
+        assert compile_expression("ln(x)").value_and_gradient(x=-1.0) is None
+        assert compile_expression("1 / x").value_and_gradient(x=0.0) is None
+        assert compile_expression("factorial(x)").value_and_gradient(x=3) is None
+        assert compile_expression("x + y").value_and_gradient(x=1.0) is None
+
+    def test_complex_results_are_invalid(self):
+        assert compile_expression("x + 1j").value_and_gradient(x=1.0) is None
+        value, gradient = compile_expression("x * y + 1j").value_and_gradient(x=np.array([1.0, 2.0]), y=1.0)
+        assert np.isnan(value).all() and np.isnan(gradient['x']).all()
+
+
+class TestScientificDual:
+    def test_functions_accept_dual_numbers(self):
+        x = Dual(0.5, 1.0)
+        assert ScientificOperations.sin(x, degrees=False).grad == pytest.approx(math.cos(0.5))
+        assert ScientificOperations.sin(Dual(30.0, 1.0)).grad == pytest.approx(math.cos(math.pi / 6) * math.pi / 180)
+        assert ScientificOperations.exp(x).grad == pytest.approx(math.exp(0.5))
+        assert ScientificOperations.log(x, 2).grad == pytest.approx(1 / (0.5 * math.log(2)))
+        assert ScientificOperations.sqrt(x).grad == pytest.approx(0.5 / math.sqrt(0.5))
+        assert ScientificOperations.power(x, 3).grad == pytest.approx(0.75)
+        assert ScientificOperations.asin(x).grad == pytest.approx(180 / math.pi / math.sqrt(0.75))
+        assert ScientificOperations.ln(Dual(-1.0, 1.0)) is None
+
+    def test_plain_values_unchanged(self):
+        assert ScientificOperations.sin(30) == pytest.approx(0.5)
+        assert ScientificOperations.power(2, 10) == 1024
+
+    def test_value_and_gradient(self):
+        assert ScientificOperations.value_and_gradient("x * y^2", x=2.0, y=3.0) == (18.0, {'x': 9.0, 'y': 12.0})
+        assert ScientificOperations.value_and_gradient("x +", x=1.0) is None
+
+
+class TestInternalRateOfReturn:
+    def test_long_cash_flows(self):
+        flows = [-20000.0] + [100.0] * 360
+        rate = FinanceOperations.internal_rate_of_return(flows, 0.01)
+        npv = sum(cf / (1 + rate / 100) ** i for i, cf in enumerate(flows))
+        assert abs(npv) < 0.0001
+
+    def test_no_solution(self):
+        assert FinanceOperations.internal_rate_of_return([100, 100]) is None
@@ -0,0 +1,203 @@
+import pytest
+import cmath
+import math
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ArithmeticOperations, CompiledExpr, ExpressionError, compile_expression
+from operations.expression import parse, tokenize, optimize, Num, Var, BinOp, UnaryOp, Call
+
+
+class TestTokenizer:
+    def test_tokens(self):
+        kinds = [kind for kind, _ in tokenize("sqrt(x) ** 2.5e3 // 4")]
+        assert kinds == ['name', 'op', 'name', 'op', 'op', 'number', 'op', 'number', 'end']
+
+    def test_invalid_character(self):
+        with pytest.raises(ExpressionError):
+            tokenize("2 $ 3")
+
+
+class TestParser:
+    def test_precedence(self):
+        assert parse("1 + 2 * 3") == BinOp('+', Num(1), BinOp('*', Num(2), Num(3)))
+
+    def test_power_is_right_associative(self):
+        assert parse("2^3^2") == BinOp('^', Num(2), BinOp('^', Num(3), Num(2)))
+
+    def test_unary_minus_binds_looser_than_power(self):
+        assert parse("-x^2") == UnaryOp('-', BinOp('^', Var('x'), Num(2)))
+
+    def test_constants_and_calls(self):
+        assert parse("sin(pi)") == Call('sin', (Num(math.pi),))
+
+    def test_errors(self):
+        for bad in ["2 +", "(1", "foo(1)", "sqrt", "pow(1)", "2 3", "None"]:
+            with pytest.raises(ExpressionError):
+                parse(bad)
+
+    def test_nesting_limit(self):
+        for bad in ["-" * 3000 + "1", "(" * 3000 + "1" + ")" * 3000, "+".join(["x"] * 5000), "^".join(["x"] * 3000)]:
+            with pytest.raises(ExpressionError):
+                parse(bad)
+        assert ArithmeticOperations.evaluate("(" * 50 + "1" + ")" * 50) == 1
+        assert compile_expression("+".join(["x"] * 90)).evaluate(x=1) == 90
+
+
+class TestOptimizer:
+    def test_constant_folding(self):
+        tree, shared, report = optimize(parse("sqrt(4) + log(100) * x"))
+        assert tree == BinOp('+', Num(2.0), BinOp('*', Num(2.0), Var('x')))
+        assert report.constants_folded == 2
+
+    def test_folds_exact_constant_chain(self):
+        tree, _, report = optimize(parse("x * 4 * 180"))
+        assert tree == BinOp('*', Var('x'), Num(720))
+        assert report.operations_before == 2
+        assert report.operations_after == 1
+
+    def test_inexact_chains_keep_their_order(self):
+        for expr in ["x * pi / 180", "x * 3 / 10", "x * 6 * 30", "x * 1e-200 * 1e-200"]:
+            tree, _, _ = optimize(parse(expr))
+            assert isinstance(tree.left, BinOp)
+
+    def test_errors_are_not_folded(self):
+        tree, _, report = optimize(parse("1 / 0 + x"))
+        assert report.constants_folded == 0
+        assert ArithmeticOperations.evaluate("1 / 0 + x", x=1) is None
+
+    def test_square_becomes_multiplication(self):
+        tree, _, report = optimize(parse("y ^ 2"))
+        assert tree == BinOp('*', Var('y'), Var('y'))
+        assert report.simplifications == 1
+
+    def test_common_subexpressions(self):
+        tree, shared, report = optimize(parse("sin(x)*sin(x) + cos(x)*sin(x)"))
+        assert shared == (Call('sin', (Var('x'),)),)
+        assert report.operations_before == 7
+        assert report.operations_after == 5
+
+    def test_optimized_results_match(self):
+        for expr in ["sin(x)*sin(x) + cos(x)*sin(x)", "(x+1)^2 + sqrt((x+1)^2)", "--x + 0 * x", "2*x*3/4"]:
+            plain = compile_expression(expr, optimize=False)
+            optimized = compile_expression(expr)
+            assert optimized.report is not None
+            assert optimized.evaluate(x=0.7) == pytest.approx(plain.evaluate(x=0.7))
+
+    def test_eliminated_variable_is_still_accepted(self):
+        compiled = compile_expression("x ^ 0 + y * 0")
+        assert compiled.variables == ('x', 'y')
+        assert compiled.evaluate(x=3, y=2) == 1
+
+    def test_reassociation_does_not_overflow(self):
+        assert compile_expression("x * 1e308 * 10").evaluate(x=0) == 0
+
+    def test_reassociation_does_not_underflow(self):
+        assert compile_expression("x * 1e-200 * 1e-200").evaluate(x=1e300) == pytest.approx(1e-100)
+
+    def test_reassociation_keeps_rounding(self):
+        assert compile_expression("x * 3 / 10").evaluate(x=0.1) == 0.1 * 3 / 10
+        assert compile_expression("x * 6 * 30").evaluate(x=0.1) == 0.1 * 6 * 30
+        for x in (0.1, 1e308, 5e-324, -3.7):
+            assert compile_expression("x * 8 * 3")(x=x) == x * 8 * 3
+
+    def test_identities_keep_the_type(self):
+        tree, _, _ = optimize(parse("x + 0j"))
+        assert tree == BinOp('+', Var('x'), Num(0j))
+        assert compile_expression("x + 0j")(x=1) == 1 + 0j
+        assert ArithmeticOperations.evaluate("sqrt(x + 0j)", x=-4) == 2j
+
+
+class TestCompiledExpr:
+    def test_compile_returns_compiled_expr(self):
+        compiled = compile_expression("sqrt(x^2 + y^2)")
+        assert isinstance(compiled, CompiledExpr)
+        assert compiled.variables == ('x', 'y')
+        assert compiled(x=3, y=4) == 5
+        assert compiled.evaluate(x=6, y=8) == 10.0
+
+    def test_compile_is_cached(self):
+        assert compile_expression("x + 1") is compile_expression("x + 1")
+
+    def test_evaluate_errors_return_none(self):
+        compiled = compile_expression("1 / x")
+        assert compiled.evaluate(x=0) is None
+        assert compiled.evaluate() is None
+
+
+class TestArithmeticEvaluate:
+    def test_evaluate(self):
+        assert ArithmeticOperations.evaluate("2 + 3 * 4") == 14
+        assert ArithmeticOperations.evaluate("2^10") == 1024
+        assert ArithmeticOperations.evaluate("sqrt(16) + factorial(3)") == 10
+        assert ArithmeticOperations.evaluate("log(100) + ln(e)") == pytest.approx(3)
+
+    def test_evaluate_with_variables(self):
+        assert ArithmeticOperations.evaluate("x * y", x=3, y=4) == 12
+
+    def test_unused_variables_are_ignored(self):
+        assert ArithmeticOperations.evaluate("x + 1", x=1, y=2) == 2
+        assert ArithmeticOperations.evaluate("2", y=2) == 2
+        assert ArithmeticOperations.evaluate("sqrt(x)", x=-4 + 0j, y=2) == 2j
+        assert ArithmeticOperations.evaluate("x + y", x=1) is None
+
+    def test_evaluate_invalid(self):
+        assert ArithmeticOperations.evaluate("1/0") is None
+        assert ArithmeticOperations.evaluate("__import__('os')") is None
+        assert ArithmeticOperations.evaluate("2 +") is None
+
+
+class TestComplexExpressions:
+    def test_literals(self):
+        assert tokenize("3+4j")[:3] == [('number', '3'), ('op', '+'), ('number', '4j')]
+        assert parse("2.5J") == Num(2.5j)
+        assert ArithmeticOperations.evaluate("3+4j") == 3 + 4j
+        assert ArithmeticOperations.evaluate("(1+2j) * (3-4j)") == 11 + 2j
+        assert ArithmeticOperations.evaluate("abs(3+4j)") == 5.0
+
+    def test_cmath_functions(self):
+        assert ArithmeticOperations.evaluate("exp(1j * pi)") == pytest.approx(-1)
+        assert ArithmeticOperations.evaluate("sqrt(-4 + 0j)") == 2j
+        assert ArithmeticOperations.evaluate("ln(1j)") == pytest.approx(cmath.log(1j))
+        assert ArithmeticOperations.evaluate("real(z) + imag(z) + phase(1j)", z=2 + 3j) == pytest.approx(5 + math.pi / 2)
+        assert ArithmeticOperations.evaluate("conj(z)", z=2 + 3j) == 2 - 3j
+
+    def test_real_expressions_stay_real(self):
+        assert ArithmeticOperations.evaluate("sqrt(-1)") is None
+        assert ArithmeticOperations.evaluate("(-8)^(1/3)") is None
+        assert ArithmeticOperations.evaluate("x^0.5", x=-4) is None
+        assert ArithmeticOperations.evaluate("x^0.5", x=-4 + 0j) == pytest.approx(2j)
+
+    def test_complex_variables_fall_back_to_cmath(self):
+        compiled = compile_expression("sin(x) + 1")
+        assert compiled(x=0.5) == math.sin(0.5) + 1
+        assert compiled(x=1j) == pytest.approx(cmath.sin(1j) + 1)
+        assert compiled.evaluate(x=1j) == pytest.approx(cmath.sin(1j) + 1)
+        assert compiled.function is not compiled.complex_function
+
+
+class TestDerivatives:
+    @pytest.mark.parametrize("source", [
+        "x^3 - 2*x", "sin(x) * cos(x)", "exp(2*x) / (1 + x^2)", "ln(x) + log(x)", "sqrt(x) + tan(x)",
+        "x^x", "pow(x, 2.5)", "abs(x - 3)", "2^x",
+    ])
+    def test_matches_central_difference(self, source):
+        compiled = compile_expression(source)
+        derivative = compiled.derivative('x')
+        for x in (0.7, 1.3, 2.1):
+            h = 1e-6
+            expected = (compiled(x=x + h) - compiled(x=x - h)) / (2 * h)
+            assert derivative(x=x) == pytest.approx(expected, rel=1e-6)
+
+    def test_other_variables_are_constants(self):
+        derivative = compile_expression("a * x^2 + y").derivative('x')
+        assert derivative.variables == ('a', 'x', 'y') or set(derivative.variables) == {'a', 'x', 'y'}
+        assert derivative.evaluate(a=3, x=2, y=5) == 12
+
+    def test_cached(self):
+        compiled = compile_expression("x^2")
+        assert compiled.derivative('x') is compiled.derivative('x')
+
+    def test_unsupported_function(self):
+        with pytest.raises(ExpressionError):
+            compile_expression("factorial(x)").derivative('x')
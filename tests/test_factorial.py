@@ -0,0 +1,60 @@
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ArithmeticOperations, ScientificOperations, compile_expression, evaluate_batch
+from operations.factorial import (SMALL_FACTORIALS, factorial, double_factorial,
+                                  falling_factorial, rising_factorial, multinomial, range_product)
+
+
+class TestFactorialEngine:
+    def test_small_table(self):
+        assert SMALL_FACTORIALS[0] == 1
+        assert SMALL_FACTORIALS[20] == math.factorial(20)
+        assert len(SMALL_FACTORIALS) == 171
+
+    def test_matches_math_factorial(self):
+        for n in (0, 1, 5, 170, 171, 1000, 20000, 20007):
+            assert factorial(n) == math.factorial(n)
+        assert factorial(-1) is None
+
+    def test_integral_floats(self):
+        assert factorial(5.0) == 120
+        assert factorial(200.0) == math.factorial(200)
+        assert factorial(2.5) is None
+        assert factorial(-1.0) is None
+        assert factorial(float('inf')) is None
+        assert compile_expression("factorial(n)").evaluate(n=5.0) == 120
+        assert evaluate_batch("factorial(n)", n=np.array([5.0, 2.5]))[0] == 120
+
+    def test_arithmetic_and_scientific_share_engine(self):
+        assert ArithmeticOperations.factorial(30) == ScientificOperations.factorial(30) == math.factorial(30)
+        assert ArithmeticOperations.factorial(-3) is None
+
+    def test_double_factorial(self):
+        assert double_factorial(-1) == 1
+        assert double_factorial(0) == 1
+        assert double_factorial(7) == 7 * 5 * 3
+        assert double_factorial(8) == 8 * 6 * 4 * 2
+        assert double_factorial(301) == range_product(301, 0, -2)
+        assert double_factorial(-2) is None
+
+    def test_falling_and_rising_factorial(self):
+        assert falling_factorial(10, 3) == 720
+        assert falling_factorial(3, 5) == 0
+        assert falling_factorial(5, 0) == 1
+        assert falling_factorial(-2, 2) == 6
+        assert falling_factorial(5, -1) is None
+        assert rising_factorial(3, 4) == 360
+        assert ScientificOperations.falling_factorial(50, 20) == math.perm(50, 20)
+
+    def test_multinomial(self):
+        assert multinomial(2, 1, 1) == 12
+        assert multinomial() == 1
+        assert multinomial(300, 200, 100) == math.comb(600, 300) * math.comb(300, 200)
+        assert ScientificOperations.multinomial(1, -1) is None
+
+    def test_expression_uses_engine(self):
+        assert ArithmeticOperations.evaluate("factorial(5) + factorial(0)") == 121
+        assert ArithmeticOperations.evaluate("factorial(-1)") is None
@@ -0,0 +1,82 @@
+import math
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ScientificOperations
+from operations.factorization import FACTOR_CACHE, TRIAL_DIVISION_LIMIT, factorize, prime_factors, _ecm, _pollard_brent
+from operations.primes import is_prime
+
+
+def _check(n, factors):
+    assert math.prod(p ** e for p, e in factors.items()) == n
+    assert all(is_prime(p) for p in factors)
+    assert list(factors) == sorted(factors)
+
+
+class TestFactorize:
+    def test_small_numbers(self):
+        for n in range(1, 3000):
+            _check(n, factorize(n))
+
+    def test_invalid(self):
+        assert factorize(0) is None
+        assert factorize(-12) is None
+        assert prime_factors(0) is None
+
+    def test_grouped_exponents(self):
+        assert factorize(360360) == {2: 3, 3: 2, 5: 1, 7: 1, 11: 1, 13: 1}
+        assert factorize(2 ** 64 - 1) == {3: 1, 5: 1, 17: 1, 257: 1, 641: 1, 65537: 1, 6700417: 1}
+
+    def test_semiprime_of_ten_digit_primes(self):
+        FACTOR_CACHE.clear()
+        assert factorize(9999999967 * 9999999943) == {9999999943: 1, 9999999967: 1}
+
+    def test_without_ecm(self):
+        FACTOR_CACHE.clear()
+        assert factorize(1000000007 * 998244353, use_ecm=False) == {998244353: 1, 1000000007: 1}
+
+    def test_prime_powers(self):
+        n = 1000000007 ** 3 * 998244353 ** 2
+        assert factorize(n) == {998244353: 2, 1000000007: 3}
+        assert factorize(10007 ** 5) == {10007: 5}
+
+    def test_large_prime(self):
+        assert factorize(2 ** 127 - 1) == {2 ** 127 - 1: 1}
+
+    def test_cache_is_reused(self):
+        FACTOR_CACHE.clear()
+        n = 600851475143 * 10007
+        assert factorize(n) == factorize(n)
+        assert FACTOR_CACHE.stats.hits == 1
+        factorize(n)[71] = 99
+        assert factorize(n)[71] == 1
+
+    def test_small_numbers_skip_cache(self):
+        FACTOR_CACHE.clear()
+        factorize(TRIAL_DIVISION_LIMIT ** 2 - 1)
+        assert FACTOR_CACHE.stats.size == 0
+
+    def test_prime_factors_flattened(self):
+        assert prime_factors(360) == [2, 2, 2, 3, 3, 5]
+
+
+class TestFactorizationStages:
+    def test_pollard_brent(self):
+        factor = _pollard_brent(1000000007 * 998244353, 1, None)
+        assert factor in (1000000007, 998244353)
+
+    def test_pollard_brent_budget(self):
+        assert _pollard_brent(9999999967 * 9999999943, 1, 64) is None
+
+    def test_ecm(self):
+        n = 1000000007 * 998244353 * 1000000009
+        factor = _ecm(n)
+        assert factor is not None and 1 < factor < n and n % factor == 0
+
+
+class TestScientificFactorization:
+    def test_prime_factorization(self):
+        assert ScientificOperations.prime_factorization(600851475143) == [71, 839, 1471, 6857]
+
+    def test_factorize(self):
+        assert ScientificOperations.factorize(2 ** 10 * 3 ** 4) == {2: 10, 3: 4}
@@ -0,0 +1,116 @@
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ArithmeticOperations, ScientificOperations, FinanceOperations, MemoCache, MemoizedOperations
+from models.calculator_model import CalculatorModel
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMemoCache:
+    def test_lru_eviction(self):
+        cache = MemoCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+        assert cache.stats.evictions == 1
+        assert cache.get('a') == 1
+        cache.get('b')
+        assert cache.stats.misses == 1
+        assert cache.stats.size == 2
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = MemoCache(maxsize=10, ttl=5, clock=clock)
+        cache.put('a', 1)
+        clock.now = 4
+        assert cache.get('a') == 1
+        clock.now = 5
+        cache.get('a')
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 1
+
+
+class TestMemoizedOperations:
+    def test_hits_and_misses_per_operation(self):
+        finance = MemoizedOperations(FinanceOperations)
+        first = finance.compound_interest(1000, 5, 10)
+        assert finance.compound_interest(1000, 5, 10) == first
+        finance.roi(100, 150)
+        stats = finance.cache_stats()
+        assert stats['compound_interest'].hits == 1
+        assert stats['compound_interest'].misses == 1
+        assert stats['roi'].misses == 1
+
+    def test_impure_operations_are_not_cached(self):
+        sci = MemoizedOperations(ScientificOperations)
+        assert 'random' not in sci.caches
+        assert 'randint' not in sci.caches
+        assert 0 <= sci.random() < 1
+
+    def test_argument_types_are_part_of_the_key(self):
+        arith = MemoizedOperations(ArithmeticOperations)
+        assert arith.add(1, 2) == 3
+        assert isinstance(arith.add(1.0, 2.0), float)
+        assert arith.cache_stats()['add'].misses == 2
+
+    def test_list_arguments_and_results(self):
+        sci = MemoizedOperations(ScientificOperations)
+        factors = sci.prime_factorization(12)
+        factors.append(99)
+        assert sci.prime_factorization(12) == [2, 2, 3]
+        finance = MemoizedOperations(FinanceOperations)
+        assert finance.net_present_value(10, [100, 100]) == finance.net_present_value(10, [100, 100])
+        assert finance.cache_stats()['net_present_value'].hits == 1
+
+    def test_array_results_are_copied(self):
+        sci = MemoizedOperations(ScientificOperations)
+        result = sci.is_prime_batch([2, 4])
+        result[0] = False
+        assert sci.is_prime_batch([2, 4]).tolist() == [True, False]
+
+    def test_nested_arrays_are_copied(self):
+        finance = MemoizedOperations(FinanceOperations)
+        schedule = finance.amortization_schedule(1200, 0, 12)
+        schedule['period'][0] = -999
+        assert finance.amortization_schedule(1200, 0, 12)['period'][0] == 1
+        sci = MemoizedOperations(ScientificOperations)
+        values, errors = sci.integrate_batch("x", 'x', 0.0, 1.0)
+        values[...] = -1
+        assert sci.integrate_batch("x", 'x', 0.0, 1.0)[0] == 0.5
+
+    def test_iterators_are_not_cached(self):
+        class Counting:
+            @staticmethod
+            def count(n):
+                return iter(range(n))
+
+        counting = MemoizedOperations(Counting)
+        assert list(counting.count(3)) == [0, 1, 2]
+        assert list(counting.count(3)) == [0, 1, 2]
+        assert counting.cache_stats()['count'].size == 0
+        assert counting.cache_stats()['count'].bypassed == 2
+
+    def test_unhashable_arguments_bypass_cache(self):
+        arith = MemoizedOperations(ArithmeticOperations)
+        result = arith.evaluate_batch("x + 1", x=np.array([1.0, 2.0]))
+        assert result.tolist() == [2.0, 3.0]
+        assert arith.cache_stats()['evaluate_batch'].bypassed == 1
+
+    def test_model_opt_in(self):
+        model = CalculatorModel()
+        assert model.cache_stats() == {}
+        model.enable_memoization(maxsize=8)
+        model.apply_unary_operation("sin")
+        model.apply_unary_operation("sin")
+        assert model.cache_stats()['ScientificOperations']['sin'].misses >= 1
+        model.disable_memoization()
+        assert model.cache_stats() == {}
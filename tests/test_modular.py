@@ -0,0 +1,104 @@
+import pytest
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ScientificOperations
+from operations.modular import TABLE_LIMIT, comb_mod, comb_mod_batch, factorial_table, perm_mod, perm_mod_batch
+
+MOD = 1000000007
+
+
+def _values(result):
+    return [None if masked else int(value) for value, masked in zip(result.data.ravel(), np.ma.getmaskarray(result).ravel())]
+
+
+class TestCombMod:
+    @pytest.mark.parametrize("p", [2, 3, 5, 7, 13, 101])
+    def test_small_primes_match_exact(self, p):
+        for n in range(60):
+            for r in range(n + 1):
+                assert comb_mod(n, r, p) == math.comb(n, r) % p
+                assert perm_mod(n, r, p) == math.perm(n, r) % p
+
+    def test_large_prime(self):
+        assert comb_mod(1000, 500, MOD) == math.comb(1000, 500) % MOD
+        assert perm_mod(1000, 300, MOD) == math.perm(1000, 300) % MOD
+
+    def test_lucas(self):
+        n, r = 10 ** 15 + 37, 10 ** 9 + 11
+        assert comb_mod(n, r, 13) == math.prod(math.comb(a, b) % 13 for a, b in zip(self._digits(n, 13),
+                                                                                      self._digits(r, 13))) % 13
+
+    @staticmethod
+    def _digits(n, p):
+        digits = []
+        while n:
+            digits.append(n % p)
+            n //= p
+        return digits + [0] * 40
+
+    def test_perm_past_modulus(self):
+        assert perm_mod(20, 3, 7) == math.perm(20, 3) % 7
+        assert perm_mod(20, 8, 7) == 0
+
+    def test_invalid(self):
+        assert comb_mod(3, 5, 7) is None
+        assert comb_mod(-1, 0, 7) is None
+        assert comb_mod(5, 2, 8) is None
+        assert perm_mod(5, -1, 7) is None
+
+    def test_modulus_beyond_int64_products(self):
+        p = 2 ** 61 - 1
+        assert comb_mod(10 ** 6, 3, p) == math.comb(10 ** 6, 3) % p
+
+    def test_table_is_shared_and_bounded(self):
+        table = factorial_table(998244353)
+        comb_mod(5000, 10, 998244353)
+        size = table.size
+        assert size > 5000
+        comb_mod(4000, 10, 998244353)
+        assert table.size == size
+        assert factorial_table(7).size <= 7
+        comb_mod(3, 1, 7)
+        assert factorial_table(7).size <= 7
+        assert TABLE_LIMIT >= 10 ** 6
+
+
+class TestModularBatch:
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        n = rng.integers(-5, 5000, 500)
+        r = rng.integers(-5, 5000, 500)
+        assert _values(comb_mod_batch(n, r, MOD)) == [comb_mod(int(a), int(b), MOD) for a, b in zip(n, r)]
+        assert _values(perm_mod_batch(n, r, MOD)) == [perm_mod(int(a), int(b), MOD) for a, b in zip(n, r)]
+
+    def test_lucas_batch(self):
+        rng = np.random.default_rng(1)
+        n = rng.integers(0, 10 ** 12, 300)
+        r = rng.integers(0, 10 ** 12, 300)
+        assert _values(comb_mod_batch(n, r, 13)) == [comb_mod(int(a), int(b), 13) for a, b in zip(n, r)]
+        assert _values(perm_mod_batch(n, r, 13)) == [perm_mod(int(a), int(b), 13) for a, b in zip(n, r)]
+
+    def test_broadcasting(self):
+        result = comb_mod_batch(10, np.arange(4), MOD)
+        assert result.tolist() == [1, 10, 45, 120]
+
+    def test_lists_and_big_modulus(self):
+        assert _values(comb_mod_batch([10, 20, 3], [3, 4, 5], 2 ** 61 - 1)) == [120, 4845, None]
+
+    def test_invalid_modulus(self):
+        assert comb_mod_batch([5], [2], 8) is None
+        assert perm_mod_batch([5], [2], 1) is None
+
+    def test_empty(self):
+        assert comb_mod_batch([], [], 7).size == 0
+
+
+class TestScientificModular:
+    def test_operations(self):
+        assert ScientificOperations.comb_mod(10, 3, 7) == 120 % 7
+        assert ScientificOperations.perm_mod(10, 3, 7) == 720 % 7
+        assert ScientificOperations.comb_mod_batch([10], [3], 7).tolist() == [120 % 7]
+        assert ScientificOperations.perm_mod_batch([10], [3], 7).tolist() == [720 % 7]
@@ -0,0 +1,151 @@
+import pytest
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ScientificOperations
+from operations.factorization import FACTOR_CACHE
+from operations.number_theory import (batch_gcd, crt, divisor_count, divisor_count_range, divisor_sum,
+                                      divisor_sum_range, divisors, gcd_array, gcd_many, lcm_many, mobius, mobius_range,
+                                      mod_inverse, mod_pow, totient, totient_range)
+
+
+def _brute_totient(n):
+    return sum(1 for k in range(1, n + 1) if math.gcd(n, k) == 1)
+
+
+def _brute_divisors(n):
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+
+class TestArithmeticFunctions:
+    def test_totient(self):
+        assert [totient(n) for n in range(1, 200)] == [_brute_totient(n) for n in range(1, 200)]
+        assert totient(9999999967 * 9999999943) == 9999999966 * 9999999942
+
+    def test_divisors(self):
+        for n in range(1, 200):
+            expected = _brute_divisors(n)
+            assert divisors(n) == expected
+            assert divisor_count(n) == len(expected)
+            assert divisor_sum(n) == sum(expected)
+            assert divisor_sum(n, 2) == sum(d * d for d in expected)
+            assert divisor_sum(n, 0) == len(expected)
+
+    def test_mobius(self):
+        assert [mobius(n) for n in range(1, 13)] == [1, -1, -1, 0, -1, 1, -1, 0, 0, 1, -1, 0]
+
+    def test_invalid(self):
+        for function in (totient, divisor_count, divisor_sum, divisors, mobius):
+            assert function(0) is None
+            assert function(-5) is None
+
+    def test_shared_factorization_cache(self):
+        FACTOR_CACHE.clear()
+        n = 9999999967 * 9999999943
+        totient(n)
+        divisor_count(n)
+        mobius(n)
+        assert FACTOR_CACHE.stats.size == 1
+        assert FACTOR_CACHE.stats.hits == 2
+
+
+class TestModularArithmetic:
+    def test_mod_inverse(self):
+        assert mod_inverse(3, 7) == 5
+        assert mod_inverse(-3, 7) == 2
+        assert mod_inverse(2, 4) is None
+        assert mod_inverse(3, 0) is None
+
+    def test_mod_pow(self):
+        assert mod_pow(2, 10, 1000) == 24
+        assert mod_pow(2, -1, 7) == 4
+        assert mod_pow(2, -1, 4) is None
+        assert mod_pow(5, 3, 1) == 0
+        assert mod_pow(5, 3, 0) is None
+
+    def test_crt(self):
+        assert crt([2, 3, 2], [3, 5, 7]) == (23, 105)
+        assert crt([1, 3], [4, 6]) == (9, 12)
+        assert crt([1, 2], [4, 6]) is None
+        assert crt([], []) == (0, 1)
+        assert crt([1], [0]) is None
+        assert crt([1, 2], [3]) is None
+
+
+class TestRangeFunctions:
+    @pytest.mark.parametrize("start,stop", [(1, 2000), (999, 1200), (10 ** 12, 10 ** 12 + 1000),
+                                            (10 ** 15, 10 ** 15 + 500)])
+    def test_match_scalar(self, start, stop):
+        numbers = range(start, stop)
+        assert totient_range(start, stop).tolist() == [totient(n) for n in numbers]
+        assert mobius_range(start, stop).tolist() == [mobius(n) for n in numbers]
+        assert divisor_count_range(start, stop).tolist() == [divisor_count(n) for n in numbers]
+        assert divisor_sum_range(start, stop).tolist() == [divisor_sum(n) for n in numbers]
+
+    def test_empty_and_invalid(self):
+        assert totient_range(5, 5).tolist() == []
+        assert totient_range(0, 5) is None
+        assert mobius_range(-1, 5) is None
+
+    def test_large_range(self):
+        result = totient_range(1, 100001)
+        assert result[-1] == totient(100000)
+        assert int(result.sum()) == 3039650754
+
+
+class TestScientificNumberTheory:
+    def test_operations(self):
+        assert ScientificOperations.totient(36) == 12
+        assert ScientificOperations.divisors(12) == [1, 2, 3, 4, 6, 12]
+        assert ScientificOperations.crt([2, 3], [3, 5]) == (8, 15)
+        assert ScientificOperations.totient_range(1, 6).tolist() == [1, 1, 2, 2, 4]
+
+
+class TestGcdLcm:
+    def test_gcd_many(self):
+        assert gcd_many([12, 18, -30]) == 6
+        assert gcd_many(np.array([12, 18, 30])) == 6
+        assert gcd_many([2 ** 100, 2 ** 90 * 3]) == 2 ** 90
+        assert gcd_many([]) == 0
+
+    def test_lcm_many(self):
+        assert lcm_many([4, 6, 10]) == 60
+        assert lcm_many([]) == 1
+        assert lcm_many([0, 5]) == 0
+        assert lcm_many([-4, 6]) == 12
+
+    def test_lcm_many_does_not_overflow_int64(self):
+        values = np.array([2 ** 40, 3 ** 30, 5 ** 20])
+        assert lcm_many(values) == 2 ** 40 * 3 ** 30 * 5 ** 20
+
+    def test_gcd_array(self):
+        assert gcd_array(np.array([12, 18, 0]), 8).tolist() == [4, 2, 8]
+        assert gcd_array(np.array([[4], [6]]), np.array([2, 3])).tolist() == [[2, 1], [2, 3]]
+        assert gcd_array([2 ** 80, 12], [2 ** 70, 18]).tolist() == [2 ** 70, 6]
+
+    def test_batch_gcd_finds_shared_factors(self):
+        p, q, r, s, t = 1000000007, 998244353, 1000000009, 1000003, 999983
+        moduli = [p * q, r * s, p * t, s * 1000033, 7919 * 104729]
+        assert batch_gcd(moduli) == [p, s, p, s, 1]
+
+    def test_batch_gcd_matches_pairwise(self):
+        moduli = [n * (n + 2) for n in range(3, 200, 4)]
+        expected = [math.gcd(n, math.prod(moduli[:i] + moduli[i + 1:])) for i, n in enumerate(moduli)]
+        assert batch_gcd(moduli) == expected
+        assert batch_gcd(np.array(moduli)) == expected
+
+    def test_batch_gcd_edge_cases(self):
+        assert batch_gcd([]) == []
+        assert batch_gcd([15]) == [1]
+        assert batch_gcd([15, 0]) is None
+
+    def test_scientific_operations(self):
+        assert ScientificOperations.lcm(4, 6) == 12
+        assert ScientificOperations.lcm(0, 0) == 0
+        assert ScientificOperations.lcm(2 ** 4000, 2 ** 3999) == 2 ** 4000
+        assert ScientificOperations.gcd_many([8, 12]) == 4
+        assert ScientificOperations.lcm_many([8, 12]) == 24
+        assert ScientificOperations.gcd_array([8], [12]).tolist() == [4]
+        assert ScientificOperations.batch_gcd([6, 10, 7]) == [2, 2, 1]
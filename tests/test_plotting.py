@@ -0,0 +1,113 @@
+import pytest
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ExpressionError, ScientificOperations
+from operations.plotting import CurveSampler, adaptive_sample, curve_function, decimate, tabulate
+
+
+class TestCurveFunction:
+    def test_vectorized(self):
+        x, y = tabulate("x^2", 'x', 0, 2, 5)
+        np.testing.assert_allclose(x, [0, 0.5, 1, 1.5, 2])
+        np.testing.assert_allclose(y, [0, 0.25, 1, 2.25, 4])
+
+    def test_constant(self):
+        np.testing.assert_allclose(curve_function("3")(np.arange(4.0)), 3)
+
+    def test_undefined_values_are_gaps(self):
+        y = curve_function("sqrt(x) + 1/(x - 2)")(np.array([-1.0, 1.0, 2.0]))
+        assert np.isnan(y[0]) and np.isnan(y[2]) and y[1] == 0
+
+    def test_missing_variable(self):
+        with pytest.raises(ExpressionError):
+            curve_function("x * a")
+
+
+class TestAdaptiveSample:
+    def test_straight_line_is_not_refined(self):
+        x, _ = adaptive_sample(curve_function("2*x + 1"), -1, 1, 100)
+        assert x.size == 100
+
+    def test_refines_where_curve_bends(self):
+        x, y = adaptive_sample(curve_function("sin(1/x)"), 0.01, 1, 200)
+        assert np.all(np.diff(x) > 0)
+        assert x.size > 200
+        # Most of the added points are where the curve oscillates fastest.
+        assert np.count_nonzero(x < 0.1) > np.count_nonzero(x >= 0.1)
+        np.testing.assert_allclose(y, np.sin(1 / x))
+
+    def test_refines_domain_edge(self):
+        x, y = adaptive_sample(curve_function("sqrt(x)"), -1, 1, 20)
+        assert x[np.isfinite(y)][0] < 1e-3
+
+    def test_depth_limit(self):
+        x, _ = adaptive_sample(curve_function("sin(1/x)"), 0.001, 1, 50, max_depth=0)
+        assert x.size == 50
+
+
+class TestDecimate:
+    def test_keeps_extremes(self):
+        x = np.linspace(0, 1, 200000)
+        y = np.sin(50 * x) + np.random.default_rng(0).normal(0, 0.1, x.size)
+        xs, ys = decimate(x, y, 0, 1, 500)
+        assert xs.size <= 4 * 503
+        assert ys.max() == y.max() and ys.min() == y.min()
+
+    def test_small_input_unchanged(self):
+        x = np.linspace(0, 1, 100)
+        xs, ys = decimate(x, x, 0, 1, 500)
+        np.testing.assert_array_equal(xs, x)
+
+    def test_clips_to_view_with_one_point_beyond(self):
+        x = np.linspace(0, 10, 11)
+        xs, _ = decimate(x, x, 2.5, 5.5, 100)
+        np.testing.assert_array_equal(xs, [2, 3, 4, 5, 6])
+
+    def test_gaps_survive(self):
+        x = np.linspace(-1, 1, 100000)
+        y = np.where(np.abs(x) < 0.1, np.nan, x)
+        _, ys = decimate(x, y, -1, 1, 200)
+        assert np.isnan(ys).any()
+
+
+class TestCurveSampler:
+    def test_pan_samples_only_new_strip(self):
+        sampler = CurveSampler("sin(x) * x")
+        sampler.visible(-10, 10, 800)
+        before = sampler.evaluations
+        sampler.visible(-9, 11, 800)
+        assert 0 < sampler.evaluations - before < 200
+        assert sampler.x[-1] == 11
+
+    def test_zoom_in_resamples_visible_range(self):
+        sampler = CurveSampler("sin(x) * x")
+        sampler.visible(-10, 10, 800)
+        sampler.visible(-1, 1, 800)
+        assert sampler.x[0] == -1 and sampler.x[-1] == 1
+        assert sampler.x.size >= 1600
+
+    def test_zoom_out_extends_at_coarser_step(self):
+        sampler = CurveSampler("x")
+        sampler.visible(-1, 1, 100)
+        before = sampler.evaluations
+        sampler.visible(-10, 10, 100)
+        assert sampler.evaluations - before < 400
+        assert sampler.x[0] == -10 and sampler.x[-1] == 10
+
+    def test_y_range(self):
+        sampler = CurveSampler("x")
+        sampler.sample(-1, 1, 100)
+        low, high = sampler.y_range()
+        assert low < -0.9 and high > 0.9
+        assert CurveSampler("sqrt(-1 - x^2)").y_range() == (-1.0, 1.0)
+
+
+class TestTabulate:
+    def test_scientific(self):
+        x, y = ScientificOperations.tabulate("x^2", 'x', 0, 1, 11)
+        np.testing.assert_allclose(y, x ** 2)
+        x, y = ScientificOperations.tabulate("sin(1/x)", 'x', 0.01, 1, 100, adaptive=True)
+        assert x.size > 100
+        assert ScientificOperations.tabulate("x +") is None
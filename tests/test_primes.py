@@ -0,0 +1,81 @@
+import pytest
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ScientificOperations
+from operations.primes import (SIEVE_LIMIT, is_prime, is_prime_batch, is_strong_probable_prime,
+                               is_strong_lucas_probable_prime)
+
+
+def _trial_division(n):
+    if n < 2:
+        return False
+    d = 2
+    while d * d <= n:
+        if n % d == 0:
+            return False
+        d += 1
+    return True
+
+
+class TestIsPrime:
+    def test_small_range(self):
+        assert [n for n in range(-5, 5000) if is_prime(n)] == [n for n in range(5000) if _trial_division(n)]
+
+    def test_around_sieve_limit(self):
+        for n in range(SIEVE_LIMIT - 500, SIEVE_LIMIT + 500):
+            assert is_prime(n) == _trial_division(n), n
+
+    @pytest.mark.parametrize("n", [2047, 1373653, 25326001, 3215031751, 2152302898747, 3474749660383,
+                                   341550071728321, 3825123056546413051, 318665857834031151167461,
+                                   3317044064679887385961981, 561, 41041, 825265])
+    def test_pseudoprimes_are_composite(self, n):
+        assert is_prime(n) is False
+
+    @pytest.mark.parametrize("exponent", [61, 89, 107, 127, 521])
+    def test_mersenne_primes(self, exponent):
+        assert is_prime(2 ** exponent - 1) is True
+        assert is_prime(2 ** exponent + 1) is False
+
+    def test_64_bit_boundary(self):
+        assert is_prime(18446744073709551557) is True
+        assert is_prime(2 ** 64 + 13) is True
+        assert is_prime((2 ** 31 - 1) * (2 ** 61 - 1)) is False
+
+    def test_strong_probable_prime(self):
+        assert is_strong_probable_prime(2047, 2) is True
+        assert is_strong_probable_prime(2047, 3) is False
+
+    def test_strong_lucas_pseudoprimes(self):
+        pseudoprimes = [n for n in range(3, 20000, 2) if is_strong_lucas_probable_prime(n) and not _trial_division(n)]
+        assert pseudoprimes == [5459, 5777, 10877, 16109, 18971]
+
+    def test_scientific_operations(self):
+        assert ScientificOperations.is_prime(999999000001) is True
+        assert ScientificOperations.is_prime(999999000001 * 1000003) is False
+        assert ScientificOperations.is_prime(1000000007) is True
+        assert ScientificOperations.is_prime(7.0) is True
+        assert ScientificOperations.is_prime(7.5) is False
+
+
+class TestIsPrimeBatch:
+    def test_array_matches_scalar(self):
+        values = np.arange(-10, 20000)
+        np.testing.assert_array_equal(is_prime_batch(values), [_trial_division(int(n)) for n in values])
+
+    def test_large_values(self):
+        values = np.array([SIEVE_LIMIT + 15, 4294967291, 4294967295, 2 ** 62 + 135], dtype=np.uint64)
+        assert is_prime_batch(values).tolist() == [is_prime(int(n)) for n in values.tolist()]
+
+    def test_list_of_big_integers(self):
+        assert is_prime_batch([2 ** 89 - 1, 15, 2 ** 64 + 13]).tolist() == [True, False, True]
+
+    def test_float_array(self):
+        assert is_prime_batch(np.array([7.0, 7.5, -3.0, np.nan, 2.0])).tolist() == [True, False, False, False, True]
+
+    def test_shape_is_preserved(self):
+        assert is_prime_batch(np.arange(12).reshape(3, 4)).shape == (3, 4)
+
+    def test_scientific_operations(self):
+        assert ScientificOperations.is_prime_batch([2, 3, 4]).tolist() == [True, True, False]
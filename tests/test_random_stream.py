@@ -0,0 +1,79 @@
+import pytest
+import json
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import MemoizedOperations, RandomStream, ScientificOperations
+from operations.random_stream import spawn_streams
+
+
+class TestRandomStream:
+    def test_seed_is_reproducible(self):
+        a, b = RandomStream(7), RandomStream(7)
+        assert np.array_equal(a.uniform(1000), b.uniform(1000))
+        assert np.array_equal(a.integers(1000, 1, 6), b.integers(1000, 1, 6))
+        assert np.array_equal(a.normal(1000), b.normal(1000))
+        assert not np.array_equal(RandomStream(8).uniform(10), RandomStream(7).uniform(10))
+
+    def test_unseeded_stream_can_be_replayed(self):
+        stream = RandomStream()
+        assert np.array_equal(RandomStream(stream.entropy).uniform(10), stream.uniform(10))
+
+    def test_distributions(self):
+        stream = RandomStream(1)
+        uniform = stream.uniform((200, 50), -2.0, 3.0)
+        assert uniform.shape == (200, 50)
+        assert uniform.min() >= -2.0 and uniform.max() < 3.0
+        integers = stream.integers(10000, 1, 6)
+        assert integers.dtype == np.int64
+        assert set(integers.tolist()) == {1, 2, 3, 4, 5, 6}
+        normal = stream.normal(100000, 5.0, 2.0)
+        assert normal.mean() == pytest.approx(5.0, abs=0.05)
+        assert normal.std() == pytest.approx(2.0, abs=0.05)
+        assert stream.uniform(0).size == 0
+
+    def test_invalid_arguments(self):
+        stream = RandomStream(1)
+        assert stream.uniform(10, 2.0, 1.0) is None
+        assert stream.uniform(-1) is None
+        assert stream.integers(10, 6, 1) is None
+        assert stream.integers(10, 0, 1 << 64) is None
+        assert stream.normal(10, std=-1.0) is None
+
+    def test_spawned_streams_are_independent_and_reproducible(self):
+        workers = spawn_streams(3, 4)
+        samples = [w.uniform(1000) for w in workers]
+        assert len({s.tobytes() for s in samples}) == 4
+        again = [w.uniform(1000) for w in RandomStream(3).spawn(4)]
+        assert all(np.array_equal(a, b) for a, b in zip(samples, again))
+        parent = RandomStream(3)
+        parent.spawn(4)
+        assert not np.array_equal(parent.spawn(1)[0].uniform(1000), samples[0])
+
+    def test_checkpoint_restores_position(self, tmp_path):
+        stream = RandomStream(11)
+        stream.uniform(1234)
+        stream.spawn(2)
+        state = json.loads(json.dumps(stream.get_state()))
+        path = str(tmp_path / "stream.json")
+        stream.save(path)
+        expected = stream.normal(500)
+        expected_child = stream.spawn(1)[0].uniform(5)
+        restored = RandomStream.from_state(state)
+        assert np.array_equal(restored.normal(500), expected)
+        assert np.array_equal(restored.spawn(1)[0].uniform(5), expected_child)
+        assert np.array_equal(RandomStream.load(path).normal(500), expected)
+        stream.set_state(state)
+        assert np.array_equal(stream.normal(500), expected)
+
+
+class TestScientificRandomStreams:
+    def test_operations(self):
+        stream = ScientificOperations.random_stream(5)
+        assert np.array_equal(stream.uniform(3), RandomStream(5).uniform(3))
+        assert len(ScientificOperations.spawn_random_streams(5, 3)) == 3
+
+    def test_streams_are_not_memoized(self):
+        sci = MemoizedOperations(ScientificOperations)
+        assert sci.random_stream(5) is not sci.random_stream(5)
@@ -0,0 +1,74 @@
+import math
+import pytest
+import sys
+import os
+from concurrent.futures import TimeoutError
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ExpressionError
+from operations.sandbox import SandboxExecutor, ResourceLimitError, estimate_digits, estimate_largest_digits
+
+
+class TestEstimateDigits:
+    def test_small_results(self):
+        assert estimate_digits("2 + 3") < 2
+        assert estimate_digits("sin(x) * 10", x=1e6) <= 309
+
+    def test_large_integer_results(self):
+        assert estimate_digits("2^1000") == pytest.approx(301.03, rel=1e-3)
+        assert estimate_digits("factorial(1000)") == pytest.approx(2567.6, rel=1e-3)
+        assert estimate_digits("factorial(10^7)") > 6e7
+        assert estimate_digits("x^y", x=10, y=5000) == pytest.approx(5000)
+
+    def test_largest_intermediate(self):
+        assert estimate_digits("log(factorial(10^7))") <= 309
+        assert estimate_largest_digits("log(factorial(10^7))") > 6e7
+        assert estimate_largest_digits("factorial(1000) / 1") == pytest.approx(2567.6, rel=1e-3)
+        assert estimate_largest_digits("2 + 3") < 2
+
+
+class TestSandboxExecutor:
+    def setup_method(self):
+        self.executor = SandboxExecutor(workers=1, timeout=0.5)
+
+    def teardown_method(self):
+        self.executor.shutdown()
+
+    def test_inline_evaluation(self):
+        assert self.executor.evaluate("sqrt(x) + 1", x=16) == 5.0
+        assert self.executor.evaluate("1 / 0") is None
+
+    def test_huge_jobs_rejected_up_front(self):
+        with pytest.raises(ResourceLimitError):
+            self.executor.evaluate("factorial(10^7)")
+        assert self.executor.rejected == 1
+
+    def test_large_intermediates_are_rejected(self):
+        for expression in ("factorial(3*10^6)/1", "log(factorial(10^7))"):
+            with pytest.raises(ResourceLimitError):
+                self.executor.evaluate(expression)
+        assert self.executor.rejected == 2
+
+    def test_large_intermediates_never_run_inline(self, monkeypatch):
+        def inline(*args, **kwargs):
+            raise AssertionError("evaluated in the caller")
+        # Workers are separate processes and keep the real compiler.
+        monkeypatch.setattr('operations.sandbox.compile_expression', inline)
+        assert self.executor.evaluate("factorial(1000) / factorial(999)") == 1000
+
+    def test_deep_nesting_is_an_error(self):
+        with pytest.raises(ExpressionError):
+            self.executor.evaluate("-" * 3000 + "1")
+
+    def test_worker_evaluation(self):
+        assert self.executor.evaluate("2^5000 % 7") == pow(2, 5000, 7)
+
+    def test_worker_ignores_unused_variables(self):
+        assert self.executor.evaluate("factorial(x) % 7 + 1", x=5000, y=2) == 1.0
+        assert self.executor.evaluate("ln(factorial(2000))", z=1) == pytest.approx(math.lgamma(2001))
+
+    def test_timeout_kills_worker(self):
+        slow = self.executor.submit("7^900000 % 10 + 7^900001 % 10 + 7^900002 % 10 + 7^900003 % 10")
+        with pytest.raises(TimeoutError):
+            slow.result()
+        assert self.executor.killed == 1
+        assert self.executor.evaluate("2^5000 % 7") == pow(2, 5000, 7)
@@ -0,0 +1,128 @@
+import pytest
+import asyncio
+import json
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cli import EvaluationServer, LatencyTracker
+
+
+async def _exchange(server, requests, unix_path=None):
+    if unix_path:
+        await server.start_unix(unix_path)
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        listener = await server.start_tcp('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for request in requests:
+        line = request if isinstance(request, str) else json.dumps(request)
+        writer.write(line.encode() + b"\n")
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    writer.close()
+    await server.close()
+    return responses
+
+
+class TestLatencyTracker:
+    def test_percentiles(self):
+        tracker = LatencyTracker()
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+        summary = tracker.summary()
+        assert summary['count'] == 100
+        assert summary['p50_ms'] == pytest.approx(50)
+        assert summary['p99_ms'] == pytest.approx(99)
+
+    def test_empty(self):
+        assert LatencyTracker().percentile(50) is None
+
+
+class TestEvaluationServer:
+    def test_requests_and_errors(self):
+        requests = [
+            {'id': 1, 'expr': '2 + 3'},
+            {'id': 2, 'expr': 'x * y', 'vars': {'x': 3, 'y': 4}},
+            {'id': 3, 'expr': '1 / 0'},
+            {'id': 4, 'expr': '2 +'},
+            'not json',
+            {'id': 5},
+            {'id': 6, 'expr': '(1+2j) * 1j'},
+        ]
+        responses = asyncio.run(_exchange(EvaluationServer(), requests))
+        assert responses[0] == {'id': 1, 'result': 5.0}
+        assert responses[1] == {'id': 2, 'result': 12.0}
+        assert responses[2] == {'id': 3, 'result': None}
+        assert 'error' in responses[3] and responses[3]['id'] == 4
+        assert 'error' in responses[4]
+        assert 'error' in responses[5]
+        assert responses[6] == {'id': 6, 'result': [-2.0, 1.0]}
+
+    def test_micro_batches_use_vectorized_path(self):
+        server = EvaluationServer(max_delay=0.05, vector_threshold=4)
+        requests = [{'id': i, 'expr': 'sqrt(x)', 'vars': {'x': i - 1}} for i in range(20)]
+        requests.append({'id': 'stats', 'op': 'stats'})
+        responses = asyncio.run(_exchange(server, requests))
+        assert [r['id'] for r in responses] == list(range(20)) + ['stats']
+        assert responses[0]['result'] is None
+        assert responses[5]['result'] == pytest.approx(2.0)
+        assert server.vectorized_jobs >= 4
+        assert server.batches < 20
+        assert 'p99_ms' in responses[-1]['result']
+        assert server.latency.count == 20
+
+    def test_unix_socket(self, tmp_path):
+        path = str(tmp_path / "calc.sock")
+        responses = asyncio.run(_exchange(EvaluationServer(), [{'expr': 'factorial(4)'}], path))
+        assert responses == [{'result': 24.0}]
+
+    def test_failing_job_does_not_stop_the_server(self):
+        requests = [{'id': 1, 'expr': '-' * 3000 + '1'}, {'id': 2, 'expr': '2 * 3'}]
+        responses = asyncio.run(_exchange(EvaluationServer(), requests))
+        assert 'error' in responses[0]
+        assert responses[1] == {'id': 2, 'result': 6.0}
+
+    def test_unexpected_exception_becomes_error(self, monkeypatch):
+        def broken(*args, **kwargs):
+            raise RuntimeError("boom")
+        monkeypatch.setattr('cli.server.evaluate_batch', broken)
+        server = EvaluationServer(max_delay=0.05, vector_threshold=4)
+        requests = [{'id': i, 'expr': 'x + 1', 'vars': {'x': i}} for i in range(8)]
+        requests.append({'id': 'after', 'expr': '1 + 1'})
+        responses = asyncio.run(_exchange(server, requests))
+        assert all(r['error'] == "boom" for r in responses[:8])
+        assert responses[-1] == {'id': 'after', 'result': 2.0}
+
+    def test_unused_variables_match_vectorized_path(self):
+        server = EvaluationServer(max_delay=0.05, vector_threshold=4)
+        requests = [{'id': i, 'expr': 'x + 1', 'vars': {'x': 1, 'y': 2}} for i in range(6)]
+        vectorized = asyncio.run(_exchange(server, requests))
+        single = asyncio.run(_exchange(EvaluationServer(), requests[:1]))
+        assert single[0]['result'] == 2.0
+        assert all(r['result'] == 2.0 for r in vectorized)
+
+    def test_infinite_results_are_errors(self):
+        requests = [{'id': i, 'expr': 'x * 1e308 * 10', 'vars': {'x': i - 2}} for i in range(6)]
+        single = asyncio.run(_exchange(EvaluationServer(), requests[:1]))
+        vectorized = asyncio.run(_exchange(EvaluationServer(max_delay=0.05, vector_threshold=4), requests))
+        assert 'error' in single[0]
+        assert [r.get('result') for r in vectorized] == [None, None, 0.0, None, None, None]
+        assert sum('error' in r for r in vectorized) == 5
+
+    def test_scalar_and_vectorized_paths_agree(self):
+        requests = [{'id': i, 'expr': 'factorial(n)', 'vars': {'n': n}}
+                    for i, n in enumerate([5.0, 2.5, -1, 6] * 2)]
+        single = asyncio.run(_exchange(EvaluationServer(max_delay=0.05), requests))
+        vectorized = asyncio.run(_exchange(EvaluationServer(max_delay=0.05, vector_threshold=4), requests))
+        assert [r['result'] for r in single] == [120.0, None, None, 720.0] * 2
+        assert single == vectorized
+
+    def test_huge_result_does_not_block_other_clients(self):
+        requests = [{'id': 1, 'expr': '9^9^9'}, {'id': 2, 'expr': 'x^x', 'vars': {'x': 10 ** 6}},
+                    {'id': 3, 'expr': '2 * 3'}]
+        server = EvaluationServer(timeout=0.5)
+        responses = asyncio.run(asyncio.wait_for(_exchange(server, requests), 10))
+        assert 'limit' in responses[0]['error']
+        assert 'error' in responses[1]
+        assert responses[2] == {'id': 3, 'result': 6.0}
@@ -0,0 +1,67 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ScientificOperations, MemoizedOperations
+from operations.primes import SIEVE_LIMIT, is_prime
+from operations.sieve import (count_primes_in_range, iter_prime_segments, nth_prime, odd_base_primes, prime_count,
+                              primes_in_range)
+
+
+class TestSegmentedSieve:
+    @pytest.mark.parametrize("start,stop", [(0, 1000), (0, 2), (2, 3), (3, 3), (1, 10), (10 ** 12, 10 ** 12 + 5000),
+                                            (SIEVE_LIMIT - 500, SIEVE_LIMIT + 500)])
+    def test_matches_is_prime(self, start, stop):
+        expected = [n for n in range(start, stop) if is_prime(n)]
+        assert list(primes_in_range(start, stop, workers=1, segment_size=97)) == expected
+        assert count_primes_in_range(start, stop, workers=1, segment_size=97) == len(expected)
+
+    def test_segments_are_sorted_arrays(self):
+        segments = list(iter_prime_segments(0, 10000, workers=1, segment_size=500))
+        assert len(segments) == 10
+        assert sum(len(s) for s in segments) == 1229
+        assert all(a[-1] < b[0] for a, b in zip(segments, segments[1:]))
+
+    def test_parallel_matches_serial(self):
+        start, stop = 10 ** 10, 10 ** 10 + 200000
+        serial = list(primes_in_range(start, stop, workers=1, segment_size=20000))
+        assert list(primes_in_range(start, stop, workers=2, segment_size=20000)) == serial
+        assert count_primes_in_range(start, stop, workers=2, segment_size=20000) == len(serial)
+
+    def test_base_primes_beyond_small_sieve(self):
+        primes = odd_base_primes(SIEVE_LIMIT + 1000)
+        assert primes[-1] == max(n for n in range(SIEVE_LIMIT, SIEVE_LIMIT + 1001) if is_prime(n))
+        assert len(primes) == prime_count(SIEVE_LIMIT + 1000) - 1
+
+
+class TestPrimeCount:
+    @pytest.mark.parametrize("x,expected", [(-5, 0), (1, 0), (2, 1), (10, 4), (1000, 168), (10 ** 6, 78498),
+                                            (10 ** 8, 5761455), (10 ** 9, 50847534), (10 ** 10, 455052511)])
+    def test_known_values(self, x, expected):
+        assert prime_count(x) == expected
+
+    @pytest.mark.parametrize("x", [SIEVE_LIMIT - 1, SIEVE_LIMIT, SIEVE_LIMIT + 1, 5000011])
+    def test_methods_agree(self, x):
+        assert prime_count(x) == count_primes_in_range(0, x + 1, workers=1)
+
+
+class TestNthPrime:
+    @pytest.mark.parametrize("n,expected", [(1, 2), (5, 11), (6, 13), (100, 541), (10 ** 6, 15485863),
+                                            (10 ** 7, 179424673)])
+    def test_known_values(self, n, expected):
+        assert nth_prime(n, workers=1) == expected
+
+    def test_invalid(self):
+        assert nth_prime(0) is None
+
+
+class TestScientificSieve:
+    def test_operations(self):
+        assert list(ScientificOperations.primes_in_range(10, 30, workers=1)) == [11, 13, 17, 19, 23, 29]
+        assert ScientificOperations.prime_count(100) == 25
+        assert ScientificOperations.nth_prime(25) == 97
+
+    def test_generator_is_not_memoized(self):
+        sci = MemoizedOperations(ScientificOperations)
+        assert list(sci.primes_in_range(0, 10, workers=1)) == list(sci.primes_in_range(0, 10, workers=1))
+        assert 'primes_in_range' not in sci.cache_stats()
@@ -0,0 +1,112 @@
+import pytest
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ExpressionError, ScientificOperations
+from operations.solver import _numeric_derivative, brent, equation_expression, newton, safeguarded_newton, solve, solve_batch
+
+
+class TestScalarSolvers:
+    def test_brent(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return x * x - 2
+        assert brent(f, 0, 2) == pytest.approx(math.sqrt(2), abs=1e-12)
+        assert len(calls) < 20
+        assert brent(f, 2, 3) is None
+
+    def test_brent_endpoint_root(self):
+        assert brent(lambda x: x - 1, 1, 5) == 1
+
+    def test_newton(self):
+        assert newton(lambda x: x * x - 2, lambda x: 2 * x, 1.0) == pytest.approx(math.sqrt(2), abs=1e-15)
+        assert newton(lambda x: x * x + 1, lambda x: 2 * x, 0.0) is None
+
+    def test_safeguarded_newton_stays_in_bracket(self):
+        # Plain Newton from 0.1 overshoots far outside [0, 2] on atan.
+        root = safeguarded_newton(math.atan, lambda x: 1 / (1 + x * x), -1, 2, guess=1.5)
+        assert root == pytest.approx(0, abs=1e-12)
+
+
+class TestSolve:
+    def test_bracket_uses_brent(self):
+        assert solve("cos(x) = x", bracket=(0, 1)) == pytest.approx(0.7390851332151607, abs=1e-12)
+
+    def test_guess_uses_symbolic_derivative(self):
+        assert solve("x^3 - 2*x - 5", guess=2) == pytest.approx(2.0945514815423265, abs=1e-12)
+        assert solve("exp(x) = a", guess=1, variables={'a': 10}) == pytest.approx(math.log(10), abs=1e-12)
+
+    def test_numeric_derivative_fallback(self):
+        f = lambda x: math.atan(x) - 0.5
+        assert newton(f, _numeric_derivative(f), 1.0) == pytest.approx(math.tan(0.5), abs=1e-12)
+
+    def test_bracket_and_guess(self):
+        assert solve("x^2 - 2", bracket=(0, 2), guess=1.9) == pytest.approx(math.sqrt(2), abs=1e-12)
+
+    def test_other_variable(self):
+        assert solve("t^2 = 9", var='t', bracket=(0, 10)) == pytest.approx(3)
+
+    def test_tolerance_stops_early(self):
+        assert solve("x^2 - 2", bracket=(0, 2), tol=1e-3) == pytest.approx(math.sqrt(2), abs=1e-3)
+        assert solve("x^2 - 2", bracket=(0, 2), max_iterations=1) is None
+
+    def test_invalid(self):
+        assert solve("x^2 - 2") is None
+        assert solve("x^2 +", guess=1) is None
+        assert solve("y + 1", guess=1) is None
+        assert solve("x + a", guess=1) is None
+        assert solve("x^2 + 1", bracket=(0, 2)) is None
+        assert solve("ln(x)", bracket=(-1, 2)) is None
+        assert solve("1/x", bracket=(-1, 2)) is None
+        assert solve("1/x", bracket=(-1, 2), guess=1) is None
+
+    def test_equation_expression(self):
+        assert equation_expression("x = 1") == "(x ) - ( 1)"
+        assert equation_expression("x - 1") == "x - 1"
+
+
+class TestSolveBatch:
+    def test_parameterized(self):
+        a = np.linspace(1, 100, 1000)
+        roots = solve_batch("x^2 = a", 'x', 0, 10, {'a': a})
+        np.testing.assert_allclose(roots, np.sqrt(a), atol=1e-11)
+
+    def test_per_element_brackets(self):
+        roots = solve_batch("x^2 - 4", 'x', [-3, 0], [0, 3])
+        np.testing.assert_allclose(roots, [-2, 2])
+
+    def test_no_root_and_endpoints(self):
+        roots = solve_batch("x^2 - a", 'x', 0, 2, {'a': [1, 4, 9, -1, 0]})
+        np.testing.assert_allclose(roots[[0, 1, 4]], [1, 2, 0], atol=1e-11)
+        assert np.isnan(roots[[2, 3]]).all()
+
+    def test_pole_is_not_a_root(self):
+        assert np.isnan(solve_batch("1/x", 'x', -1, 2)).all()
+        assert np.isnan(solve_batch("x / sqrt(x^2 - 1)", 'x', -2, 2)).all()
+
+    def test_masked(self):
+        roots = solve_batch("x - a", 'x', 0, 1, {'a': [0.5, 2]}, masked=True)
+        assert roots.mask.tolist() == [False, True]
+        assert roots[0] == pytest.approx(0.5)
+
+    def test_tolerance(self):
+        roots = solve_batch("x - a", 'x', 0, 1, {'a': [1 / 3]}, tol=1e-3)
+        assert abs(roots[0] - 1 / 3) < 1e-3
+        assert abs(roots[0] - 1 / 3) > 1e-9
+
+    def test_missing_variable(self):
+        with pytest.raises(ExpressionError):
+            solve_batch("x - a", 'x', 0, 1)
+
+
+class TestScientificWrappers:
+    def test_solve(self):
+        assert ScientificOperations.solve("x^2 = 2", bracket=(0, 2)) == pytest.approx(math.sqrt(2))
+
+    def test_solve_batch(self):
+        roots = ScientificOperations.solve_batch("x * k = 1", 'x', 0, 1, {'k': [2, 4]})
+        np.testing.assert_allclose(roots, [0.5, 0.25])
@@ -0,0 +1,190 @@
+import pytest
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.calculator_model import CalculatorModel, CalculatorMode
+from operations import StatisticsOperations
+from operations.statistics import RunningStatistics, TDigest, iter_file_chunks, parse_lines, statistics_from_file
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).lognormal(0, 1, 200000)
+
+
+def _rank_error(values, estimate, q):
+    return abs(np.mean(values < estimate) - q)
+
+
+class TestRunningStatistics:
+    def test_moments_match_numpy(self, data):
+        stats = RunningStatistics().update_array(data)
+        assert stats.count == data.size
+        assert stats.mean == pytest.approx(data.mean(), rel=1e-12)
+        assert stats.variance() == pytest.approx(data.var(ddof=1), rel=1e-12)
+        assert stats.std(sample=False) == pytest.approx(data.std(), rel=1e-12)
+        assert stats.total == pytest.approx(math.fsum(data.tolist()), rel=1e-15)
+        assert (stats.minimum, stats.maximum) == (data.min(), data.max())
+
+    def test_scalar_updates_match_array(self, data):
+        scalar = RunningStatistics()
+        for value in data[:5000].tolist():
+            scalar.update(value)
+        array = RunningStatistics().update_array(data[:5000])
+        assert scalar.mean == pytest.approx(array.mean, rel=1e-12)
+        assert scalar.variance() == pytest.approx(array.variance(), rel=1e-10)
+        assert scalar.median() == pytest.approx(array.median(), rel=1e-2)
+
+    def test_welford_is_stable_with_large_offset(self):
+        values = 1e9 + np.array([4.0, 7.0, 13.0, 16.0])
+        stats = RunningStatistics()
+        for value in values.tolist():
+            stats.update(value)
+        assert stats.variance() == pytest.approx(30.0)
+
+    def test_merge_matches_single_pass(self, data):
+        parts = [RunningStatistics() for _ in range(4)]
+        for i, chunk in enumerate(np.array_split(data, 37)):
+            parts[i % 4].update_array(chunk)
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+        single = RunningStatistics().update_array(data)
+        assert merged.count == single.count
+        assert merged.mean == pytest.approx(single.mean, rel=1e-12)
+        assert merged.variance() == pytest.approx(single.variance(), rel=1e-12)
+        assert merged.total == pytest.approx(single.total, rel=1e-15)
+        for q in (0.01, 0.5, 0.99):
+            assert _rank_error(data, merged.quantile(q), q) < 2e-3
+
+    def test_empty_and_nan(self):
+        stats = RunningStatistics()
+        assert stats.mean is None and stats.variance() is None and stats.median() is None
+        stats.update(float('nan'))
+        stats.update_array([1.0, np.nan])
+        assert stats.count == 1
+        assert stats.variance() is None
+        assert stats.variance(sample=False) == 0
+        assert stats.merge(RunningStatistics()).count == 1
+
+    def test_summary(self, data):
+        summary = RunningStatistics().update_array(data).summary()
+        assert set(summary) == {'count', 'sum', 'mean', 'variance', 'std', 'min', 'max', 'p25', 'p50', 'p75'}
+
+
+class TestTDigest:
+    @pytest.mark.parametrize("q", [0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999])
+    def test_quantiles(self, data, q):
+        digest = TDigest()
+        digest.update_array(data)
+        assert _rank_error(data, digest.quantile(q), q) < 2e-3
+
+    @pytest.mark.parametrize("q", [0.001, 0.999])
+    def test_extreme_tails(self, q):
+        values = np.random.default_rng(1).normal(0, 1, 100000)
+        streamed, batched = TDigest(200), TDigest(200)
+        for value in values:
+            streamed.update(value)
+        batched.update_array(values)
+        for digest in (streamed, batched):
+            assert abs(digest.quantile(q) - np.quantile(values, q)) < 0.015
+            assert _rank_error(values, digest.quantile(q), q) < 0.1 * min(q, 1 - q)
+
+    def test_constant_memory(self, data):
+        digest = TDigest(100)
+        for chunk in np.array_split(data, 20):
+            digest.update_array(chunk)
+        assert len(digest.means) <= 100
+        assert digest.count == data.size
+
+    def test_small_inputs_are_exact(self):
+        digest = TDigest()
+        for value in [3.0, 1.0, 4.0, 2.0]:
+            digest.update(value)
+        assert digest.quantile(0) == 1.0
+        assert digest.quantile(1) == 4.0
+        assert digest.quantile(0.5) == 2.5
+        assert digest.quantile(1.5) is None
+        assert TDigest().quantile(0.5) is None
+
+
+class TestFileStreaming:
+    def test_single_column(self, tmp_path, data):
+        path = tmp_path / "values.txt"
+        path.write_text("value\n" + "\n".join(map(repr, data[:10000].tolist())) + "\n\n")
+        chunks = list(iter_file_chunks(str(path), chunk_size=3000))
+        assert len(chunks) == 4
+        stats = statistics_from_file(str(path), chunk_size=3000)
+        assert stats.count == 10000
+        assert stats.mean == pytest.approx(data[:10000].mean(), rel=1e-12)
+
+    def test_csv_column_and_workers(self, tmp_path, data):
+        path = tmp_path / "values.csv"
+        rows = [f"{i},{value!r}" for i, value in enumerate(data[:20000].tolist())]
+        path.write_text("id,value\n" + "\n".join(rows) + "\n")
+        serial = statistics_from_file(str(path), column=1, delimiter=',', chunk_size=4000)
+        parallel = statistics_from_file(str(path), column=1, delimiter=',', workers=2, chunk_size=4000)
+        assert serial.count == parallel.count == 20000
+        assert parallel.mean == pytest.approx(serial.mean, rel=1e-12)
+        assert parallel.variance() == pytest.approx(serial.variance(), rel=1e-12)
+        assert parallel.median() == pytest.approx(serial.median(), rel=1e-2)
+
+    def test_parse_lines_skips_bad_rows(self):
+        assert parse_lines(["1", "x", "", "2.5\n"]).tolist() == [1.0, 2.5]
+        assert parse_lines(["a;1", "b", "c;3"], column=1, delimiter=';').tolist() == [1.0, 3.0]
+
+
+class TestStatisticsOperations:
+    def test_operations(self):
+        values = [2, 4, 4, 4, 5, 5, 7, 9]
+        assert StatisticsOperations.mean(values) == 5
+        assert StatisticsOperations.variance(values, sample=False) == 4
+        assert StatisticsOperations.std(values, sample=False) == 2
+        assert StatisticsOperations.median([1, 2, 3]) == 2
+        assert StatisticsOperations.quantile([1, 2, 3], 1) == 3
+        assert StatisticsOperations.describe(values)['count'] == 8
+
+    def test_invalid(self, tmp_path):
+        assert StatisticsOperations.mean([]) is None
+        assert StatisticsOperations.describe([]) is None
+        assert StatisticsOperations.describe_file(str(tmp_path / "missing.txt")) is None
+
+    def test_describe_file(self, tmp_path):
+        path = tmp_path / "values.txt"
+        path.write_text("1\n2\n3\n")
+        assert StatisticsOperations.describe_file(str(path))['mean'] == 2
+
+
+class TestStatisticsMode:
+    def test_entry_and_results(self):
+        model = CalculatorModel()
+        model.set_mode(CalculatorMode.STATISTICS)
+        for digit in "246":
+            model.set_display_value(digit)
+            assert model.statistics_add() is not None
+        assert model.statistics_result('mean') == 4
+        assert model.get_display_value() == "4.0"
+        assert model.statistics_result('var') == 4
+        assert model.statistics_result('n') == 3
+        model.statistics_clear()
+        assert model.statistics_result('mean') is None
+
+    def test_load_file(self, tmp_path):
+        path = tmp_path / "values.txt"
+        path.write_text("1\n2\n3\n")
+        model = CalculatorModel()
+        model.set_display_value("10")
+        model.statistics_add()
+        assert model.statistics_load_file(str(path)) == 4
+        assert model.statistics_result('sum') == 16
+        assert model.statistics_load_file(str(tmp_path / "missing.txt")) is None
+
+    def test_arithmetic_still_works(self):
+        model = CalculatorModel()
+        model.set_mode(CalculatorMode.STATISTICS)
+        model.set_display_value("6")
+        model.set_pending_operation('*')
+        model.set_display_value("7")
+        assert model.calculate() == 42
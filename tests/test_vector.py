@@ -0,0 +1,124 @@
+import pytest
+import math
+import sys
+import os
+import numpy as np
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from operations import ScientificOperations, MemoizedOperations
+
+
+def _scalar(function, values, *args):
+    results = []
+    for value in values:
+        try:
+            result = function(float(value), *args)
+        except (ValueError, OverflowError):
+            result = None
+        results.append(np.nan if result is None else result)
+    return np.array(results)
+
+
+class TestVectorTrigonometry:
+    @pytest.mark.parametrize("name", ['sin', 'cos', 'tan'])
+    @pytest.mark.parametrize("degrees", [True, False])
+    def test_forward_matches_scalar(self, name, degrees):
+        angles = np.linspace(-720, 720, 1001)
+        result = getattr(ScientificOperations, f"{name}_array")(angles, degrees)
+        expected = _scalar(getattr(ScientificOperations, name), angles, degrees)
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-15)
+
+    @pytest.mark.parametrize("name", ['asin', 'acos', 'atan'])
+    @pytest.mark.parametrize("degrees", [True, False])
+    def test_inverse_matches_scalar(self, name, degrees):
+        values = np.linspace(-1.5, 1.5, 301)
+        result = getattr(ScientificOperations, f"{name}_array")(values, degrees)
+        expected = _scalar(getattr(ScientificOperations, name), values, degrees)
+        np.testing.assert_allclose(result, expected, rtol=1e-14)
+
+    def test_inverse_domain(self):
+        result = ScientificOperations.asin_array([-2.0, 0.5, 2.0])
+        assert np.isnan(result[0]) and np.isnan(result[2])
+        assert result[1] == pytest.approx(30)
+
+    def test_degree_conversion(self):
+        np.testing.assert_allclose(ScientificOperations.sin_array([0, 30, 90]), [0, 0.5, 1], atol=1e-15)
+        np.testing.assert_allclose(ScientificOperations.sin_array([0, math.pi / 2], degrees=False), [0, 1])
+
+    def test_infinite_angle(self):
+        assert np.isnan(ScientificOperations.tan_array([np.inf])[0])
+
+    def test_input_is_not_modified(self):
+        angles = np.array([30.0, 60.0])
+        ScientificOperations.cos_array(angles)
+        np.testing.assert_array_equal(angles, [30.0, 60.0])
+
+
+class TestVectorExponential:
+    @pytest.mark.parametrize("name", ['sinh', 'cosh', 'tanh', 'exp', 'ln'])
+    def test_matches_scalar(self, name):
+        values = np.linspace(-800, 800, 1601)
+        result = getattr(ScientificOperations, f"{name}_array")(values)
+        expected = _scalar(getattr(ScientificOperations, name), values)
+        np.testing.assert_allclose(result, expected, rtol=1e-14)
+
+    def test_overflow_is_nan(self):
+        assert np.isnan(ScientificOperations.exp_array([1000.0])[0])
+        assert np.isnan(ScientificOperations.cosh_array([-1000.0])[0])
+
+    @pytest.mark.parametrize("base", [10, math.e, 2, 7.5])
+    def test_log_bases(self, base):
+        values = np.array([-1.0, 0.0, 0.5, 1.0, 100.0, 1e300])
+        result = ScientificOperations.log_array(values, base)
+        expected = _scalar(ScientificOperations.log, values, base)
+        np.testing.assert_allclose(result, expected, rtol=1e-14)
+
+    def test_masked(self):
+        result = ScientificOperations.ln_array([-1.0, 1.0, math.e], masked=True)
+        assert isinstance(result, np.ma.MaskedArray)
+        assert result.mask.tolist() == [True, False, False]
+        assert result[2] == pytest.approx(1)
+
+
+class TestVectorGamma:
+    def test_gamma_matches_scalar(self):
+        values = np.concatenate([np.linspace(-30.5, 171.5, 4001), [0.5, 1, 2, 5, 1e-8, -1e-8]])
+        result = ScientificOperations.gamma_array(values)
+        expected = _scalar(ScientificOperations.gamma, values)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_gamma_exact_at_integers(self):
+        values = np.arange(1.0, 172.0)
+        result = ScientificOperations.gamma_array(values)
+        assert result[0] == 1.0 and result[9] == 362880.0
+        assert result.tolist() == [float(math.factorial(n - 1)) for n in range(1, 172)]
+        np.testing.assert_allclose(result, [math.gamma(n) for n in range(1, 172)], rtol=1e-15)
+
+    def test_log_gamma_exact_at_integers(self):
+        values = np.arange(1.0, 172.0)
+        result = ScientificOperations.log_gamma_array(values)
+        assert result[0] == result[1] == 0.0
+        np.testing.assert_allclose(result, [math.lgamma(n) for n in range(1, 172)], rtol=1e-15)
+
+    def test_gamma_domain(self):
+        result = ScientificOperations.gamma_array([0.0, -1.0, -2.0, 172.0, 4.0])
+        assert np.isnan(result[:4]).all()
+        assert result[4] == pytest.approx(6)
+
+    def test_log_gamma_matches_scalar(self):
+        values = np.concatenate([np.linspace(0.001, 1e4, 4001), [0.25, 1, 2, 1e300]])
+        result = ScientificOperations.log_gamma_array(values)
+        expected = _scalar(ScientificOperations.log_gamma, values)
+        np.testing.assert_allclose(result, expected, rtol=1e-11, atol=1e-13)
+
+    def test_log_gamma_domain(self):
+        result = ScientificOperations.log_gamma_array([0.0, -3.5, 3.0])
+        assert np.isnan(result[:2]).all()
+        assert result[2] == pytest.approx(math.log(2))
+
+    def test_scalar_input(self):
+        assert float(ScientificOperations.gamma_array(5.0)) == pytest.approx(24)
+
+    def test_memoized_arrays_bypass_cache(self):
+        memoized = MemoizedOperations(ScientificOperations)
+        np.testing.assert_allclose(memoized.gamma_array(np.array([3.0])), [2.0])
+        assert memoized.cache_stats()['gamma_array'].bypassed == 1
@@ -1,10 +1,12 @@
 from PyQt5.QtWidgets import (QWidget, QGridLayout, QPushButton, QLCDNumber, 
                              QVBoxLayout, QHBoxLayout, QComboBox, QLabel,
                              QLineEdit, QGroupBox, QFormLayout, QSpinBox, 
-                             QDoubleSpinBox, QTextEdit, QRadioButton)
+                             QDoubleSpinBox, QTextEdit, QRadioButton, QFileDialog,
+                             QTableWidget, QTableWidgetItem)
 from PyQt5.QtCore import Qt, pyqtSlot
 from models.calculator_model import CalculatorMode
 from controllers.calculator_controller import CalculatorController
+from views.graph_widget import GraphWidget
 
 
 class CalculatorView(QWidget):
@@ -17,7 +19,7 @@ class CalculatorView(QWidget):
         main_layout = QVBoxLayout(self)
 
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(["Basic", "Scientific", "Finance", "Programming"])
+        self.mode_combo.addItems(["Basic", "Scientific", "Finance", "Programming", "Statistics", "Graphing"])
         self.mode_combo.currentIndexChanged.connect(self.on_mode_changed)
         main_layout.addWidget(self.mode_combo)
 
@@ -46,11 +48,15 @@ class CalculatorView(QWidget):
         self.scientific_widget = self.create_scientific_calculator()
         self.finance_widget = self.create_finance_calculator()
         self.programming_widget = self.create_programming_calculator()
+        self.statistics_widget = self.create_statistics_calculator()
+        self.graphing_widget = self.create_graphing_calculator()
 
         self.stacked_layout.addWidget(self.basic_widget)
         self.stacked_layout.addWidget(self.scientific_widget)
         self.stacked_layout.addWidget(self.finance_widget)
         self.stacked_layout.addWidget(self.programming_widget)
+        self.stacked_layout.addWidget(self.statistics_widget)
+        self.stacked_layout.addWidget(self.graphing_widget)
 
         main_layout.addWidget(self.stacked_widget)
 
@@ -61,24 +67,48 @@ class CalculatorView(QWidget):
         self.scientific_widget.hide()
         self.finance_widget.hide()
         self.programming_widget.hide()
+        self.statistics_widget.hide()
+        self.graphing_widget.hide()
 
     def show_scientific(self):
         self.basic_widget.hide()
         self.scientific_widget.show()
         self.finance_widget.hide()
         self.programming_widget.hide()
+        self.statistics_widget.hide()
+        self.graphing_widget.hide()
 
     def show_finance(self):
         self.basic_widget.hide()
         self.scientific_widget.hide()
         self.finance_widget.show()
         self.programming_widget.hide()
+        self.statistics_widget.hide()
+        self.graphing_widget.hide()
 
     def show_programming(self):
         self.basic_widget.hide()
         self.scientific_widget.hide()
         self.finance_widget.hide()
         self.programming_widget.show()
+        self.statistics_widget.hide()
+        self.graphing_widget.hide()
+
+    def show_statistics(self):
+        self.basic_widget.hide()
+        self.scientific_widget.hide()
+        self.finance_widget.hide()
+        self.programming_widget.hide()
+        self.statistics_widget.show()
+        self.graphing_widget.hide()
+
+    def show_graphing(self):
+        self.basic_widget.hide()
+        self.scientific_widget.hide()
+        self.finance_widget.hide()
+        self.programming_widget.hide()
+        self.statistics_widget.hide()
+        self.graphing_widget.show()
 
     def create_basic_calculator(self) -> QWidget:
         widget = QWidget()
@@ -207,6 +237,27 @@ class CalculatorView(QWidget):
             btn.clicked.connect(lambda checked, t=text: self.on_scientific_button_clicked(t))
             layout.addWidget(btn, row, col)
 
+        solver_group = QGroupBox("Equation Solver")
+        solver_layout = QGridLayout()
+        self.solve_equation = QLineEdit()
+        self.solve_equation.setPlaceholderText("Equation in x, e.g. cos(x) = x")
+        self.solve_equation.returnPressed.connect(self.on_solve_clicked)
+        solver_layout.addWidget(self.solve_equation, 0, 0, 1, 4)
+        self.solve_lower = QLineEdit()
+        self.solve_lower.setPlaceholderText("From")
+        solver_layout.addWidget(self.solve_lower, 1, 0)
+        self.solve_upper = QLineEdit()
+        self.solve_upper.setPlaceholderText("To")
+        solver_layout.addWidget(self.solve_upper, 1, 1)
+        self.solve_guess = QLineEdit()
+        self.solve_guess.setPlaceholderText("Guess")
+        solver_layout.addWidget(self.solve_guess, 1, 2)
+        solve_btn = QPushButton("Solve")
+        solve_btn.clicked.connect(self.on_solve_clicked)
+        solver_layout.addWidget(solve_btn, 1, 3)
+        solver_group.setLayout(solver_layout)
+        layout.addWidget(solver_group, 9, 0, 1, 6)
+
         return widget
 
     def create_finance_calculator(self) -> QWidget:
@@ -226,7 +277,8 @@ class CalculatorView(QWidget):
             "CAGR",
             "Straight Line Depreciation",
             "Double Declining Depreciation",
-            "Tip Calculator"
+            "Tip Calculator",
+            "Amortization Schedule"
         ])
         self.finance_calc_combo.currentIndexChanged.connect(self.on_finance_type_changed)
         calc_type_layout.addWidget(self.finance_calc_combo)
@@ -272,6 +324,11 @@ class CalculatorView(QWidget):
         self.finance_result.setStyleSheet("font-size: 24px; font-weight: bold;")
         layout.addWidget(self.finance_result)
 
+        self.amortization_table = QTableWidget(0, 4)
+        self.amortization_table.setHorizontalHeaderLabels(["Payment", "Interest", "Principal", "Balance"])
+        self.amortization_table.hide()
+        layout.addWidget(self.amortization_table)
+
         layout.addStretch()
 
         self.update_finance_labels()
@@ -339,9 +396,91 @@ class CalculatorView(QWidget):
 
         return widget
 
+    def create_statistics_calculator(self) -> QWidget:
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+
+        data_group = QGroupBox("Data")
+        data_layout = QGridLayout()
+
+        self.stats_input = QLineEdit()
+        self.stats_input.setPlaceholderText("Value")
+        self.stats_input.returnPressed.connect(self.on_statistics_add)
+        data_layout.addWidget(self.stats_input, 0, 0, 1, 2)
+
+        add_btn = QPushButton("Σ+")
+        add_btn.clicked.connect(self.on_statistics_add)
+        data_layout.addWidget(add_btn, 0, 2)
+
+        self.stats_column = QSpinBox()
+        self.stats_column.setRange(-1, 999)
+        self.stats_column.setSpecialValueText("Whole line")
+        self.stats_column.setPrefix("CSV column ")
+        self.stats_column.setValue(-1)
+        data_layout.addWidget(self.stats_column, 1, 0)
+
+        load_btn = QPushButton("Load File...")
+        load_btn.clicked.connect(self.on_statistics_load)
+        data_layout.addWidget(load_btn, 1, 1)
+
+        clear_btn = QPushButton("Clear Data")
+        clear_btn.clicked.connect(self.on_statistics_clear)
+        data_layout.addWidget(clear_btn, 1, 2)
+
+        data_group.setLayout(data_layout)
+        layout.addWidget(data_group)
+
+        results_group = QGroupBox("Results")
+        results_layout = QGridLayout()
+        result_buttons = [
+            ("n", 0, 0), ("Σx", 0, 1), ("Mean", 0, 2), ("σ", 0, 3), ("Var", 0, 4),
+            ("Min", 1, 0), ("Q1", 1, 1), ("Median", 1, 2), ("Q3", 1, 3), ("Max", 1, 4),
+        ]
+        for text, row, col in result_buttons:
+            btn = QPushButton(text)
+            btn.setMinimumHeight(40)
+            btn.clicked.connect(lambda checked, t=text: self.on_statistics_result(t))
+            results_layout.addWidget(btn, row, col)
+        results_group.setLayout(results_layout)
+        layout.addWidget(results_group)
+
+        self.stats_count = QLabel("n = 0")
+        self.stats_count.setStyleSheet("font-size: 18px; font-weight: bold;")
+        layout.addWidget(self.stats_count)
+
+        layout.addStretch()
+        return widget
+
+    def create_graphing_calculator(self) -> QWidget:
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+
+        input_layout = QHBoxLayout()
+        input_layout.addWidget(QLabel("f(x) ="))
+        self.graph_expression = QLineEdit()
+        self.graph_expression.setPlaceholderText("e.g. sin(x) / x")
+        self.graph_expression.returnPressed.connect(self.on_plot_clicked)
+        input_layout.addWidget(self.graph_expression)
+        plot_btn = QPushButton("Plot")
+        plot_btn.clicked.connect(self.on_plot_clicked)
+        input_layout.addWidget(plot_btn)
+        reset_btn = QPushButton("Reset View")
+        reset_btn.clicked.connect(self.on_plot_reset)
+        input_layout.addWidget(reset_btn)
+        layout.addLayout(input_layout)
+
+        self.graph = GraphWidget()
+        layout.addWidget(self.graph)
+
+        hint = QLabel("Drag to pan, scroll to zoom")
+        hint.setStyleSheet("color: #888;")
+        layout.addWidget(hint)
+        return widget
+
     @pyqtSlot(int)
     def on_mode_changed(self, index):
-        modes = [CalculatorMode.BASIC, CalculatorMode.SCIENTIFIC, CalculatorMode.FINANCE, CalculatorMode.PROGRAMMING]
+        modes = [CalculatorMode.BASIC, CalculatorMode.SCIENTIFIC, CalculatorMode.FINANCE, CalculatorMode.PROGRAMMING,
+                 CalculatorMode.STATISTICS, CalculatorMode.GRAPHING]
         self.controller.set_mode(modes[index])
         
         if index == 0:
@@ -352,6 +491,10 @@ class CalculatorView(QWidget):
             self.show_finance()
         elif index == 3:
             self.show_programming()
+        elif index == 4:
+            self.show_statistics()
+        elif index == 5:
+            self.show_graphing()
 
     @pyqtSlot(str)
     def on_basic_button_clicked(self, text):
@@ -408,6 +551,21 @@ class CalculatorView(QWidget):
             else:
                 self.controller.input_digit(text)
 
+    def on_solve_clicked(self):
+        equation = self.solve_equation.text().strip()
+        if not equation:
+            return
+        try:
+            lower, upper, guess = (float(field.text()) if field.text().strip() else None
+                                   for field in (self.solve_lower, self.solve_upper, self.solve_guess))
+        except ValueError:
+            self.controller.error_occurred.emit("Invalid bracket or guess")
+            return
+        if guess is None and (lower is None or upper is None):
+            self.controller.error_occurred.emit("Enter a bracket or a guess")
+            return
+        self.controller.solve_equation(equation, lower, upper, guess)
+
     def update_finance_labels(self):
         calc_type = self.finance_calc_combo.currentText()
         labels = {
@@ -420,6 +578,7 @@ class CalculatorView(QWidget):
             "Straight Line Depreciation": ("Cost:", "Salvage Value:", "Life (years):", ""),
             "Double Declining Depreciation": ("Cost:", "Life (years):", "Period:", ""),
             "Tip Calculator": ("Bill Amount:", "Tip (%):", "Number of People:", ""),
+            "Amortization Schedule": ("Principal:", "Rate (%):", "Years:", "Extra/month:"),
         }
         
         params = labels.get(calc_type, ("Param 1:", "Param 2:", "Param 3:", "Param 4:"))
@@ -430,6 +589,7 @@ class CalculatorView(QWidget):
         self.finance_label4.setText(params[3] if len(params) > 3 else "Param 4:")
         
         self.finance_param4.setVisible(len(params) > 3 and params[3] != "")
+        self.amortization_table.setVisible(calc_type == "Amortization Schedule")
 
     @pyqtSlot(int)
     def on_finance_type_changed(self, index):
@@ -442,6 +602,10 @@ class CalculatorView(QWidget):
         p3 = self.finance_param3.value()
         p4 = self.finance_param4.value()
 
+        if calc_type == "Amortization Schedule":
+            self.show_amortization_schedule(p1, p2, p3, p4)
+            return
+
         calc_map = {
             "Compound Interest": ("compound_interest", {'principal': p1, 'rate': p2, 'time': p3, 'n': int(p4) if p4 else 12}),
             "Present Value": ("present_value", {'future_value': p1, 'rate': p2, 'time': p3}),
@@ -462,6 +626,20 @@ class CalculatorView(QWidget):
         else:
             self.finance_result.setText("Result: Error")
 
+    def show_amortization_schedule(self, principal: float, rate: float, years: float, extra: float):
+        schedule = self.controller.amortization_schedule(principal, rate, years, extra)
+        if schedule is None:
+            self.amortization_table.setRowCount(0)
+            self.finance_result.setText("Result: Error")
+            return
+        columns = [schedule[name].tolist() for name in ('payment', 'interest', 'principal', 'balance')]
+        self.amortization_table.setRowCount(len(columns[0]))
+        self.amortization_table.setVerticalHeaderLabels([str(period) for period in schedule['period'].tolist()])
+        for column, values in enumerate(columns):
+            for row, value in enumerate(values):
+                self.amortization_table.setItem(row, column, QTableWidgetItem(f"{value:.2f}"))
+        self.finance_result.setText(f"Total interest: {sum(columns[1]):.2f}")
+
     @pyqtSlot(int)
     def on_base_changed(self, index):
         bases = [2, 8, 10, 16]
@@ -504,6 +682,50 @@ class CalculatorView(QWidget):
         result = ops.get(text, lambda: 0)()
         self.bitwise_result.setText(f"Result: {result} (0x{result:X})")
 
+    def on_statistics_add(self):
+        text = self.stats_input.text().strip()
+        if text:
+            self.controller.model.set_display_value(text)
+        count = self.controller.statistics_add_value()
+        if count is not None:
+            self.stats_input.clear()
+            self.stats_count.setText(f"n = {count}")
+
+    def on_statistics_load(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Data", "", "Data files (*.txt *.csv *.dat);;All files (*)")
+        if not path:
+            return
+        column = self.stats_column.value()
+        if column < 0:
+            count = self.controller.statistics_load_file(path)
+        else:
+            count = self.controller.statistics_load_file(path, column, ',')
+        if count is not None:
+            self.stats_count.setText(f"n = {count}")
+
+    def on_statistics_clear(self):
+        self.controller.statistics_clear()
+        self.stats_count.setText("n = 0")
+
+    @pyqtSlot(str)
+    def on_statistics_result(self, text):
+        names = {
+            "n": "n", "Σx": "sum", "Mean": "mean", "σ": "std", "Var": "var",
+            "Min": "min", "Q1": "q1", "Median": "median", "Q3": "q3", "Max": "max",
+        }
+        self.controller.statistics_result(names[text])
+
+    def on_plot_clicked(self):
+        expression = self.graph_expression.text().strip()
+        if not expression:
+            return
+        sampler = self.controller.plot_expression(expression)
+        if sampler is not None:
+            self.graph.set_sampler(sampler)
+
+    def on_plot_reset(self):
+        self.graph.set_sampler(self.graph.sampler, (-10.0, 10.0))
+
     def update_display(self, value: str):
         self.display.setText(value)
 
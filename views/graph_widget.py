@@ -0,0 +1,115 @@
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QColor, QPainter, QPainterPath, QPen
+
+from operations.plotting import CurveSampler
+
+
+ZOOM_STEP = 1.25
+
+
+class GraphWidget(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(300)
+        self.sampler: Optional[CurveSampler] = None
+        self.x_range: Tuple[float, float] = (-10.0, 10.0)
+        self.y_range: Tuple[float, float] = (-10.0, 10.0)
+        # The path is rebuilt only when the ranges or the size change;
+        # while dragging the cached path is just translated.
+        self._path: Optional[QPainterPath] = None
+        self._drag_start: Optional[QPointF] = None
+        self._drag_offset = QPointF(0, 0)
+
+    def set_sampler(self, sampler: Optional[CurveSampler], x_range: Optional[Tuple[float, float]] = None):
+        self.sampler = sampler
+        if x_range is not None:
+            self.x_range = x_range
+        if sampler is not None:
+            sampler.sample(self.x_range[0], self.x_range[1], self.width())
+            self.y_range = sampler.y_range()
+        self.invalidate()
+
+    def invalidate(self):
+        self._path = None
+        self.update()
+
+    def _to_pixels(self, x, y):
+        (x0, x1), (y0, y1) = self.x_range, self.y_range
+        return (x - x0) * (self.width() / (x1 - x0)), (y1 - y) * (self.height() / (y1 - y0))
+
+    def _build_path(self) -> QPainterPath:
+        path = QPainterPath()
+        if self.sampler is None:
+            return path
+        x, y = self.sampler.visible(self.x_range[0], self.x_range[1], self.width())
+        px, py = self._to_pixels(x, y)
+        # Keep far off-screen points finite for Qt's fixed-point rasterizer.
+        py = np.clip(py, -10 * self.height(), 11 * self.height())
+        pen_down = False
+        for a, b in zip(px.tolist(), py.tolist()):
+            if math.isnan(b):
+                pen_down = False
+            elif pen_down:
+                path.lineTo(a, b)
+            else:
+                path.moveTo(a, b)
+                pen_down = True
+        return path
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#1e1e1e"))
+        painter.translate(self._drag_offset)
+        painter.setPen(QPen(QColor("#555"), 1))
+        origin_x, origin_y = self._to_pixels(0.0, 0.0)
+        painter.drawLine(QPointF(origin_x, -self.height()), QPointF(origin_x, 2 * self.height()))
+        painter.drawLine(QPointF(-self.width(), origin_y), QPointF(2 * self.width(), origin_y))
+        if self._path is None:
+            self._path = self._build_path()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor("#4fc3f7"), 2))
+        painter.drawPath(self._path)
+        painter.end()
+
+    def resizeEvent(self, event):
+        self.invalidate()
+        super().resizeEvent(event)
+
+    def _shift(self, dx_pixels: float, dy_pixels: float):
+        (x0, x1), (y0, y1) = self.x_range, self.y_range
+        dx = dx_pixels * (x1 - x0) / self.width()
+        dy = dy_pixels * (y1 - y0) / self.height()
+        self.x_range = (x0 - dx, x1 - dx)
+        self.y_range = (y0 + dy, y1 + dy)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_start = event.pos()
+
+    def mouseMoveEvent(self, event):
+        if self._drag_start is not None:
+            self._drag_offset = QPointF(event.pos() - self._drag_start)
+            self.update()
+
+    def mouseReleaseEvent(self, event):
+        if self._drag_start is not None:
+            # Only the strip that came into view is sampled here.
+            self._shift(self._drag_offset.x(), self._drag_offset.y())
+            self._drag_start = None
+            self._drag_offset = QPointF(0, 0)
+            self.invalidate()
+
+    def wheelEvent(self, event):
+        factor = 1 / ZOOM_STEP if event.angleDelta().y() > 0 else ZOOM_STEP
+        (x0, x1), (y0, y1) = self.x_range, self.y_range
+        # Zoom about the point under the cursor.
+        cx = x0 + event.pos().x() / self.width() * (x1 - x0)
+        cy = y1 - event.pos().y() / self.height() * (y1 - y0)
+        self.x_range = (cx + (x0 - cx) * factor, cx + (x1 - cx) * factor)
+        self.y_range = (cy + (y0 - cy) * factor, cy + (y1 - cy) * factor)
+        self.invalidate()
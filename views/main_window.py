@@ -92,3 +92,7 @@ class MainWindow(QMainWindow):
 
     def show_error(self, message: str):
         QMessageBox.warning(self, "Error", message)
+
+    def closeEvent(self, event):
+        self.controller.shutdown()
+        super().closeEvent(event)